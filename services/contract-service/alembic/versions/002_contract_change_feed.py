@@ -0,0 +1,41 @@
+"""Add contract change feed.
+
+Revision ID: 002_change_feed
+Revises: 001_initial
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "002_change_feed"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create contract_changes table (BIGSERIAL seq is the feed cursor)
+    op.create_table(
+        "contract_changes",
+        sa.Column("seq", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("contract_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("contract_name", sa.String(255), nullable=False),
+        sa.Column("change_type", sa.String(50), nullable=False),
+        sa.Column("version", sa.String(50), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("seq"),
+    )
+    op.create_index(
+        "ix_contract_changes_contract_seq",
+        "contract_changes",
+        ["contract_id", "seq"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("contract_changes")
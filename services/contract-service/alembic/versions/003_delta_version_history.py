@@ -0,0 +1,137 @@
+"""Store contract versions as keyframes and JSON Patch deltas.
+
+Revision ID: 003_version_deltas
+Revises: 002_change_feed
+Create Date: 2024-02-15 00:00:00.000000
+
+"""
+import copy
+import json
+import zlib
+from typing import Any, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003_version_deltas"
+down_revision: Union[str, None] = "002_change_feed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """
+    Apply a stored JSON Patch (add, remove and replace only).
+
+    A frozen copy of the application's patch logic at this revision, so the
+    migration keeps doing what it did when it was written.
+    """
+    result = copy.deepcopy(document)
+    for operation in patch:
+        op, path = operation["op"], operation["path"]
+        if path == "":
+            result = copy.deepcopy(operation["value"])
+            continue
+
+        *parents, last = [
+            token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]
+        ]
+        container = result
+        for token in parents:
+            container = container[int(token) if isinstance(container, list) else token]
+
+        if isinstance(container, list):
+            if op == "add":
+                index = len(container) if last == "-" else int(last)
+                container.insert(index, copy.deepcopy(operation["value"]))
+            elif op == "remove":
+                del container[int(last)]
+            else:
+                container[int(last)] = copy.deepcopy(operation["value"])
+        elif op == "remove":
+            del container[last]
+        else:
+            container[last] = copy.deepcopy(operation["value"])
+    return result
+
+
+def upgrade() -> None:
+    # Existing snapshots become keyframes
+    op.alter_column(
+        "contract_versions", "contract_snapshot", new_column_name="payload", nullable=True
+    )
+    op.add_column(
+        "contract_versions", sa.Column("payload_compressed", sa.LargeBinary(), nullable=True)
+    )
+    op.add_column(
+        "contract_versions",
+        sa.Column("is_keyframe", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.add_column("contract_versions", sa.Column("sequence", sa.Integer(), nullable=True))
+
+    # Number existing history per contract in creation order
+    op.execute(
+        """
+        UPDATE contract_versions AS v
+        SET sequence = numbered.sequence
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY contract_id ORDER BY created_at, id
+            ) AS sequence
+            FROM contract_versions
+        ) AS numbered
+        WHERE v.id = numbered.id
+        """
+    )
+    op.alter_column("contract_versions", "sequence", nullable=False)
+    op.alter_column("contract_versions", "is_keyframe", server_default=None)
+    op.create_unique_constraint(
+        "uq_contract_versions_contract_sequence",
+        "contract_versions",
+        ["contract_id", "sequence"],
+    )
+
+
+def downgrade() -> None:
+    # Rebuild full snapshots before dropping the delta columns
+    conn = op.get_bind()
+    versions = sa.table(
+        "contract_versions",
+        sa.column("id", postgresql.UUID(as_uuid=True)),
+        sa.column("contract_id", postgresql.UUID(as_uuid=True)),
+        sa.column("sequence", sa.Integer()),
+        sa.column("is_keyframe", sa.Boolean()),
+        sa.column("payload", postgresql.JSONB()),
+        sa.column("payload_compressed", sa.LargeBinary()),
+    )
+    rows = conn.execute(
+        sa.select(versions).order_by(versions.c.contract_id, versions.c.sequence)
+    ).all()
+
+    keyframes: dict = {}
+    for row in rows:
+        payload = (
+            json.loads(zlib.decompress(row.payload_compressed))
+            if row.payload_compressed is not None
+            else row.payload
+        )
+        if row.is_keyframe:
+            keyframes[row.contract_id] = payload
+            snapshot = payload
+        else:
+            snapshot = _apply_patch(keyframes[row.contract_id], payload)
+        conn.execute(
+            versions.update().where(versions.c.id == row.id).values(payload=snapshot)
+        )
+
+    op.drop_constraint(
+        "uq_contract_versions_contract_sequence", "contract_versions", type_="unique"
+    )
+    op.drop_column("contract_versions", "sequence")
+    op.drop_column("contract_versions", "is_keyframe")
+    op.drop_column("contract_versions", "payload_compressed")
+    op.alter_column(
+        "contract_versions", "payload", new_column_name="contract_snapshot", nullable=False
+    )
@@ -0,0 +1,73 @@
+"""Add latest compliance state table.
+
+Revision ID: 004_compliance_state
+Revises: 003_version_deltas
+Create Date: 2024-03-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004_compliance_state"
+down_revision: Union[str, None] = "003_version_deltas"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "compliance_state",
+        sa.Column("contract_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("check_type", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("previous_status", sa.String(50), nullable=True),
+        sa.Column("streak", sa.Integer(), nullable=False),
+        sa.Column("total_checks", sa.Integer(), nullable=False),
+        sa.Column("failure_count", sa.Integer(), nullable=False),
+        sa.Column("details_summary", postgresql.JSONB(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("last_checked_at", sa.DateTime(), nullable=False),
+        sa.Column("status_changed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["contract_id"], ["contracts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("contract_id", "check_type"),
+    )
+    op.create_index(
+        "ix_compliance_state_status_changed",
+        "compliance_state",
+        ["status", "status_changed_at"],
+    )
+
+    # Seed from history: latest check per (contract, check type). The streak
+    # starts at 1 and status_changed_at at the latest check; both become
+    # exact as soon as the next check for that pair is recorded.
+    op.execute(
+        """
+        INSERT INTO compliance_state (
+            contract_id, check_type, status, previous_status, streak,
+            total_checks, failure_count, details_summary, error_message,
+            last_checked_at, status_changed_at
+        )
+        SELECT DISTINCT ON (c.contract_id, c.check_type)
+            c.contract_id, c.check_type, c.status, NULL, 1,
+            totals.total_checks, totals.failure_count, c.details, c.error_message,
+            c.checked_at, c.checked_at
+        FROM compliance_checks AS c
+        JOIN (
+            SELECT contract_id, check_type,
+                COUNT(*) AS total_checks,
+                COUNT(*) FILTER (WHERE status IN ('fail', 'error')) AS failure_count
+            FROM compliance_checks
+            GROUP BY contract_id, check_type
+        ) AS totals
+            ON totals.contract_id = c.contract_id AND totals.check_type = c.check_type
+        ORDER BY c.contract_id, c.check_type, c.checked_at DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("compliance_state")
@@ -0,0 +1,132 @@
+"""Partition compliance_checks by checked_at and add rollups.
+
+Revision ID: 005_compliance_partitions
+Revises: 004_compliance_state
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from datetime import date, datetime, timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005_compliance_partitions"
+down_revision: Union[str, None] = "004_compliance_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions, created through this many months ahead; the defaults at
+# this revision. Later partitions are created by compliance maintenance.
+PARTITIONS_AHEAD = 3
+
+
+def _next_month(start: date) -> date:
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _month_ranges(first: date, last: date) -> list[tuple[date, date]]:
+    """Monthly partition bounds covering every day from ``first`` to ``last``."""
+    ranges = []
+    start = first.replace(day=1)
+    while start <= last:
+        end = _next_month(start)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _create_checks_table(*constraints: sa.Constraint, **kwargs) -> None:
+    op.create_table(
+        "compliance_checks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("contract_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("check_type", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("details", postgresql.JSONB(), nullable=False, server_default="{}"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("checked_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["contract_id"], ["contracts.id"], ondelete="CASCADE"),
+        *constraints,
+        **kwargs,
+    )
+    op.create_index("ix_compliance_checks_checked_at", "compliance_checks", ["checked_at"])
+    op.create_index(
+        "ix_compliance_checks_contract_type_time",
+        "compliance_checks",
+        ["contract_id", "check_type", "checked_at"],
+    )
+
+
+def _rename_checks_table(suffix: str) -> None:
+    """Move the current table and its index names out of the way."""
+    new_name = f"compliance_checks_{suffix}"
+    op.rename_table("compliance_checks", new_name)
+    op.execute(f"ALTER INDEX compliance_checks_pkey RENAME TO {new_name}_pkey")
+    for index in ("checked_at", "contract_type_time"):
+        op.execute(
+            f"ALTER INDEX ix_compliance_checks_{index} RENAME TO ix_{new_name}_{index}"
+        )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    bounds = conn.execute(
+        sa.text("SELECT MIN(checked_at), MAX(checked_at) FROM compliance_checks")
+    ).one()
+
+    _rename_checks_table("legacy")
+    _create_checks_table(
+        sa.PrimaryKeyConstraint("id", "checked_at"),
+        postgresql_partition_by="RANGE (checked_at)",
+    )
+
+    # Partitions covering existing history plus the lookahead
+    today = datetime.utcnow().date()
+    first = bounds[0].date() if bounds[0] else today
+    last = max(bounds[1].date() if bounds[1] else today, today)
+    ranges = _month_ranges(first, last)
+    for _ in range(PARTITIONS_AHEAD):
+        ranges.append((ranges[-1][1], _next_month(ranges[-1][1])))
+    for start, end in ranges:
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS compliance_checks_p{start:%Y%m%d} "
+            f"PARTITION OF compliance_checks "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    op.execute("INSERT INTO compliance_checks SELECT * FROM compliance_checks_legacy")
+    op.drop_table("compliance_checks_legacy")
+
+    op.create_table(
+        "compliance_rollups",
+        sa.Column("granularity", sa.String(10), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("contract_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("check_type", sa.String(100), nullable=False),
+        sa.Column("pass_count", sa.Integer(), nullable=False),
+        sa.Column("warning_count", sa.Integer(), nullable=False),
+        sa.Column("fail_count", sa.Integer(), nullable=False),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("worst_status", sa.String(50), nullable=False),
+        sa.ForeignKeyConstraint(["contract_id"], ["contracts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("granularity", "bucket_start", "contract_id", "check_type"),
+    )
+    op.create_index(
+        "ix_compliance_rollups_contract_bucket",
+        "compliance_rollups",
+        ["contract_id", "granularity", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("compliance_rollups")
+
+    _rename_checks_table("partitioned")
+    _create_checks_table(sa.PrimaryKeyConstraint("id"))
+    op.execute("INSERT INTO compliance_checks SELECT * FROM compliance_checks_partitioned")
+    # Dropping the parent drops all of its partitions
+    op.drop_table("compliance_checks_partitioned")
@@ -0,0 +1,55 @@
+"""Add field catalog indexes on contract_fields.
+
+Revision ID: 006_field_catalog_indexes
+Revises: 005_compliance_partitions
+Create Date: 2024-03-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_field_catalog_indexes"
+down_revision: Union[str, None] = "005_compliance_partitions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index("ix_contract_fields_name_id", "contract_fields", ["name", "id"])
+    op.create_index(
+        "ix_contract_fields_name_pattern",
+        "contract_fields",
+        ["name"],
+        postgresql_ops={"name": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_contract_fields_name_trgm",
+        "contract_fields",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_contract_fields_data_type_name",
+        "contract_fields",
+        ["data_type", "name", "id"],
+    )
+    op.create_index(
+        "ix_contract_fields_pii_name",
+        "contract_fields",
+        ["name", "id"],
+        postgresql_where=sa.text("is_pii"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contract_fields_pii_name", table_name="contract_fields")
+    op.drop_index("ix_contract_fields_data_type_name", table_name="contract_fields")
+    op.drop_index("ix_contract_fields_name_trgm", table_name="contract_fields")
+    op.drop_index("ix_contract_fields_name_pattern", table_name="contract_fields")
+    op.drop_index("ix_contract_fields_name_id", table_name="contract_fields")
@@ -0,0 +1,51 @@
+"""Add subscriber field usage index table.
+
+Revision ID: 007_subscriber_field_usage
+Revises: 006_field_catalog_indexes
+Create Date: 2024-03-29 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "007_subscriber_field_usage"
+down_revision: Union[str, None] = "006_field_catalog_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "subscriber_field_usage",
+        sa.Column("subscriber_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("field_name", sa.String(255), nullable=False),
+        sa.Column("contract_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(["subscriber_id"], ["subscribers.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["contract_id"], ["contracts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("subscriber_id", "field_name"),
+    )
+    op.create_index(
+        "ix_subscriber_field_usage_contract_field",
+        "subscriber_field_usage",
+        ["contract_id", "field_name"],
+    )
+
+    # Backfill from the JSONB lists
+    op.execute(
+        """
+        INSERT INTO subscriber_field_usage (subscriber_id, field_name, contract_id)
+        SELECT DISTINCT s.id, f.name, s.contract_id
+        FROM subscribers s
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(s.fields_used) = 'array' THEN s.fields_used ELSE '[]' END
+        ) AS f(name)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("subscriber_field_usage")
@@ -0,0 +1,30 @@
+"""Add GIN index on contract tags.
+
+Revision ID: 008_contract_tags_gin
+Revises: 007_subscriber_field_usage
+Create Date: 2024-04-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_contract_tags_gin"
+down_revision: Union[str, None] = "007_subscriber_field_usage"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_contracts_tags",
+        "contracts",
+        ["tags"],
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contracts_tags", table_name="contracts")
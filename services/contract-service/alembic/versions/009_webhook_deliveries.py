@@ -0,0 +1,53 @@
+"""Add webhook delivery queue table.
+
+Revision ID: 009_webhook_deliveries
+Revises: 008_contract_tags_gin
+Create Date: 2024-04-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "009_webhook_deliveries"
+down_revision: Union[str, None] = "008_contract_tags_gin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_deliveries",
+        sa.Column("delivery_id", sa.String(100), nullable=False),
+        sa.Column("event", sa.String(100), nullable=False),
+        sa.Column("action", sa.String(100), nullable=True),
+        sa.Column("coalesce_key", sa.String(500), nullable=True),
+        sa.Column("head_sha", sa.String(64), nullable=True),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("delivery_id"),
+    )
+    op.create_index(
+        "ix_webhook_deliveries_status_next_attempt",
+        "webhook_deliveries",
+        ["status", "next_attempt_at"],
+    )
+    op.create_index(
+        "ix_webhook_deliveries_coalesce_status",
+        "webhook_deliveries",
+        ["coalesce_key", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("webhook_deliveries")
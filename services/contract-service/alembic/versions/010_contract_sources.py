@@ -0,0 +1,41 @@
+"""Add contract source and repository sync tables for backfills.
+
+Revision ID: 010_contract_sources
+Revises: 009_webhook_deliveries
+Create Date: 2024-04-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_contract_sources"
+down_revision: Union[str, None] = "009_webhook_deliveries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contract_sources",
+        sa.Column("repository", sa.String(500), nullable=False),
+        sa.Column("path", sa.String(1000), nullable=False),
+        sa.Column("blob_sha", sa.String(64), nullable=False),
+        sa.Column("contract_name", sa.String(255), nullable=True),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("repository", "path"),
+    )
+    op.create_table(
+        "repository_syncs",
+        sa.Column("repository", sa.String(500), nullable=False),
+        sa.Column("revision", sa.String(64), nullable=False),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("repository"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("repository_syncs")
+    op.drop_table("contract_sources")
@@ -0,0 +1,29 @@
+"""Add a default partition to compliance_checks.
+
+Revision ID: 012_compliance_default
+Revises: 011_idempotency_keys
+Create Date: 2024-05-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_compliance_default"
+down_revision: Union[str, None] = "011_idempotency_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Catches checks no range partition covers yet, instead of failing the insert
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS compliance_checks_default "
+        "PARTITION OF compliance_checks DEFAULT"
+    )
+
+
+def downgrade() -> None:
+    # Rows in the default partition have no range partition to go to
+    op.execute("DROP TABLE IF EXISTS compliance_checks_default")
@@ -2,14 +2,45 @@
 
 from collections.abc import AsyncGenerator
 
+from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from contract_service.database import async_session_maker
+from contract_service.database import is_read_request, replica_router
+from contract_service.services.change_stream import publish_pending_changes
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
-    async with async_session_maker() as session:
+async def get_db(request: Request, response: Response) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a database session.
+
+    Read requests may be served from the replica; writes use the primary and
+    pin the client's subsequent reads to it for a short window.
+    """
+    session_maker = await replica_router.session_maker_for(request)
+    if not is_read_request(request):
+        # Set before yielding: teardown runs after the response is sent
+        replica_router.mark_write(response)
+
+    async with session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+            await publish_pending_changes(session)
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_primary_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a database session on the primary.
+
+    For reads that must not lag behind the primary, such as change feed
+    cursors that are combined with live events published by it.
+    """
+    async with replica_router.primary() as session:
         try:
             yield session
             await session.commit()
@@ -0,0 +1,262 @@
+"""Idempotency-Key support for write requests."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from contract_service.config import settings
+from contract_service.database import async_session_maker
+from contract_service.models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+
+# Set on responses replayed from the store
+REPLAYED_HEADER = "idempotent-replayed"
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+MAX_KEY_LENGTH = 255
+
+# How often expired keys are deleted
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def storage_key(scope: Scope, key: str) -> str:
+    """
+    Store key for an ``Idempotency-Key`` header value.
+
+    Scoped to the method, path and caller credentials, so unrelated clients
+    or endpoints that happen to pick the same key never share a response.
+    """
+    digest = hashlib.sha256()
+    caller = Headers(scope=scope).get("authorization", "")
+    for part in (scope["method"], scope["path"], caller, key):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def request_hash(scope: Scope, body: bytes) -> str:
+    """Fingerprint of a request, to tell a retry from reuse of its key."""
+    digest = hashlib.sha256()
+    for part in (scope["method"], scope["path"], scope.get("query_string", b"").decode()):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """Idempotency keys and their stored responses, in the primary database."""
+
+    def __init__(self, session_maker: async_sessionmaker | None = None):
+        self.session_maker = session_maker or async_session_maker
+        self._pruned_at = 0.0
+
+    async def reserve(self, key: str, fingerprint: str) -> IdempotencyKey | None:
+        """
+        Reserve ``key`` for a request about to run.
+
+        Returns ``None`` if the key was reserved, otherwise the existing
+        record. Expired keys, and reservations whose request did not finish
+        within the lock timeout, are taken over.
+        """
+        now = datetime.utcnow()
+        values = {
+            "key": key,
+            "request_hash": fingerprint,
+            "status_code": None,
+            "content_type": None,
+            "body": None,
+            "created_at": now,
+            "locked_until": now + timedelta(seconds=settings.idempotency_lock_timeout_seconds),
+            "expires_at": now + timedelta(hours=settings.idempotency_key_ttl_hours),
+        }
+        async with self.session_maker() as session:
+            insert = (
+                sqlite_insert(IdempotencyKey)
+                if session.get_bind().dialect.name == "sqlite"
+                else pg_insert(IdempotencyKey)
+            )
+            stmt = insert.values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["key"],
+                set_={k: stmt.excluded[k] for k in values if k != "key"},
+                where=or_(
+                    IdempotencyKey.expires_at <= now,
+                    and_(
+                        IdempotencyKey.status_code.is_(None),
+                        IdempotencyKey.locked_until <= now,
+                    ),
+                ),
+            ).returning(IdempotencyKey.key)
+            reserved = await session.scalar(stmt)
+            await session.commit()
+            if reserved is not None:
+                return None
+            return await session.get(IdempotencyKey, key)
+
+    async def complete(
+        self, key: str, status_code: int, content_type: str | None, body: bytes
+    ) -> None:
+        """Store the response of the request holding ``key``."""
+        async with self.session_maker() as session:
+            await session.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.key == key)
+                .values(status_code=status_code, content_type=content_type, body=body)
+            )
+            await session.commit()
+
+    async def release(self, key: str) -> None:
+        """Drop the reservation of a request that failed, so it can be retried."""
+        async with self.session_maker() as session:
+            await session.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+                )
+            )
+            await session.commit()
+
+    async def prune(self, now: datetime | None = None) -> int:
+        """Delete expired keys."""
+        now = now or datetime.utcnow()
+        async with self.session_maker() as session:
+            result = await session.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    async def prune_periodically(self) -> None:
+        """Prune at most once per interval; called on the request path."""
+        if time.monotonic() - self._pruned_at < PRUNE_INTERVAL_SECONDS:
+            return
+        self._pruned_at = time.monotonic()
+        try:
+            await self.prune()
+        except Exception as e:
+            logger.warning(f"Failed to prune idempotency keys: {e}")
+
+
+idempotency_store = IdempotencyStore()
+
+
+class IdempotencyMiddleware:
+    """
+    Replay the stored response of a write request retried with the same
+    ``Idempotency-Key`` header instead of executing it again.
+
+    The key is scoped to the method, path and caller, and reserved before
+    the request runs. A retry arriving while the
+    first attempt still runs gets a 409, and reusing a key for a different
+    request a 422. Responses below 500 are stored; after a server error the
+    key is released so the retry runs again.
+    """
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore | None = None):
+        self.app = app
+        self.store = store or idempotency_store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        key = Headers(scope=scope).get(IDEMPOTENCY_HEADER)
+        if not key:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {"detail": f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters"},
+                status_code=400,
+            )
+            await response(scope, receive, send)
+            return
+
+        key = storage_key(scope, key)
+        body = await _read_body(receive)
+        fingerprint = request_hash(scope, body)
+
+        await self.store.prune_periodically()
+        existing = await self.store.reserve(key, fingerprint)
+        if existing is not None:
+            await _existing_response(existing, fingerprint)(scope, receive, send)
+            return
+
+        status_code = 500
+        content_type = None
+        chunks: list[bytes] = []
+
+        async def replay_body() -> Message:
+            nonlocal body
+            if body is None:
+                return await receive()
+            message = {"type": "http.request", "body": body, "more_body": False}
+            body = None
+            return message
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code, content_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message.get("headers", [])).get("content-type")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_body, capture)
+        except BaseException:
+            await self.store.release(key)
+            raise
+
+        if status_code < 500:
+            await self.store.complete(key, status_code, content_type, b"".join(chunks))
+        else:
+            await self.store.release(key)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """Read the whole request body."""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+def _existing_response(record: IdempotencyKey, fingerprint: str) -> Any:
+    """Response to a request whose key is already taken."""
+    if record.request_hash != fingerprint:
+        return JSONResponse(
+            {"detail": "Idempotency-Key was already used for a different request"},
+            status_code=422,
+        )
+    if record.status_code is None:
+        return JSONResponse(
+            {"detail": "A request with this Idempotency-Key is still in progress"},
+            status_code=409,
+        )
+    return Response(
+        content=record.body,
+        status_code=record.status_code,
+        media_type=record.content_type,
+        headers={REPLAYED_HEADER: "true"},
+    )
@@ -1,5 +1,23 @@
 """API routes for Contract Service."""
 
-from contract_service.api.routes import contracts, fields, subscribers, validation, webhooks
+from contract_service.api.routes import (
+    catalog,
+    changes,
+    compliance,
+    contracts,
+    fields,
+    subscribers,
+    validation,
+    webhooks,
+)
 
-__all__ = ["contracts", "fields", "subscribers", "validation", "webhooks"]
+__all__ = [
+    "catalog",
+    "changes",
+    "compliance",
+    "contracts",
+    "fields",
+    "subscribers",
+    "validation",
+    "webhooks",
+]
@@ -0,0 +1,46 @@
+"""Cross-contract field catalog API routes."""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.api.dependencies import get_db
+from contract_service.config import settings
+from contract_service.schemas.field import FieldCatalogResponse
+from contract_service.services.field_catalog import FieldCatalogCRUD, decode_cursor
+
+router = APIRouter()
+
+
+@router.get("", response_model=FieldCatalogResponse)
+async def list_catalog_fields(
+    name: str | None = Query(None, min_length=1, max_length=255),
+    match: Literal["exact", "prefix", "fuzzy"] = Query(
+        "exact", description="How to match 'name': exact, prefix or trigram similarity"
+    ),
+    data_type: str | None = None,
+    is_pii: bool | None = None,
+    publisher_team: str | None = None,
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=settings.field_catalog_max_limit),
+    db: AsyncSession = Depends(get_db),
+):
+    """List fields across all contracts, ordered by name or, for fuzzy matches, similarity."""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    crud = FieldCatalogCRUD(db)
+    fields, next_cursor = await crud.search(
+        name=name,
+        match=match,
+        data_type=data_type,
+        is_pii=is_pii,
+        publisher_team=publisher_team,
+        cursor=cursor,
+        limit=limit,
+    )
+    return {"fields": fields, "next_cursor": next_cursor}
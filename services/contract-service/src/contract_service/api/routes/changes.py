@@ -0,0 +1,132 @@
+"""Contract change feed API routes."""
+
+import asyncio
+import time
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.api.dependencies import get_primary_db
+from contract_service.config import settings
+from contract_service.database import async_session_maker
+from contract_service.schemas.change import ContractChangeListResponse
+from contract_service.services.change_stream import RESYNC, broadcaster, stream_changes
+from contract_service.services.contract_service import ContractCRUD
+
+router = APIRouter()
+
+
+@router.get("/changes", response_model=ContractChangeListResponse)
+async def list_changes(
+    since: int = Query(0, ge=0, description="Return changes after this cursor"),
+    limit: int = Query(100, ge=1, le=1000),
+    contract_id: UUID | None = Query(None, description="Only changes for this contract"),
+    wait: int = Query(
+        0,
+        ge=0,
+        le=settings.change_feed_max_wait_seconds,
+        description="Seconds to long-poll when no changes are available",
+    ),
+    db: AsyncSession = Depends(get_primary_db),
+):
+    """
+    Get registry changes after a cursor.
+
+    Clients store ``next_cursor`` and pass it back as ``since`` to sync
+    incrementally. With ``wait`` set, the request blocks until at least one
+    change is available or the timeout expires. Always read from the
+    primary, so a cursor never runs ahead of what a lagging replica has.
+    """
+    crud = ContractCRUD(db)
+    deadline = time.monotonic() + wait
+
+    while True:
+        changes, has_more = await crud.get_changes(
+            since=since, limit=limit, contract_id=contract_id
+        )
+        if changes or time.monotonic() >= deadline:
+            break
+        # End the read transaction so the connection goes back to the pool
+        # while we wait, and the next poll sees newly committed changes.
+        await db.rollback()
+        await asyncio.sleep(settings.change_feed_poll_interval_seconds)
+
+    return ContractChangeListResponse(
+        changes=changes,
+        next_cursor=changes[-1].seq if changes else since,
+        has_more=has_more,
+    )
+
+
+@router.get("/stream")
+async def stream_contract_changes(
+    request: Request,
+    since: int | None = Query(None, ge=0, description="Replay changes after this cursor"),
+    team: str | None = Query(None, description="Only changes to this publisher team"),
+    tag: str | None = Query(None, description="Only changes to contracts with this tag"),
+    contract_id: UUID | None = Query(None, description="Only changes for this contract"),
+    last_event_id: str | None = Header(None),
+    db: AsyncSession = Depends(get_primary_db),
+):
+    """
+    Stream committed contract changes as server-sent events.
+
+    Each event id is the change feed sequence number, so browsers resume
+    automatically through ``Last-Event-ID``; other clients can pass ``since``.
+    The cursor and replay are read from the primary, like the live events,
+    so no sequence number is skipped while a replica catches up.
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    # Subscribe before replaying so nothing committed in between is lost
+    queue = broadcaster.subscribe()
+
+    replay = []
+    try:
+        if since is None:
+            # Live events only: start after the newest change instead of replaying
+            # the whole history on the first resync
+            since = await ContractCRUD(db).get_latest_change_seq()
+        else:
+            replay = await ContractCRUD(db).get_change_events(
+                since=since, limit=settings.change_stream_replay_limit
+            )
+    except Exception:
+        broadcaster.unsubscribe(queue)
+        raise
+    # Release the connection; the stream can stay open for hours
+    await db.rollback()
+    if len(replay) >= settings.change_stream_replay_limit:
+        # Backlog is larger than one page: catch up once the replay is sent
+        queue.put_nowait(RESYNC)
+
+    async def load_since(cursor: int) -> list[dict]:
+        async with async_session_maker() as session:
+            return await ContractCRUD(session).get_change_events(
+                since=cursor, limit=settings.change_stream_replay_limit
+            )
+
+    async def event_source():
+        try:
+            async for frame in stream_changes(
+                queue,
+                replay=replay,
+                load_since=load_since,
+                is_disconnected=request.is_disconnected,
+                since=since,
+                team=team,
+                tag=tag,
+                contract_id=str(contract_id) if contract_id else None,
+            ):
+                yield frame
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
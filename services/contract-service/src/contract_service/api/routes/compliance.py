@@ -0,0 +1,209 @@
+"""Compliance state, fleet health and history API routes."""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.api.dependencies import get_db
+from contract_service.config import settings
+from contract_service.models import Contract
+from contract_service.schemas.compliance import (
+    ComplianceHistoryResponse,
+    ComplianceStateResponse,
+    ComplianceTrendResponse,
+    FleetHealthResponse,
+)
+from contract_service.services.compliance_service import (
+    BUCKET_SIZES,
+    ComplianceCRUD,
+    decode_cursor,
+    truncate_time,
+)
+
+router = APIRouter()
+
+Bucket = Literal["hour", "day", "week", "month"]
+
+
+def _time_range(
+    since: datetime | None, until: datetime | None, bucket: str
+) -> tuple[datetime, datetime]:
+    """Resolve a trend range to naive UTC and check its bucket count."""
+
+    def naive_utc(value: datetime) -> datetime:
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    # Default to the end of the current hour so repeated requests share an ETag
+    until = (
+        naive_utc(until)
+        if until
+        else truncate_time("hour", datetime.utcnow()) + timedelta(hours=1)
+    )
+    since = (
+        naive_utc(since)
+        if since
+        else until - timedelta(days=settings.compliance_trend_default_days)
+    )
+    if since >= until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'since' must be before 'until'",
+        )
+    if (until - since) / BUCKET_SIZES[bucket] > settings.compliance_trend_max_buckets:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range exceeds {settings.compliance_trend_max_buckets} {bucket} buckets; "
+            "use a coarser bucket",
+        )
+    return since, until
+
+
+def _cacheable(request: Request, model: type, payload: Any) -> Response:
+    """
+    Serialize a response with Cache-Control and a content ETag.
+
+    A matching If-None-Match gets an empty 304, so dashboards polling an
+    unchanged range do not re-download it.
+    """
+    body = json.dumps(
+        jsonable_encoder(model.model_validate(payload)), separators=(",", ":")
+    ).encode()
+    etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {
+        "Cache-Control": f"private, max-age={settings.compliance_history_cache_seconds}",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _require_contract(db: AsyncSession, contract_id: UUID) -> None:
+    if await db.get(Contract, contract_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Contract {contract_id} not found",
+        )
+
+
+@router.get("/compliance/health", response_model=FleetHealthResponse)
+async def get_fleet_health(
+    status_filter: list[str] | None = Query(
+        None, alias="status", description="Statuses to list (default: fail, error)"
+    ),
+    check_type: str | None = None,
+    team: str | None = Query(None, description="Only contracts published by this team"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the current compliance health of all contracts.
+
+    Returns status counts per check and per contract (worst check wins),
+    plus the matching checks ordered by how long they have been in their
+    current status.
+    """
+    crud = ComplianceCRUD(db)
+    return await crud.get_fleet_health(
+        statuses=status_filter,
+        check_type=check_type,
+        team=team,
+        skip=skip,
+        limit=limit,
+    )
+
+
+@router.get("/compliance/trend", response_model=ComplianceTrendResponse)
+async def get_fleet_compliance_trend(
+    request: Request,
+    bucket: Bucket = "day",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    check_type: str | None = None,
+    team: str | None = Query(None, description="Only contracts published by this team"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get compliance status counts, pass rate and MTTR across all contracts per time bucket."""
+    since, until = _time_range(since, until, bucket)
+    crud = ComplianceCRUD(db)
+    trend = await crud.get_trend(
+        bucket, since, until, check_type=check_type, team=team
+    )
+    return _cacheable(request, ComplianceTrendResponse, trend)
+
+
+@router.get(
+    "/{contract_id}/compliance/state", response_model=list[ComplianceStateResponse]
+)
+async def get_compliance_state(
+    contract_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the latest compliance status of each check type for a contract."""
+    await _require_contract(db, contract_id)
+
+    crud = ComplianceCRUD(db)
+    return await crud.get_state(contract_id)
+
+
+@router.get("/{contract_id}/compliance", response_model=ComplianceHistoryResponse)
+async def get_compliance_history(
+    request: Request,
+    contract_id: UUID,
+    check_type: str | None = None,
+    status_filter: str | None = Query(None, alias="status"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get raw compliance checks for a contract, newest first."""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    await _require_contract(db, contract_id)
+
+    crud = ComplianceCRUD(db)
+    checks, next_cursor = await crud.get_history(
+        contract_id,
+        check_type=check_type,
+        status=status_filter,
+        cursor=cursor,
+        limit=limit,
+    )
+    return _cacheable(
+        request,
+        ComplianceHistoryResponse,
+        {"checks": checks, "next_cursor": next_cursor},
+    )
+
+
+@router.get("/{contract_id}/compliance/trend", response_model=ComplianceTrendResponse)
+async def get_compliance_trend(
+    request: Request,
+    contract_id: UUID,
+    bucket: Bucket = "day",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    check_type: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get compliance status counts, pass rate and MTTR for a contract per time bucket."""
+    since, until = _time_range(since, until, bucket)
+    await _require_contract(db, contract_id)
+
+    crud = ComplianceCRUD(db)
+    trend = await crud.get_trend(
+        bucket, since, until, contract_id=contract_id, check_type=check_type
+    )
+    return _cacheable(request, ComplianceTrendResponse, trend)
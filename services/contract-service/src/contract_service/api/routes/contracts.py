@@ -1,22 +1,39 @@
 """Contract CRUD API routes."""
 
+import json
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from contract_service.api.dependencies import get_db
+from contract_service.config import settings
 from contract_service.schemas.contract import (
+    BatchGetRequest,
+    BatchGetResponse,
+    BulkUpsertResponse,
     ContractCreate,
     ContractListResponse,
     ContractResponse,
     ContractUpdate,
+    ContractUpdateResponse,
     ContractVersionResponse,
+    ContractVersionSummary,
+    TagFacetsResponse,
 )
 from contract_service.services.contract_service import ContractCRUD
+from contract_service.utils.yaml_parser import (
+    ContractParseError,
+    parse_contract_yaml_documents,
+    to_contract_payload,
+)
 
 router = APIRouter()
 
+TagMatch = Literal["all", "any"]
+
 
 @router.post("", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
 async def create_contract(
@@ -37,13 +54,140 @@ async def create_contract(
     return await crud.create(contract)
 
 
+@router.post(":bulkUpsert", response_model=BulkUpsertResponse)
+async def bulk_upsert_contracts(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create or replace many contracts in one call.
+
+    Accepts a JSON array of contracts, or multi-document YAML in contract file
+    format when sent with a YAML content type. Every item is validated before
+    anything is written; writes happen in chunks, one transaction each.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+
+    try:
+        if "yaml" in content_type:
+            items = [
+                to_contract_payload(c)
+                for c in parse_contract_yaml_documents(body.decode("utf-8"))
+            ]
+        else:
+            items = json.loads(body)
+    except (ContractParseError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request body: {e}",
+        ) from e
+
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a JSON array of contracts",
+        )
+    if len(items) > settings.bulk_upsert_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.bulk_upsert_max_items} contracts per request",
+        )
+
+    # Validate everything up front so a bad item never leaves a partial import
+    contracts: list[ContractCreate] = []
+    errors = []
+    seen_names: set[str] = set()
+    for index, item in enumerate(items):
+        name = item.get("name") if isinstance(item, dict) else None
+        try:
+            contract = ContractCreate.model_validate(item)
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "name": name,
+                "status": "error",
+                "errors": e.errors(include_url=False, include_context=False),
+            })
+            continue
+        if contract.name in seen_names:
+            errors.append({
+                "index": index,
+                "name": name,
+                "status": "error",
+                "errors": [f"Duplicate contract name '{contract.name}' in request"],
+            })
+            continue
+        seen_names.add(contract.name)
+        contracts.append(contract)
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=errors,
+        )
+
+    crud = ContractCRUD(db)
+    results = await crud.bulk_upsert(contracts, chunk_size=settings.bulk_upsert_chunk_size)
+
+    counts = {"created": 0, "updated": 0, "unchanged": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    return BulkUpsertResponse(
+        results=results,
+        created=counts["created"],
+        updated=counts["updated"],
+        unchanged=counts["unchanged"],
+        failed=counts["error"],
+    )
+
+
+@router.post(":batchGet", response_model=BatchGetResponse)
+async def batch_get_contracts(
+    batch: BatchGetRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get many contracts in one call by ID and/or name.
+
+    Returns a map keyed by each requested ID or name; keys that match no
+    contract are listed in ``not_found``.
+    """
+    ids = list(dict.fromkeys(batch.ids))
+    names = list(dict.fromkeys(batch.names))
+    if len(ids) + len(names) > settings.batch_get_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.batch_get_max_items} ids and names per request",
+        )
+
+    crud = ContractCRUD(db)
+    found = await crud.get_many(ids=ids, names=names)
+    by_id = {contract.id: contract for contract in found}
+    by_name = {contract.name: contract for contract in found}
+
+    contracts: dict[str, ContractResponse] = {}
+    not_found: list[str] = []
+    for key, contract in [(str(i), by_id.get(i)) for i in ids] + [
+        (n, by_name.get(n)) for n in names
+    ]:
+        if contract is None:
+            not_found.append(key)
+        else:
+            contracts[key] = ContractResponse.model_validate(contract)
+
+    return BatchGetResponse(contracts=contracts, not_found=not_found)
+
+
 @router.get("", response_model=ContractListResponse)
 async def list_contracts(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=500),
     status: str | None = Query(None, description="Filter by status (active, deprecated, draft)"),
     publisher_team: str | None = Query(None, description="Filter by publisher team"),
-    tag: str | None = Query(None, description="Filter by tag"),
+    tag: list[str] | None = Query(None, description="Filter by tag; repeat for several"),
+    tag_match: TagMatch = Query("all", description="Require all or any of the tags"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all contracts with optional filtering."""
@@ -54,10 +198,32 @@ async def list_contracts(
         status=status,
         publisher_team=publisher_team,
         tag=tag,
+        tag_match=tag_match,
     )
     return ContractListResponse(contracts=contracts, total=total, skip=skip, limit=limit)
 
 
+@router.get("/tags", response_model=TagFacetsResponse)
+async def get_tag_facets(
+    status: str | None = Query(None, description="Filter by status (active, deprecated, draft)"),
+    publisher_team: str | None = Query(None, description="Filter by publisher team"),
+    tag: list[str] | None = Query(None, description="Only count contracts with these tags"),
+    tag_match: TagMatch = Query("all", description="Require all or any of the tags"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Count contracts per tag."""
+    crud = ContractCRUD(db)
+    tags = await crud.tag_facets(
+        status=status,
+        publisher_team=publisher_team,
+        tag=tag,
+        tag_match=tag_match,
+        limit=limit,
+    )
+    return TagFacetsResponse(tags=tags)
+
+
 @router.get("/{contract_id}", response_model=ContractResponse)
 async def get_contract(
     contract_id: UUID,
@@ -90,21 +256,27 @@ async def get_contract_by_name(
     return contract
 
 
-@router.put("/{contract_id}", response_model=ContractResponse)
+@router.put("/{contract_id}", response_model=ContractUpdateResponse)
 async def update_contract(
     contract_id: UUID,
     contract_update: ContractUpdate,
     db: AsyncSession = Depends(get_db),
 ):
-    """Update a contract. Creates a new version snapshot."""
+    """
+    Update a contract.
+
+    Only rows that differ are written. A new version snapshot is created when
+    anything changed; the response reports the applied change set.
+    """
     crud = ContractCRUD(db)
-    contract = await crud.update(contract_id, contract_update)
+    contract, changes = await crud.update_with_changes(contract_id, contract_update)
     if not contract:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Contract {contract_id} not found",
         )
-    return contract
+    response = ContractResponse.model_validate(contract)
+    return ContractUpdateResponse(**dict(response), changes=changes)
 
 
 @router.delete("/{contract_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -122,12 +294,18 @@ async def deprecate_contract(
         )
 
 
-@router.get("/{contract_id}/versions", response_model=list[ContractVersionResponse])
+@router.get("/{contract_id}/versions", response_model=list[ContractVersionSummary])
 async def get_contract_versions(
     contract_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=settings.version_list_max_limit),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get version history for a contract."""
+    """
+    Get a page of version history for a contract, newest first.
+
+    Snapshots are not included; fetch a single version to reconstruct it.
+    """
     crud = ContractCRUD(db)
 
     # Verify contract exists
@@ -138,5 +316,30 @@ async def get_contract_versions(
             detail=f"Contract {contract_id} not found",
         )
 
-    versions = await crud.get_versions(contract_id)
+    versions = await crud.get_versions(contract_id, skip=skip, limit=limit)
     return versions
+
+
+@router.get(
+    "/{contract_id}/versions/{version_id}", response_model=ContractVersionResponse
+)
+async def get_contract_version(
+    contract_id: UUID,
+    version_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a historical version with its full contract snapshot."""
+    crud = ContractCRUD(db)
+    result = await crud.get_version(contract_id, version_id)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Version {version_id} not found for contract {contract_id}",
+        )
+
+    version, snapshot = result
+    return ContractVersionResponse(
+        **dict(ContractVersionSummary.model_validate(version)),
+        contract_snapshot=snapshot,
+    )
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from contract_service.api.dependencies import get_db
 from contract_service.models import Contract, ContractField
 from contract_service.schemas.field import FieldCreate, FieldResponse, FieldUpdate
+from contract_service.services.contract_service import ContractCRUD
 
 router = APIRouter()
 
@@ -96,6 +97,7 @@ async def add_field(
     )
     db.add(field)
     await db.flush()
+    await ContractCRUD(db).record_change(contract_id, "field_added")
 
     return field
 
@@ -133,6 +135,7 @@ async def update_field(
         field.constraints = [c.model_dump() for c in field_update.constraints]
 
     await db.flush()
+    await ContractCRUD(db).record_change(contract_id, "field_updated")
     return field
 
 
@@ -161,3 +164,4 @@ async def delete_field(
 
     await db.delete(field)
     await db.flush()
+    await ContractCRUD(db).record_change(contract_id, "field_removed")
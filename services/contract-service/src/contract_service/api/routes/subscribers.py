@@ -2,11 +2,16 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from contract_service.api.dependencies import get_db
-from contract_service.schemas.subscriber import SubscriberCreate, SubscriberResponse
+from contract_service.models import Contract
+from contract_service.schemas.subscriber import (
+    FieldImpactResponse,
+    SubscriberCreate,
+    SubscriberResponse,
+)
 from contract_service.services.contract_service import ContractCRUD
 
 router = APIRouter()
@@ -32,6 +37,35 @@ async def list_subscribers(
     return subscribers
 
 
+@router.get("/{contract_id}/impact", response_model=FieldImpactResponse)
+async def get_field_impact(
+    contract_id: UUID,
+    fields: list[str] = Query(..., min_length=1, description="Field names being changed"),
+    db: AsyncSession = Depends(get_db),
+):
+    """List the subscribers and teams that use any of the given fields."""
+    # Verify contract exists without loading its children
+    if await db.get(Contract, contract_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Contract {contract_id} not found",
+        )
+
+    impact = await ContractCRUD(db).get_field_impact(contract_id, fields)
+    return {
+        "contract_id": contract_id,
+        "fields": fields,
+        "subscribers": [
+            {
+                **SubscriberResponse.model_validate(subscriber).model_dump(),
+                "affected_fields": affected_fields,
+            }
+            for subscriber, affected_fields in impact
+        ],
+        "teams": sorted({subscriber.team for subscriber, _ in impact}),
+    }
+
+
 @router.post(
     "/{contract_id}/subscribers",
     response_model=SubscriberResponse,
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from contract_service.api.dependencies import get_db
+from contract_service.schemas.compliance import ComplianceCheckResponse
 from contract_service.services.contract_service import ContractCRUD
 
 router = APIRouter()
@@ -22,19 +23,6 @@ class ComplianceCheckRequest(BaseModel):
     error_message: str | None = None
 
 
-class ComplianceCheckResponse(BaseModel):
-    """Response for a compliance check record."""
-
-    id: UUID
-    contract_id: UUID
-    check_type: str
-    status: str
-    details: dict[str, Any]
-    error_message: str | None
-
-    model_config = {"from_attributes": True}
-
-
 @router.post(
     "/{contract_id}/compliance",
     response_model=ComplianceCheckResponse,
@@ -1,18 +1,30 @@
 """GitHub webhook handler routes."""
 
+import asyncio
 import hashlib
 import hmac
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Header, Request, Depends
+from fastapi import APIRouter, HTTPException, Header, Request, Response, Depends, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from contract_service.config import settings
 from contract_service.api.dependencies import get_db
+from contract_service.models import WebhookDelivery
+from contract_service.schemas.contract import ContractCreate
+from contract_service.schemas.webhook import WebhookDeliveryResponse
+from contract_service.services.contract_backfill import parse_contract_file
 from contract_service.services.github_service import GitHubService
 from contract_service.services.contract_service import ContractCRUD
-from contract_service.utils.yaml_parser import parse_contract_yaml
+from contract_service.services.webhook_queue import WebhookQueue
+from contract_service.utils.cache import LRUCache
+from contract_service.utils.yaml_parser import (
+    ContractParseError,
+    is_contract_file,
+    parse_contract_yaml,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +40,14 @@ SCHEMA_FILE_PATTERNS = [
     "/models/",
 ]
 
-# Contract file patterns
-CONTRACT_FILE_PATTERNS = [
-    "contract.yaml",
-    "contract.yml",
-    "datapact.yaml",
-    "datapact.yml",
-]
+# Pull request actions that trigger a contract check
+PR_ACTIONS = ["opened", "synchronize", "reopened"]
+
+# Branches whose pushes sync contracts to the registry
+SYNC_REFS = ["refs/heads/main", "refs/heads/master"]
+
+# GitHub truncates the commit list of push payloads to this many commits
+PUSH_PAYLOAD_MAX_COMMITS = 20
 
 
 def _verify_signature(payload: bytes, signature: str | None, secret: str) -> bool:
@@ -56,22 +69,49 @@ def _is_schema_file(filename: str) -> bool:
     return any(pattern in filename for pattern in SCHEMA_FILE_PATTERNS)
 
 
-def _is_contract_file(filename: str) -> bool:
-    """Check if file is a contract file."""
-    return any(filename.endswith(pattern) for pattern in CONTRACT_FILE_PATTERNS)
-
-
 def _get_contract_file_path(files: list[dict[str, Any]]) -> str | None:
     """Find contract file path from changed files."""
     for file in files:
-        if _is_contract_file(file["filename"]):
+        if is_contract_file(file["filename"]):
             return file["filename"]
     return None
 
 
+def _triage(event: str | None, payload: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Decide from the payload alone whether an event needs processing.
+
+    Returns the response for events that are ignored, or ``None`` for
+    events to queue.
+    """
+    if event == "pull_request":
+        action = payload.get("action")
+        if action not in PR_ACTIONS:
+            return {"status": "ignored", "action": action}
+        return None
+
+    if event == "push":
+        ref = payload.get("ref", "")
+        if ref not in SYNC_REFS:
+            return {"status": "ignored", "ref": ref}
+        commits = payload.get("commits", [])
+        # Truncated commit lists are resolved by the push handler
+        if len(commits) >= PUSH_PAYLOAD_MAX_COMMITS:
+            return None
+        # Check if contract file was updated in any commit
+        for commit in commits:
+            modified_files = commit.get("modified", []) + commit.get("added", [])
+            if any(is_contract_file(f) for f in modified_files):
+                return None
+        return {"status": "ignored", "reason": "no_contract_changes"}
+
+    return {"status": "ignored", "event": event}
+
+
 @router.post("/github")
 async def handle_github_webhook(
     request: Request,
+    response: Response,
     x_hub_signature_256: str | None = Header(None),
     x_github_event: str | None = Header(None),
     x_github_delivery: str | None = Header(None),
@@ -83,6 +123,10 @@ async def handle_github_webhook(
     Supports:
     - pull_request: Check PRs for schema changes without contract updates
     - push: Sync contract to registry when merged to main
+
+    Relevant deliveries are stored and acknowledged with 202; the checks
+    and syncs run on the webhook workers. Redeliveries of the same
+    delivery ID are dropped.
     """
     body = await request.body()
 
@@ -95,15 +139,39 @@ async def handle_github_webhook(
 
     logger.info(f"Received GitHub webhook: event={x_github_event}, delivery={x_github_delivery}")
 
-    # Route to appropriate handler
-    if x_github_event == "pull_request":
-        return await _handle_pull_request(payload, db)
-    elif x_github_event == "push":
-        return await _handle_push(payload, db)
-    elif x_github_event == "ping":
+    if x_github_event == "ping":
         return {"status": "pong", "zen": payload.get("zen")}
 
-    return {"status": "ignored", "event": x_github_event}
+    ignored = _triage(x_github_event, payload)
+    if ignored:
+        return ignored
+
+    # GitHub always sends a delivery ID; fall back to the body for other senders
+    delivery_id = x_github_delivery or hashlib.sha256(body).hexdigest()
+    if not await webhook_queue.enqueue(db, delivery_id, x_github_event, payload):
+        return {"status": "duplicate", "delivery_id": delivery_id}
+
+    # Commit before waking the workers so they can see the delivery
+    await db.commit()
+    webhook_queue.notify()
+
+    response.status_code = status.HTTP_202_ACCEPTED
+    return {"status": "queued", "delivery_id": delivery_id}
+
+
+@router.get("/github/deliveries/{delivery_id}", response_model=WebhookDeliveryResponse)
+async def get_webhook_delivery(
+    delivery_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the processing status and result of a webhook delivery."""
+    delivery = await db.get(WebhookDelivery, delivery_id)
+    if not delivery:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Delivery {delivery_id} not found",
+        )
+    return delivery
 
 
 async def _handle_pull_request(payload: dict[str, Any], db: AsyncSession) -> dict[str, Any]:
@@ -112,15 +180,15 @@ async def _handle_pull_request(payload: dict[str, Any], db: AsyncSession) -> dic
 
     Checks if schema files are modified without corresponding contract updates.
     Creates GitHub check run or commit status to block or approve the PR.
+
+    Verdicts are cached by head SHA and by the blob SHAs of the PR's schema
+    and contract files. A reopened PR, or a push that did not touch those
+    files, gets the cached verdict posted without fetching or validating
+    the contract again.
     """
-    action = payload.get("action")
     pr = payload.get("pull_request", {})
     repo = payload.get("repository", {})
 
-    # Only process relevant actions
-    if action not in ["opened", "synchronize", "reopened"]:
-        return {"status": "ignored", "action": action}
-
     owner = repo.get("owner", {}).get("login", "")
     repo_name = repo.get("name", "")
     pr_number = pr.get("number")
@@ -131,63 +199,41 @@ async def _handle_pull_request(payload: dict[str, Any], db: AsyncSession) -> dic
         return {"status": "error", "reason": "missing_data"}
 
     github = GitHubService()
+    head_key = f"head:{owner}/{repo_name}:{head_sha}"
 
     try:
-        # Get changed files
-        changed_files = await github.get_pr_files(
-            owner=owner,
-            repo=repo_name,
-            pr_number=pr_number,
-        )
+        verdict = check_results.get(head_key)
+        cached = verdict is not None
+        if verdict is None:
+            # Get changed files
+            changed_files = await github.get_pr_files(
+                owner=owner,
+                repo=repo_name,
+                pr_number=pr_number,
+            )
 
-        # Categorize changed files
-        schema_files = [f for f in changed_files if _is_schema_file(f["filename"])]
-        contract_files = [f for f in changed_files if _is_contract_file(f["filename"])]
+            files_key = f"files:{owner}/{repo_name}:{_relevant_files_digest(changed_files)}"
+            verdict = check_results.get(files_key)
+            cached = verdict is not None
+            if verdict is None:
+                verdict = await _check_pull_request(
+                    github, owner, repo_name, pr, changed_files
+                )
+                check_results.set(files_key, verdict)
+            check_results.set(head_key, verdict)
 
-        # No schema changes - nothing to enforce
-        if not schema_files:
+        if verdict["result"]["status"] == "approved":
             await _create_success_status(
-                github, owner, repo_name, head_sha,
-                "No schema changes detected"
+                github, owner, repo_name, head_sha, verdict["message"]
             )
-            return {"status": "approved", "reason": "no_schema_changes"}
-
-        # Schema changed but no contract update
-        if not contract_files:
+        else:
             await _create_failure_status(
                 github, owner, repo_name, head_sha,
-                schema_files,
-                "Schema changes detected but no contract.yaml update"
+                verdict["schema_files"],
+                verdict["message"],
+                verdict["errors"],
             )
-            return {"status": "blocked", "reason": "missing_contract_update"}
-
-        # Both changed - validate contract matches schema
-        contract_path = _get_contract_file_path(contract_files)
-        if contract_path:
-            validation_result = await _validate_contract_changes(
-                github, owner, repo_name, pr, schema_files, contract_path
-            )
-
-            if validation_result["valid"]:
-                await _create_success_status(
-                    github, owner, repo_name, head_sha,
-                    "Contract update matches schema changes"
-                )
-                return {"status": "approved"}
-            else:
-                await _create_failure_status(
-                    github, owner, repo_name, head_sha,
-                    schema_files,
-                    validation_result.get("message", "Contract validation failed"),
-                    validation_result.get("errors", [])
-                )
-                return {"status": "blocked", "reason": "validation_failed"}
-
-        await _create_success_status(
-            github, owner, repo_name, head_sha,
-            "Contract update found"
-        )
-        return {"status": "approved"}
+        return {**verdict["result"], "cached": cached}
 
     except Exception as e:
         logger.error(f"Error processing PR webhook: {e}")
@@ -202,100 +248,212 @@ async def _handle_pull_request(payload: dict[str, Any], db: AsyncSession) -> dic
             )
         except Exception:
             pass
-        raise HTTPException(status_code=500, detail=str(e))
+        # Re-raised for the queue, which records the cause and retries
+        raise
     finally:
         await github.close()
 
 
+def _relevant_files_digest(changed_files: list[dict[str, Any]]) -> str:
+    """Hash of the schema and contract files of a PR, by path, status and blob SHA."""
+    relevant = sorted(
+        f"{f['filename']} {f.get('status', '')} {f.get('sha', '')}"
+        for f in changed_files
+        if _is_schema_file(f["filename"]) or is_contract_file(f["filename"])
+    )
+    return hashlib.sha256("\n".join(relevant).encode()).hexdigest()
+
+
+async def _check_pull_request(
+    github: GitHubService,
+    owner: str,
+    repo: str,
+    pr: dict[str, Any],
+    changed_files: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Decide the verdict for a PR's changed files.
+
+    Returns the handler result, the status message, and the schema files
+    and errors to report if the PR is blocked.
+    """
+    # Categorize changed files
+    schema_files = [
+        {"filename": f["filename"]} for f in changed_files if _is_schema_file(f["filename"])
+    ]
+    contract_files = [f for f in changed_files if is_contract_file(f["filename"])]
+
+    def verdict(result: dict[str, Any], message: str, errors: list[str] | None = None):
+        return {
+            "result": result,
+            "message": message,
+            "schema_files": schema_files,
+            "errors": errors or [],
+        }
+
+    # No schema changes - nothing to enforce
+    if not schema_files:
+        return verdict(
+            {"status": "approved", "reason": "no_schema_changes"},
+            "No schema changes detected",
+        )
+
+    # Schema changed but no contract update
+    if not contract_files:
+        return verdict(
+            {"status": "blocked", "reason": "missing_contract_update"},
+            "Schema changes detected but no contract.yaml update",
+        )
+
+    # Both changed - validate contract matches schema
+    contract_path = _get_contract_file_path(contract_files)
+    if contract_path:
+        # The blob SHA from the file list lets unchanged contracts skip the fetch
+        contract_sha = next(
+            (f.get("sha") for f in contract_files if f["filename"] == contract_path), None
+        )
+        validation_result = await _validate_contract_changes(
+            github, owner, repo, pr, schema_files, contract_path, contract_sha
+        )
+
+        if validation_result["valid"]:
+            return verdict({"status": "approved"}, "Contract update matches schema changes")
+        return verdict(
+            {"status": "blocked", "reason": "validation_failed"},
+            validation_result.get("message", "Contract validation failed"),
+            validation_result.get("errors", []),
+        )
+
+    return verdict({"status": "approved"}, "Contract update found")
+
+
 async def _handle_push(payload: dict[str, Any], db: AsyncSession) -> dict[str, Any]:
     """
     Handle push events (merged PRs).
 
-    Syncs contract.yaml to the Contract Service registry when pushed to main/master.
+    Syncs every contract file changed by the push to the Contract Service
+    registry when pushed to main/master. Files are fetched concurrently at
+    the pushed commit. New contracts are created and existing ones get only
+    the rows that differ, all without committing, so the queue records the
+    delivery as done in the same transaction. Errors
+    propagate, and the queue retries the delivery.
     """
     ref = payload.get("ref", "")
     repo = payload.get("repository", {})
-    commits = payload.get("commits", [])
-
-    # Only process pushes to main/master
-    if ref not in ["refs/heads/main", "refs/heads/master"]:
-        return {"status": "ignored", "ref": ref}
 
     owner = repo.get("owner", {}).get("login", "")
     repo_name = repo.get("name", "")
-    branch = ref.split("/")[-1]
-
-    # Check if contract file was updated in any commit
-    contract_updated = False
-    for commit in commits:
-        modified_files = commit.get("modified", []) + commit.get("added", [])
-        if any(_is_contract_file(f) for f in modified_files):
-            contract_updated = True
-            break
-
-    if not contract_updated:
-        return {"status": "ignored", "reason": "no_contract_changes"}
+    # Read the pushed commit rather than the branch, which may have moved on
+    commit_ref = payload.get("after") or ref.split("/")[-1]
 
     github = GitHubService()
 
     try:
-        # Find and fetch contract file
-        contract_path = None
-        for pattern in CONTRACT_FILE_PATTERNS:
-            content = await github.get_file_content(
-                owner=owner,
-                repo=repo_name,
-                path=pattern,
-                ref=branch,
-            )
-            if content:
-                contract_path = pattern
-                break
-
-        if not content:
-            logger.warning(f"Contract file not found in {owner}/{repo_name}")
-            return {"status": "skipped", "reason": "contract_not_found"}
-
-        # Parse and sync contract
-        try:
-            contract_data = parse_contract_yaml(content)
-        except Exception as e:
-            logger.error(f"Failed to parse contract YAML: {e}")
-            return {"status": "error", "reason": "invalid_yaml", "error": str(e)}
-
-        # Add repository metadata
-        contract_data["repository_url"] = repo.get("html_url")
-
-        # Sync to database
+        paths = await _changed_contract_paths(github, owner, repo_name, payload)
+        contents = await _fetch_files(github, owner, repo_name, paths, commit_ref)
+
+        contracts: list[ContractCreate] = []
+        sources: dict[str, str] = {}
+        errors = []
+        for path, content in zip(paths, contents, strict=True):
+            if not content:
+                errors.append({"path": path, "error": "not found or empty"})
+                continue
+            try:
+                contract = parse_contract_file(content, repo.get("html_url"))
+            except (ContractParseError, ValidationError) as e:
+                logger.error(f"Failed to parse contract {path}: {e}")
+                errors.append({"path": path, "error": str(e)})
+                continue
+            if contract.name in sources:
+                duplicate_of = sources[contract.name]
+                errors.append({
+                    "path": path,
+                    "error": f"Contract '{contract.name}' is also defined in {duplicate_of}",
+                })
+                continue
+            sources[contract.name] = path
+            contracts.append(contract)
+
+        if not contracts:
+            logger.warning(f"No valid contract files found in {owner}/{repo_name}")
+            return {
+                "status": "skipped",
+                "reason": "contract_not_found",
+                "repository": f"{owner}/{repo_name}",
+                "errors": errors,
+            }
+
+        # Committed by the queue together with the delivery status
         crud = ContractCRUD(db)
-        existing = await crud.get_by_name(contract_data["name"])
-
-        if existing:
-            # Update existing contract
-            from contract_service.schemas.contract import ContractUpdate
-            update_data = ContractUpdate(**contract_data)
-            await crud.update(existing.id, update_data)
-            logger.info(f"Updated contract '{contract_data['name']}' from {owner}/{repo_name}")
-        else:
-            # Create new contract
-            from contract_service.schemas.contract import ContractCreate
-            create_data = ContractCreate(**contract_data)
-            await crud.create(create_data)
-            logger.info(f"Created contract '{contract_data['name']}' from {owner}/{repo_name}")
+        results = await crud.upsert_many(
+            contracts, change_summary=f"Synced from {owner}/{repo_name}@{commit_ref}"
+        )
+        for result in results:
+            logger.info(
+                f"Contract '{result['name']}' {result['status']} from {owner}/{repo_name}"
+            )
 
         return {
             "status": "synced",
-            "contract_name": contract_data["name"],
             "repository": f"{owner}/{repo_name}",
+            "contracts": [
+                {"path": sources[r["name"]], "name": r["name"], "status": r["status"]}
+                for r in results
+            ],
+            "errors": errors,
         }
 
     except Exception as e:
         logger.error(f"Error syncing contract from push: {e}")
-        return {"status": "error", "error": str(e)}
+        raise
     finally:
         await github.close()
 
 
+async def _changed_contract_paths(
+    github: GitHubService, owner: str, repo: str, payload: dict[str, Any]
+) -> list[str]:
+    """
+    Contract files present after the push that any of its commits touched.
+
+    Push payloads list at most 20 commits; for larger pushes the file list
+    comes from comparing the before and after commits instead.
+    """
+    commits = payload.get("commits", [])
+    before, after = payload.get("before"), payload.get("after")
+    if len(commits) >= PUSH_PAYLOAD_MAX_COMMITS and before and after:
+        comparison = await github.compare_commits(owner, repo, before, after)
+        return sorted(
+            f["filename"]
+            for f in comparison.get("files", [])
+            if f.get("status") != "removed" and is_contract_file(f["filename"])
+        )
+
+    # Replay commits in order so a file removed later in the push is dropped
+    paths: set[str] = set()
+    for commit in commits:
+        for path in commit.get("added", []) + commit.get("modified", []):
+            if is_contract_file(path):
+                paths.add(path)
+        for path in commit.get("removed", []):
+            paths.discard(path)
+    return sorted(paths)
+
+
+async def _fetch_files(
+    github: GitHubService, owner: str, repo: str, paths: list[str], ref: str
+) -> list[str | None]:
+    """Fetch file contents concurrently, with bounded parallelism."""
+    semaphore = asyncio.Semaphore(settings.github_fetch_concurrency)
+
+    async def fetch(path: str) -> str | None:
+        async with semaphore:
+            return await github.get_file_content(owner=owner, repo=repo, path=path, ref=ref)
+
+    return await asyncio.gather(*(fetch(path) for path in paths))
+
+
 async def _create_success_status(
     github: GitHubService,
     owner: str,
@@ -388,6 +546,7 @@ async def _validate_contract_changes(
     pr: dict[str, Any],
     schema_files: list[dict[str, Any]],
     contract_path: str,
+    contract_sha: str | None = None,
 ) -> dict[str, Any]:
     """
     Validate that contract changes properly reflect schema changes.
@@ -405,6 +564,7 @@ async def _validate_contract_changes(
         repo=repo,
         path=contract_path,
         ref=head_ref,
+        sha=contract_sha,
     )
 
     if not content:
@@ -464,3 +624,15 @@ def _is_valid_semver(version: str) -> bool:
     import re
     pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$"
     return bool(re.match(pattern, version))
+
+
+# PR check verdicts, by head SHA and by the relevant files' blob SHAs
+check_results = LRUCache(settings.pr_check_cache_max_entries)
+
+# Queued deliveries are processed by these handlers on the webhook workers
+webhook_queue = WebhookQueue(
+    {
+        "pull_request": _handle_pull_request,
+        "push": _handle_push,
+    }
+)
@@ -0,0 +1,67 @@
+"""
+Backfill the registry with every contract file of an organization.
+
+Usage:
+    python -m contract_service.backfill --org my-org
+    python -m contract_service.backfill --path /srv/checkouts
+
+Interrupted runs resume where they stopped; ``--full`` re-syncs every file.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from contract_service.database import async_session_maker
+from contract_service.services.contract_backfill import (
+    BackfillReport,
+    ContractBackfill,
+    ContractSourceReader,
+    GitHubOrgSource,
+    LocalDirectorySource,
+)
+from contract_service.services.github_client import close_shared_clients
+from contract_service.services.github_service import GitHubService
+
+
+async def backfill(source: ContractSourceReader, full: bool = False) -> BackfillReport:
+    """Run a backfill from ``source`` in its own session."""
+    try:
+        async with async_session_maker() as db:
+            return await ContractBackfill(db, source, full=full).run()
+    finally:
+        await close_shared_clients()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--org", help="GitHub organization to scan")
+    group.add_argument("--path", help="Directory of repository checkouts to scan")
+    parser.add_argument("--token", help="GitHub token (defaults to GITHUB_TOKEN)")
+    parser.add_argument(
+        "--include-archived", action="store_true", help="Also scan archived repositories"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Re-sync every file, even if unchanged"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.org:
+        source = GitHubOrgSource(
+            args.org, GitHubService(token=args.token), include_archived=args.include_archived
+        )
+    else:
+        source = LocalDirectorySource(args.path)
+
+    report = asyncio.run(backfill(source, full=args.full))
+    print(json.dumps(report.as_dict(), indent=2))
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,19 @@
 """Database configuration and session management."""
 
+import asyncio
+import logging
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+from starlette.responses import Response
 
 from contract_service.config import settings
+from contract_service.services.change_stream import publish_pending_changes
+
+logger = logging.getLogger(__name__)
 
 # Create async engine
 engine = create_async_engine(
@@ -24,6 +33,145 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Optional read replica
+replica_engine = (
+    create_async_engine(
+        settings.database_replica_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+    )
+    if settings.database_replica_url
+    else None
+)
+replica_session_maker = (
+    async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if replica_engine is not None
+    else None
+)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# POST endpoints that only read, e.g. batch lookups with large request bodies
+READ_ONLY_POST_SUFFIXES = (":batchGet",)
+
+# Cookie carrying the time until which a client reads its own writes from the primary
+PRIMARY_COOKIE = "datapact_read_primary_until"
+
+# Request header letting callers opt out of replica reads for a single request
+CONSISTENCY_HEADER = "x-read-consistency"
+
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def is_read_request(request: Request) -> bool:
+    """Whether a request only reads from the database."""
+    if request.method in READ_METHODS:
+        return True
+    return request.method == "POST" and request.url.path.endswith(READ_ONLY_POST_SUFFIXES)
+
+
+class ReplicaRouter:
+    """
+    Chooses the primary or the read replica for a request.
+
+    Reads go to the replica unless the client wrote within the sticky window,
+    asked for primary consistency, or the replica lags beyond the threshold.
+    Stickiness travels in a short-lived cookie so it holds across workers.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: async_sessionmaker | None = None,
+        sticky_seconds: float | None = None,
+        max_lag_seconds: float | None = None,
+        check_interval_seconds: float | None = None,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.sticky_seconds = (
+            settings.replica_sticky_seconds if sticky_seconds is None else sticky_seconds
+        )
+        self.max_lag_seconds = (
+            settings.replica_max_lag_seconds if max_lag_seconds is None else max_lag_seconds
+        )
+        self.check_interval_seconds = (
+            settings.replica_lag_check_interval_seconds
+            if check_interval_seconds is None
+            else check_interval_seconds
+        )
+        self._lag: float | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def replica_lag(self) -> float | None:
+        """Replication lag in seconds, cached briefly; ``None`` if the replica is unreachable."""
+        if time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return self._lag
+
+        async with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval_seconds:
+                return self._lag
+            try:
+                async with self.replica() as session:
+                    if session.get_bind().dialect.name == "postgresql":
+                        self._lag = float(await session.scalar(REPLICA_LAG_SQL))
+                    else:
+                        self._lag = 0.0
+            except Exception as e:
+                logger.warning(f"Replica lag check failed: {e}")
+                self._lag = None
+            self._checked_at = time.monotonic()
+            return self._lag
+
+    async def session_maker_for(self, request: Request) -> async_sessionmaker:
+        """Pick the session factory for a request."""
+        if self.replica is None or not is_read_request(request):
+            return self.primary
+        if request.headers.get(CONSISTENCY_HEADER, "").lower() == "primary":
+            return self.primary
+        try:
+            if float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time():
+                return self.primary
+        except ValueError:
+            pass
+
+        lag = await self.replica_lag()
+        if lag is None or lag > self.max_lag_seconds:
+            return self.primary
+        return self.replica
+
+    def mark_write(self, response: Response) -> None:
+        """Pin the client's reads to the primary for the sticky window."""
+        if self.replica is None or self.sticky_seconds <= 0:
+            return
+        response.set_cookie(
+            PRIMARY_COOKIE,
+            f"{time.time() + self.sticky_seconds:.3f}",
+            max_age=max(1, round(self.sticky_seconds)),
+            httponly=True,
+            samesite="lax",
+        )
+
+
+replica_router = ReplicaRouter(async_session_maker, replica_session_maker)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session."""
@@ -31,6 +179,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            await publish_pending_changes(session)
         except Exception:
             await session.rollback()
             raise
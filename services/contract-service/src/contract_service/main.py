@@ -1,14 +1,32 @@
 """Main FastAPI application for Contract Service."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
-from contract_service.api.routes import contracts, fields, subscribers, validation, webhooks
+from contract_service.api.idempotency import IdempotencyMiddleware
+from contract_service.api.routes import (
+    catalog,
+    changes,
+    compliance,
+    contracts,
+    fields,
+    subscribers,
+    validation,
+    webhooks,
+)
 from contract_service.config import settings
-from contract_service.database import engine
+from contract_service.database import engine, replica_engine
 from contract_service.models import Base
+from contract_service.services.change_stream import broadcaster
+from contract_service.services.compliance_maintenance import (
+    prepare_partitions,
+    run_maintenance_loop,
+)
+from contract_service.services.github_client import close_shared_clients
 
 
 @asynccontextmanager
@@ -17,10 +35,28 @@ async def lifespan(app: FastAPI):
     # Startup: create tables if in development mode
     if settings.environment == "development":
         async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # Needed by the trigram index on contract field names
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             await conn.run_sync(Base.metadata.create_all)
+
+    maintenance_task = None
+    if settings.compliance_maintenance_enabled:
+        await prepare_partitions()
+        maintenance_task = asyncio.create_task(run_maintenance_loop())
+    webhooks.webhook_queue.start()
     yield
-    # Shutdown: dispose engine
+    # Shutdown: stop background work and dispose engine
+    await webhooks.webhook_queue.stop()
+    await close_shared_clients()
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance_task
+    await broadcaster.stop()
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
 
 
 app = FastAPI(
@@ -30,6 +66,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Replay responses to retried writes carrying an Idempotency-Key
+app.add_middleware(IdempotencyMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +79,18 @@ app.add_middleware(
 )
 
 # Include routers
+# The change feed and fleet-wide compliance routes are registered first so
+# /changes and /compliance are not captured by /{contract_id}
+app.include_router(
+    changes.router,
+    prefix="/api/v1/contracts",
+    tags=["changes"],
+)
+app.include_router(
+    compliance.router,
+    prefix="/api/v1/contracts",
+    tags=["compliance"],
+)
 app.include_router(
     contracts.router,
     prefix="/api/v1/contracts",
@@ -60,6 +111,11 @@ app.include_router(
     prefix="/api/v1/contracts",
     tags=["validation"],
 )
+app.include_router(
+    catalog.router,
+    prefix="/api/v1/fields",
+    tags=["catalog"],
+)
 app.include_router(
     webhooks.router,
     prefix="/api/v1/webhooks",
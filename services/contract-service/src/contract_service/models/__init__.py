@@ -1,21 +1,37 @@
 """SQLAlchemy models for Contract Service."""
 
 from contract_service.models.access import AccessConfig
-from contract_service.models.compliance import ComplianceCheck
+from contract_service.models.compliance import (
+    ComplianceCheck,
+    ComplianceRollup,
+    ComplianceState,
+)
 from contract_service.models.base import Base
+from contract_service.models.change import ContractChange
 from contract_service.models.contract import Contract
 from contract_service.models.field import ContractField
+from contract_service.models.idempotency import IdempotencyKey
 from contract_service.models.quality import QualityMetric
-from contract_service.models.subscriber import Subscriber
+from contract_service.models.source import ContractSource, RepositorySync
+from contract_service.models.subscriber import Subscriber, SubscriberFieldUsage
 from contract_service.models.version import ContractVersion
+from contract_service.models.webhook import WebhookDelivery
 
 __all__ = [
     "AccessConfig",
     "Base",
     "ComplianceCheck",
+    "ComplianceRollup",
+    "ComplianceState",
     "Contract",
+    "ContractChange",
     "ContractField",
+    "ContractSource",
     "ContractVersion",
+    "IdempotencyKey",
     "QualityMetric",
+    "RepositorySync",
     "Subscriber",
+    "SubscriberFieldUsage",
+    "WebhookDelivery",
 ]
@@ -0,0 +1,43 @@
+"""ContractChange model - monotonic log of registry mutations."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from contract_service.models.base import Base
+
+
+class ContractChange(Base):
+    """A single entry in the contract change feed.
+
+    Rows are appended in the same transaction as the mutation they describe,
+    so the feed never reports a change that was rolled back. There is no
+    foreign key to ``contracts`` on purpose: the log is append-only and must
+    outlive the rows it refers to.
+    """
+
+    __tablename__ = "contract_changes"
+
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    contract_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    contract_name: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # created, updated, deprecated, subscriber_added, subscriber_removed,
+    # field_added, field_updated, field_removed
+    change_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    version: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_contract_changes_contract_seq", "contract_id", "seq"),
+    )
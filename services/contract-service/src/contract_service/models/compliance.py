@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,7 +11,14 @@ from contract_service.models.base import Base
 
 
 class ComplianceCheck(Base):
-    """A compliance check result for a contract."""
+    """
+    A compliance check result for a contract.
+
+    On PostgreSQL the table is range-partitioned by ``checked_at``, so the
+    partition key is part of the primary key. Partitions are created and
+    dropped by ``ComplianceMaintenance``; a default partition catches rows
+    no range partition covers yet, so inserts never fail for lack of one.
+    """
 
     __tablename__ = "compliance_checks"
 
@@ -30,7 +37,7 @@ class ComplianceCheck(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     checked_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, default=datetime.utcnow, primary_key=True, index=True
     )
 
     # Relationship
@@ -43,4 +50,86 @@ class ComplianceCheck(Base):
             "check_type",
             "checked_at",
         ),
+        {"postgresql_partition_by": "RANGE (checked_at)"},
+    )
+
+
+# Created with the table, so a create_all schema accepts writes without maintenance
+event.listen(
+    ComplianceCheck.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS compliance_checks_default "
+        "PARTITION OF compliance_checks DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class ComplianceRollup(Base):
+    """
+    Aggregated compliance check counts for one time bucket.
+
+    Hourly rows are built from ``compliance_checks`` and daily rows from the
+    hourly ones, so trends remain available after raw partitions are dropped.
+    """
+
+    __tablename__ = "compliance_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(10), primary_key=True)  # hour, day
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    contract_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("contracts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    check_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    pass_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    warning_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fail_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    worst_status: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_compliance_rollups_contract_bucket",
+            "contract_id",
+            "granularity",
+            "bucket_start",
+        ),
+    )
+
+
+class ComplianceState(Base):
+    """
+    Latest compliance status of one check type for a contract.
+
+    Upserted with every recorded check so current health can be read without
+    scanning ``compliance_checks`` history.
+    """
+
+    __tablename__ = "compliance_state"
+
+    contract_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("contracts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    check_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    previous_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Consecutive checks that reported the current status
+    streak: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    total_checks: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    failure_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    details_summary: Mapped[dict] = mapped_column(JSONB, default=dict)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    last_checked_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status_changed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_compliance_state_status_changed", "status", "status_changed_at"),
     )
@@ -63,4 +63,10 @@ class Contract(Base):
 
     __table_args__ = (
         Index("ix_contracts_publisher_team_status", "publisher_team", "status"),
+        Index(
+            "ix_contracts_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
     )
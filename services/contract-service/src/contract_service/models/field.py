@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -45,4 +45,24 @@ class ContractField(Base):
     __table_args__ = (
         Index("ix_contract_fields_contract_name", "contract_id", "name", unique=True),
         Index("ix_contract_fields_pii", "is_pii"),
+        # Field catalog: keyset order, prefix and trigram name lookups
+        Index("ix_contract_fields_name_id", "name", "id"),
+        Index(
+            "ix_contract_fields_name_pattern",
+            "name",
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_contract_fields_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_contract_fields_data_type_name", "data_type", "name", "id"),
+        Index(
+            "ix_contract_fields_pii_name",
+            "name",
+            "id",
+            postgresql_where=text("is_pii"),
+        ),
     )
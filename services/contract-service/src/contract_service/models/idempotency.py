@@ -0,0 +1,36 @@
+"""IdempotencyKey model - stored responses of idempotent write requests."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from contract_service.models.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    A write request made with an ``Idempotency-Key`` header.
+
+    The key is reserved while the request runs (``status_code`` is null)
+    and then holds the response replayed to retries until it expires.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    # SHA-256 of method, path, caller and the header value
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 of method, path, query and body, to detect reuse of a key
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    locked_until: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (Index("ix_idempotency_keys_expires_at", "expires_at"),)
@@ -0,0 +1,44 @@
+"""Contract source models - where registry contracts were synced from."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from contract_service.models.base import Base
+
+
+class ContractSource(Base):
+    """
+    A contract file in a repository and the blob last synced from it.
+
+    The blob SHA is git's content hash, so a file whose SHA matches the
+    stored one is known to be unchanged without fetching it.
+    """
+
+    __tablename__ = "contract_sources"
+
+    repository: Mapped[str] = mapped_column(String(500), primary_key=True)
+    path: Mapped[str] = mapped_column(String(1000), primary_key=True)
+    blob_sha: Mapped[str] = mapped_column(String(64), nullable=False)
+    contract_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+
+class RepositorySync(Base):
+    """
+    The repository revision a backfill last finished syncing.
+
+    Repositories whose tree is unchanged since are skipped, which is what
+    makes an interrupted backfill cheap to resume.
+    """
+
+    __tablename__ = "repository_syncs"
+
+    repository: Mapped[str] = mapped_column(String(500), primary_key=True)
+    revision: Mapped[str] = mapped_column(String(64), nullable=False)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
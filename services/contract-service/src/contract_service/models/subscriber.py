@@ -39,3 +39,30 @@ class Subscriber(Base):
     __table_args__ = (
         Index("ix_subscribers_contract_team", "contract_id", "team", unique=True),
     )
+
+
+class SubscriberFieldUsage(Base):
+    """
+    One contract field read by a subscriber.
+
+    An inverted index over ``Subscriber.fields_used``, kept in sync on every
+    subscriber write, so impact queries do not scan subscriber JSON.
+    """
+
+    __tablename__ = "subscriber_field_usage"
+
+    subscriber_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("subscribers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    field_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    contract_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("contracts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_subscriber_field_usage_contract_field", "contract_id", "field_name"),
+    )
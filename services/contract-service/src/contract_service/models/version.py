@@ -2,8 +2,19 @@
 
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,7 +22,14 @@ from contract_service.models.base import Base
 
 
 class ContractVersion(Base):
-    """A historical version snapshot of a contract."""
+    """
+    A historical version snapshot of a contract.
+
+    Keyframe rows hold the full snapshot; other rows hold a JSON Patch
+    against the closest earlier keyframe of the same contract. The payload
+    is zlib-compressed into ``payload_compressed`` when compression is on.
+    Payload columns are deferred so listing history never loads them.
+    """
 
     __tablename__ = "contract_versions"
 
@@ -25,7 +43,15 @@ class ContractVersion(Base):
     )
 
     version: Mapped[str] = mapped_column(String(50), nullable=False)
-    contract_snapshot: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Position in the contract's history, starting at 1
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    is_keyframe: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    payload: Mapped[Any | None] = mapped_column(
+        JSONB(none_as_null=True), nullable=True, deferred=True
+    )
+    payload_compressed: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
     change_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     changed_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
@@ -38,4 +64,7 @@ class ContractVersion(Base):
 
     __table_args__ = (
         Index("ix_contract_versions_contract_version", "contract_id", "version"),
+        UniqueConstraint(
+            "contract_id", "sequence", name="uq_contract_versions_contract_sequence"
+        ),
     )
@@ -0,0 +1,48 @@
+"""WebhookDelivery model - queued GitHub webhook deliveries."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from contract_service.models.base import Base
+
+
+class WebhookDelivery(Base):
+    """
+    A GitHub webhook delivery awaiting or finished processing.
+
+    Keyed by the ``X-GitHub-Delivery`` ID, so redeliveries are dropped on
+    insert. Deliveries about the same pull request or branch share a
+    ``coalesce_key``; a newer one supersedes any still pending.
+    """
+
+    __tablename__ = "webhook_deliveries"
+
+    delivery_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    event: Mapped[str] = mapped_column(String(100), nullable=False)
+    action: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    coalesce_key: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    head_sha: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    # pending, processing, done, superseded, failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_deliveries_status_next_attempt", "status", "next_attempt_at"),
+        Index("ix_webhook_deliveries_coalesce_status", "coalesce_key", "status"),
+    )
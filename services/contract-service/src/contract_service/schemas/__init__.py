@@ -1,28 +1,78 @@
 """Pydantic schemas for Contract Service API."""
 
 from contract_service.schemas.access import AccessConfigCreate, AccessConfigResponse
+from contract_service.schemas.change import ContractChangeListResponse, ContractChangeResponse
+from contract_service.schemas.compliance import (
+    ComplianceCheckResponse,
+    ComplianceHistoryResponse,
+    ComplianceStateResponse,
+    ComplianceTrendBucket,
+    ComplianceTrendResponse,
+    FleetHealthEntry,
+    FleetHealthResponse,
+)
 from contract_service.schemas.contract import (
+    BatchGetRequest,
+    BatchGetResponse,
+    BulkUpsertItemResult,
+    BulkUpsertResponse,
+    ContractChangeSet,
     ContractCreate,
     ContractListResponse,
     ContractResponse,
     ContractUpdate,
+    ContractUpdateResponse,
+    TagFacetsResponse,
+)
+from contract_service.schemas.field import (
+    FieldCatalogEntry,
+    FieldCatalogResponse,
+    FieldCreate,
+    FieldResponse,
+    FieldUpdate,
 )
-from contract_service.schemas.field import FieldCreate, FieldResponse, FieldUpdate
 from contract_service.schemas.quality import QualityMetricCreate, QualityMetricResponse
-from contract_service.schemas.subscriber import SubscriberCreate, SubscriberResponse
+from contract_service.schemas.subscriber import (
+    FieldImpactResponse,
+    SubscriberCreate,
+    SubscriberImpact,
+    SubscriberResponse,
+)
+from contract_service.schemas.webhook import WebhookDeliveryResponse
 
 __all__ = [
     "AccessConfigCreate",
     "AccessConfigResponse",
+    "BatchGetRequest",
+    "BatchGetResponse",
+    "BulkUpsertItemResult",
+    "BulkUpsertResponse",
+    "ComplianceCheckResponse",
+    "ComplianceHistoryResponse",
+    "ComplianceStateResponse",
+    "ComplianceTrendBucket",
+    "ComplianceTrendResponse",
+    "ContractChangeListResponse",
+    "ContractChangeResponse",
+    "ContractChangeSet",
     "ContractCreate",
     "ContractListResponse",
     "ContractResponse",
     "ContractUpdate",
+    "ContractUpdateResponse",
+    "FieldCatalogEntry",
+    "FieldCatalogResponse",
     "FieldCreate",
     "FieldResponse",
+    "FieldImpactResponse",
     "FieldUpdate",
+    "FleetHealthEntry",
+    "FleetHealthResponse",
     "QualityMetricCreate",
     "QualityMetricResponse",
     "SubscriberCreate",
+    "SubscriberImpact",
     "SubscriberResponse",
+    "TagFacetsResponse",
+    "WebhookDeliveryResponse",
 ]
@@ -0,0 +1,27 @@
+"""Pydantic schemas for the contract change feed."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ContractChangeResponse(BaseModel):
+    """Schema for a single change feed entry."""
+
+    seq: int
+    contract_id: UUID
+    contract_name: str
+    change_type: str
+    version: str
+    changed_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ContractChangeListResponse(BaseModel):
+    """Schema for a page of the change feed."""
+
+    changes: list[ContractChangeResponse]
+    next_cursor: int
+    has_more: bool
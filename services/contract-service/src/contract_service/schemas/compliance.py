@@ -0,0 +1,91 @@
+"""Pydantic schemas for compliance state and fleet health."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ComplianceStateResponse(BaseModel):
+    """Schema for the latest status of one check type on a contract."""
+
+    contract_id: UUID
+    check_type: str
+    status: str
+    previous_status: str | None
+    streak: int
+    total_checks: int
+    failure_count: int
+    details_summary: dict[str, Any]
+    error_message: str | None
+    last_checked_at: datetime
+    status_changed_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class FleetHealthEntry(ComplianceStateResponse):
+    """Compliance state row annotated with its contract."""
+
+    contract_name: str
+    publisher_team: str
+
+
+class FleetHealthResponse(BaseModel):
+    """Schema for the current compliance health of all contracts."""
+
+    checks_by_status: dict[str, int]
+    contracts_by_status: dict[str, int]
+    entries: list[FleetHealthEntry]
+    total_entries: int
+
+
+class ComplianceCheckResponse(BaseModel):
+    """Schema for a recorded compliance check."""
+
+    id: UUID
+    contract_id: UUID
+    check_type: str
+    status: str
+    details: dict[str, Any]
+    error_message: str | None
+    checked_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ComplianceHistoryResponse(BaseModel):
+    """Schema for a keyset-paginated page of compliance checks."""
+
+    checks: list[ComplianceCheckResponse]
+    next_cursor: str | None
+
+
+class ComplianceTrendBucket(BaseModel):
+    """Status counts for one time bucket."""
+
+    bucket_start: datetime
+    pass_count: int
+    warning_count: int
+    fail_count: int
+    error_count: int
+    total_count: int
+    pass_rate: float | None
+
+
+class ComplianceTrendResponse(BaseModel):
+    """Schema for bucketed compliance history."""
+
+    bucket: str
+    since: datetime
+    until: datetime
+    buckets: list[ComplianceTrendBucket]
+    pass_count: int
+    warning_count: int
+    fail_count: int
+    error_count: int
+    total_count: int
+    pass_rate: float | None
+    incidents: int
+    mttr_seconds: float | None
@@ -1,10 +1,11 @@
 """Pydantic schemas for contracts."""
 
+from collections import Counter
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from contract_service.schemas.access import AccessConfigCreate, AccessConfigResponse
 from contract_service.schemas.field import FieldCreate, FieldResponse
@@ -50,6 +51,17 @@ class ContractCreate(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    @field_validator("subscribers")
+    @classmethod
+    def unique_subscriber_teams(cls, subscribers: list[SubscriberCreate]) -> list[SubscriberCreate]:
+        """A team subscribes to a contract at most once."""
+        duplicates = sorted(
+            team for team, count in Counter(s.team for s in subscribers).items() if count > 1
+        )
+        if duplicates:
+            raise ValueError(f"Duplicate subscriber teams: {', '.join(duplicates)}")
+        return subscribers
+
 
 class ContractUpdate(BaseModel):
     """Schema for updating a contract."""
@@ -106,6 +118,39 @@ class ContractResponse(BaseModel):
     model_config = {"from_attributes": True, "populate_by_name": True}
 
 
+class ContractChangeSet(BaseModel):
+    """What an update actually changed."""
+
+    contract: list[str] = Field(
+        default_factory=list, description="Changed contract-level attributes"
+    )
+    fields_added: list[str] = Field(default_factory=list)
+    fields_removed: list[str] = Field(default_factory=list)
+    fields_modified: list[str] = Field(default_factory=list)
+    quality_metrics_added: int = 0
+    quality_metrics_removed: int = 0
+    access_config: str | None = Field(None, description="created or updated")
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the update was a no-op."""
+        return not (
+            self.contract
+            or self.fields_added
+            or self.fields_removed
+            or self.fields_modified
+            or self.quality_metrics_added
+            or self.quality_metrics_removed
+            or self.access_config
+        )
+
+
+class ContractUpdateResponse(ContractResponse):
+    """Schema for contract update response, including the applied change set."""
+
+    changes: ContractChangeSet
+
+
 class ContractListResponse(BaseModel):
     """Schema for paginated contract list response."""
 
@@ -115,15 +160,62 @@ class ContractListResponse(BaseModel):
     limit: int
 
 
-class ContractVersionResponse(BaseModel):
-    """Schema for contract version history."""
+class TagFacetsResponse(BaseModel):
+    """Schema for tag facet counts, most common tag first."""
+
+    tags: dict[str, int]
+
+
+class ContractVersionSummary(BaseModel):
+    """Schema for an entry in contract version history (without snapshot)."""
 
     id: UUID
     contract_id: UUID
     version: str
-    contract_snapshot: dict[str, Any]
+    sequence: int
+    is_keyframe: bool
     change_summary: str | None
     changed_by: str | None
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ContractVersionResponse(ContractVersionSummary):
+    """Schema for a contract version with its reconstructed snapshot."""
+
+    contract_snapshot: dict[str, Any]
+
+
+class BulkUpsertItemResult(BaseModel):
+    """Outcome of one contract in a bulk upsert."""
+
+    index: int
+    name: str | None = None
+    status: str  # created, updated, unchanged, error
+    id: UUID | None = None
+    errors: list[Any] = Field(default_factory=list)
+
+
+class BulkUpsertResponse(BaseModel):
+    """Schema for bulk upsert response."""
+
+    results: list[BulkUpsertItemResult]
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
+class BatchGetRequest(BaseModel):
+    """Schema for fetching many contracts by ID and/or name."""
+
+    ids: list[UUID] = Field(default_factory=list)
+    names: list[str] = Field(default_factory=list)
+
+
+class BatchGetResponse(BaseModel):
+    """Schema for batch get response, keyed by the requested ID or name."""
+
+    contracts: dict[str, ContractResponse]
+    not_found: list[str] = Field(default_factory=list)
@@ -58,3 +58,17 @@ class FieldResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class FieldCatalogEntry(FieldResponse):
+    """A field in the cross-contract catalog, with its owning contract."""
+
+    contract_name: str
+    publisher_team: str
+
+
+class FieldCatalogResponse(BaseModel):
+    """A page of catalog fields."""
+
+    fields: list[FieldCatalogEntry]
+    next_cursor: str | None = None
@@ -27,3 +27,18 @@ class SubscriberResponse(BaseModel):
     subscribed_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class SubscriberImpact(SubscriberResponse):
+    """A subscriber affected by a change to some of a contract's fields."""
+
+    affected_fields: list[str]
+
+
+class FieldImpactResponse(BaseModel):
+    """Subscribers and teams affected by changing a set of fields."""
+
+    contract_id: UUID
+    fields: list[str]
+    subscribers: list[SubscriberImpact]
+    teams: list[str]
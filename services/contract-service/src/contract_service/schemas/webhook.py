@@ -0,0 +1,24 @@
+"""Pydantic schemas for webhook deliveries."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class WebhookDeliveryResponse(BaseModel):
+    """Schema for a queued webhook delivery and its processing outcome."""
+
+    delivery_id: str
+    event: str
+    action: str | None
+    head_sha: str | None
+    status: str
+    attempts: int
+    result: dict[str, Any] | None
+    error: str | None
+    received_at: datetime
+    started_at: datetime | None
+    completed_at: datetime | None
+
+    model_config = {"from_attributes": True}
@@ -1,6 +1,15 @@
 """Business logic services for Contract Service."""
 
+from contract_service.services.compliance_service import ComplianceCRUD
+from contract_service.services.contract_backfill import ContractBackfill
 from contract_service.services.contract_service import ContractCRUD
+from contract_service.services.field_catalog import FieldCatalogCRUD
 from contract_service.services.github_service import GitHubService
 
-__all__ = ["ContractCRUD", "GitHubService"]
+__all__ = [
+    "ComplianceCRUD",
+    "ContractBackfill",
+    "ContractCRUD",
+    "FieldCatalogCRUD",
+    "GitHubService",
+]
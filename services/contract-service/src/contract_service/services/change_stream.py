@@ -0,0 +1,230 @@
+"""Push delivery of committed contract changes over Redis pub/sub."""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.config import settings
+from contract_service.models import ContractChange
+
+logger = logging.getLogger(__name__)
+
+# Key in ``AsyncSession.info`` where change events wait for the commit
+PENDING_EVENTS_KEY = "pending_change_events"
+
+# Queue sentinel telling a stream to catch up from the database
+RESYNC = None
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    """Get the shared Redis client."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis_client
+
+
+def change_event(
+    change: ContractChange, publisher_team: str | None, tags: list[str] | None
+) -> dict[str, Any]:
+    """Build the wire representation of a change feed entry."""
+    return {
+        "seq": change.seq,
+        "contract_id": str(change.contract_id),
+        "contract_name": change.contract_name,
+        "change_type": change.change_type,
+        "version": change.version,
+        "changed_at": change.changed_at.isoformat(),
+        "publisher_team": publisher_team,
+        "tags": tags or [],
+    }
+
+
+def matches_filters(
+    event: dict[str, Any],
+    team: str | None = None,
+    tag: str | None = None,
+    contract_id: str | None = None,
+) -> bool:
+    """Check whether an event passes a stream's filters."""
+    if team and event.get("publisher_team") != team:
+        return False
+    if tag and tag not in event.get("tags", []):
+        return False
+    if contract_id and event.get("contract_id") != contract_id:
+        return False
+    return True
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """Format an event as a server-sent events frame."""
+    return f"id: {event['seq']}\nevent: {event['change_type']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def publish_pending_changes(session: AsyncSession) -> None:
+    """
+    Publish change events collected during a transaction that just committed.
+
+    Publishing is best effort: the change feed table is the source of truth
+    and stream clients resume from their last cursor after a gap.
+    """
+    events = session.info.pop(PENDING_EVENTS_KEY, None)
+    if not events:
+        return
+
+    try:
+        client = get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(settings.change_stream_channel, json.dumps(event))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(events)} contract change(s): {e}")
+
+
+class ChangeBroadcaster:
+    """
+    Fans out change events from one Redis subscription to local streams.
+
+    Each worker holds a single pub/sub connection; every open stream is just a
+    bounded ``asyncio.Queue``, so thousands of idle clients cost one
+    coroutine each.
+    """
+
+    def __init__(self, queue_size: int | None = None):
+        self.queue_size = queue_size or settings.change_stream_queue_size
+        self._queues: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of currently attached streams."""
+        return len(self._queues)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Attach a new stream, starting the Redis listener if needed."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Detach a stream."""
+        self._queues.discard(queue)
+
+    def dispatch(self, event: dict[str, Any] | None) -> None:
+        """Deliver an event (or a resync marker) to every attached stream."""
+        for queue in list(self._queues):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog and make it catch up from
+                # the database instead of buffering without bound.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def stop(self) -> None:
+        """Stop the Redis listener."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        """Relay messages from the Redis channel, reconnecting on failure."""
+        reconnecting = False
+        while True:
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(settings.change_stream_channel)
+                try:
+                    if reconnecting:
+                        # Anything published while we were away is in the feed table
+                        self.dispatch(RESYNC)
+                        reconnecting = False
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.dispatch(json.loads(message["data"]))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Change stream subscription lost: {e}")
+                reconnecting = True
+                await asyncio.sleep(1.0)
+
+
+broadcaster = ChangeBroadcaster()
+
+
+async def stream_changes(
+    queue: asyncio.Queue,
+    replay: list[dict[str, Any]],
+    load_since: Callable[[int], Awaitable[list[dict[str, Any]]]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    since: int = 0,
+    team: str | None = None,
+    tag: str | None = None,
+    contract_id: str | None = None,
+    heartbeat_seconds: float | None = None,
+) -> AsyncIterator[str]:
+    """
+    Produce SSE frames for one client.
+
+    Replayed events are sent first; live events already covered by the replay
+    are skipped. A heartbeat comment keeps idle connections open through
+    proxies.
+    """
+    heartbeat = heartbeat_seconds or settings.change_stream_heartbeat_seconds
+    cursor = since
+
+    def _frames(events: list[dict[str, Any]]) -> list[str]:
+        nonlocal cursor
+        frames = []
+        for event in events:
+            if event["seq"] <= cursor:
+                continue
+            cursor = event["seq"]
+            if matches_filters(event, team, tag, contract_id):
+                frames.append(format_sse(event))
+        return frames
+
+    for frame in _frames(replay):
+        yield frame
+    replayed_up_to = cursor
+
+    while not await is_disconnected():
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+        except asyncio.TimeoutError:
+            yield ": heartbeat\n\n"
+            continue
+
+        if event is RESYNC:
+            # Page through everything missed since the last delivered event
+            while events := await load_since(cursor):
+                for frame in _frames(events):
+                    yield frame
+            replayed_up_to = cursor
+            continue
+
+        # Live events can arrive out of sequence order; only drop the ones a
+        # replay has already delivered.
+        if event["seq"] <= replayed_up_to:
+            continue
+        cursor = max(cursor, event["seq"])
+        if matches_filters(event, team, tag, contract_id):
+            yield format_sse(event)
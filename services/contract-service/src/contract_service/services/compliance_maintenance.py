@@ -0,0 +1,347 @@
+"""Partition management, retention and rollups for compliance history."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, delete, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.config import settings
+from contract_service.database import async_session_maker
+from contract_service.models import ComplianceCheck, ComplianceRollup
+from contract_service.services.compliance_service import time_bucket, truncate_time
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "compliance_checks"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{8}})$")
+
+# Arbitrary application-wide key so only one worker runs maintenance at a time
+MAINTENANCE_LOCK_KEY = 0x44504354
+
+
+def partition_start(day: date, interval: str) -> date:
+    """First day of the partition containing ``day``."""
+    return day.replace(day=1) if interval == "month" else day
+
+
+def next_partition_start(start: date, interval: str) -> date:
+    """First day of the partition after the one starting at ``start``."""
+    if interval == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def partition_ranges(first: date, last: date, interval: str) -> list[tuple[date, date]]:
+    """Partition bounds covering every day from ``first`` to ``last`` inclusive."""
+    ranges = []
+    start = partition_start(first, interval)
+    while start <= last:
+        end = next_partition_start(start, interval)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def partition_name(start: date) -> str:
+    """Table name of the partition starting at ``start``."""
+    return f"{PARENT_TABLE}_p{start:%Y%m%d}"
+
+
+def create_partition_sql(start: date, end: date) -> str:
+    """DDL creating one range partition of ``compliance_checks``."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} "
+        f"PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+class ComplianceMaintenance:
+    """
+    Keeps compliance history bounded.
+
+    Partitioning is PostgreSQL-only; on other databases those steps are
+    skipped and only rollups run.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def is_postgres(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    async def run(self, now: datetime | None = None) -> dict[str, Any]:
+        """Run one maintenance pass: partitions ahead, rollups, then retention."""
+        now = now or datetime.utcnow()
+
+        if self.is_postgres:
+            acquired = await self.db.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": MAINTENANCE_LOCK_KEY},
+            )
+            if not acquired:
+                return {"skipped": True}
+
+        created = await self.ensure_partitions(now)
+        lookback = now - timedelta(hours=settings.compliance_rollup_lookback_hours)
+        start = await self._rollup_start(lookback)
+        hourly = await self.rollup("hour", start, now)
+        daily = await self.rollup("day", start, now)
+        dropped = await self.drop_expired_partitions(now)
+        pruned = await self.prune_rollups(now)
+
+        return {
+            "partitions_created": created,
+            "partitions_dropped": dropped,
+            "hourly_buckets": hourly,
+            "daily_buckets": daily,
+            "rollups_pruned": pruned,
+        }
+
+    async def ensure_partitions(self, now: datetime | None = None) -> list[str]:
+        """Create partitions from the current one through the configured lookahead."""
+        if not self.is_postgres:
+            return []
+        now = now or datetime.utcnow()
+        interval = settings.compliance_partition_interval
+
+        start = partition_start(now.date(), interval)
+        ranges = []
+        for _ in range(settings.compliance_partitions_ahead + 1):
+            end = next_partition_start(start, interval)
+            ranges.append((start, end))
+            start = end
+
+        existing = set(await self._partitions())
+        created = []
+        for start, end in ranges:
+            name = partition_name(start)
+            if name in existing:
+                continue
+            await self.create_partition(start, end)
+            created.append(name)
+        return created
+
+    async def create_partition(self, start: date, end: date) -> None:
+        """
+        Create a range partition, moving in rows the default partition holds.
+
+        PostgreSQL refuses a new partition while the default one has rows in
+        its range, so those are moved with the default detached.
+        """
+        bounds = {"start": start, "end": end}
+        in_range = "checked_at >= :start AND checked_at < :end"
+        has_default = await self.db.scalar(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": DEFAULT_PARTITION}
+        )
+        stranded = has_default and await self.db.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"),
+            bounds,
+        )
+        if not stranded:
+            await self.db.execute(text(create_partition_sql(start, end)))
+            return
+
+        await self.db.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+        )
+        await self.db.execute(text(create_partition_sql(start, end)))
+        await self.db.execute(
+            text(
+                f"INSERT INTO {PARENT_TABLE} "
+                f"SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"
+            ),
+            bounds,
+        )
+        await self.db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+        await self.db.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+        )
+
+    async def drop_expired_partitions(self, now: datetime | None = None) -> list[str]:
+        """Detach and drop partitions entirely older than the retention window."""
+        if not self.is_postgres:
+            return []
+        now = now or datetime.utcnow()
+        cutoff = (now - timedelta(days=settings.compliance_retention_days)).date()
+        interval = settings.compliance_partition_interval
+
+        dropped = []
+        for name, start in (await self._partitions()).items():
+            end = next_partition_start(start, interval)
+            if end > cutoff:
+                continue
+            # Make sure the trend data outlives the raw rows
+            bucket_start = datetime.combine(start, datetime.min.time())
+            bucket_end = datetime.combine(end, datetime.min.time())
+            await self.rollup("hour", bucket_start, bucket_end)
+            await self.rollup("day", bucket_start, bucket_end)
+
+            await self.db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            await self.db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+        return dropped
+
+    async def rollup(self, granularity: str, start: datetime, end: datetime) -> int:
+        """
+        Recompute rollups for every bucket overlapping ``[start, end)``.
+
+        Hourly rollups read raw checks and daily rollups read hourly rollups.
+        Buckets are upserted, so re-running over the same window is safe and
+        picks up late-arriving checks.
+        """
+        bucket_start = truncate_time(granularity, start)
+        if granularity == "hour":
+            source = ComplianceCheck
+            bucket = time_bucket(self.db, "hour", ComplianceCheck.checked_at)
+            counts = [
+                func.sum(case((ComplianceCheck.status == status, 1), else_=0))
+                for status in ("pass", "warning", "fail", "error")
+            ]
+            total = func.count()
+            time_column = ComplianceCheck.checked_at
+        else:
+            source = ComplianceRollup
+            bucket = time_bucket(self.db, "day", ComplianceRollup.bucket_start)
+            counts = [
+                func.sum(ComplianceRollup.pass_count),
+                func.sum(ComplianceRollup.warning_count),
+                func.sum(ComplianceRollup.fail_count),
+                func.sum(ComplianceRollup.error_count),
+            ]
+            total = func.sum(ComplianceRollup.total_count)
+            time_column = ComplianceRollup.bucket_start
+
+        pass_count, warning_count, fail_count, error_count = counts
+        worst = case(
+            (error_count > 0, "error"),
+            (fail_count > 0, "fail"),
+            (warning_count > 0, "warning"),
+            else_="pass",
+        )
+        query = (
+            select(
+                literal(granularity),
+                bucket,
+                source.contract_id,
+                source.check_type,
+                pass_count,
+                warning_count,
+                fail_count,
+                error_count,
+                total,
+                worst,
+            )
+            .where(time_column >= bucket_start, time_column < end)
+            .group_by(bucket, source.contract_id, source.check_type)
+        )
+        if granularity == "day":
+            query = query.where(ComplianceRollup.granularity == "hour")
+
+        stmt = self._insert(ComplianceRollup).from_select(
+            [
+                "granularity",
+                "bucket_start",
+                "contract_id",
+                "check_type",
+                "pass_count",
+                "warning_count",
+                "fail_count",
+                "error_count",
+                "total_count",
+                "worst_status",
+            ],
+            query,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["granularity", "bucket_start", "contract_id", "check_type"],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "pass_count",
+                    "warning_count",
+                    "fail_count",
+                    "error_count",
+                    "total_count",
+                    "worst_status",
+                )
+            },
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount or 0
+
+    async def prune_rollups(self, now: datetime | None = None) -> int:
+        """Delete hourly rollups past their retention; daily rollups are kept."""
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=settings.compliance_hourly_rollup_retention_days)
+        result = await self.db.execute(
+            delete(ComplianceRollup).where(
+                ComplianceRollup.granularity == "hour",
+                ComplianceRollup.bucket_start < cutoff,
+            )
+        )
+        return result.rowcount or 0
+
+    async def _rollup_start(self, lookback: datetime) -> datetime:
+        """Start of the rollup window: the lookback, or all history on first run."""
+        has_rollups = await self.db.scalar(select(ComplianceRollup.bucket_start).limit(1))
+        if has_rollups is not None:
+            return lookback
+        oldest = await self.db.scalar(select(func.min(ComplianceCheck.checked_at)))
+        return min(oldest, lookback) if oldest else lookback
+
+    async def _partitions(self) -> dict[str, date]:
+        """Attached partitions of ``compliance_checks`` by name, with their start day."""
+        result = await self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :parent"
+            ),
+            {"parent": PARENT_TABLE},
+        )
+        partitions = {}
+        for (name,) in result:
+            match = PARTITION_NAME.match(name)
+            if match:
+                partitions[name] = datetime.strptime(match.group(1), "%Y%m%d").date()
+        return dict(sorted(partitions.items(), key=lambda item: item[1]))
+
+    def _insert(self, model: type) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(model)
+        return pg_insert(model)
+
+
+async def prepare_partitions() -> None:
+    """Make sure the current partition exists before the app accepts writes."""
+    async with async_session_maker() as session:
+        await ComplianceMaintenance(session).ensure_partitions()
+        await session.commit()
+
+
+async def run_maintenance_loop() -> None:
+    """Run compliance maintenance periodically for the lifetime of the app."""
+    while True:
+        try:
+            async with async_session_maker() as session:
+                summary = await ComplianceMaintenance(session).run()
+                await session.commit()
+            logger.info(f"Compliance maintenance: {summary}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Compliance maintenance failed: {e}")
+        await asyncio.sleep(settings.compliance_maintenance_interval_seconds)
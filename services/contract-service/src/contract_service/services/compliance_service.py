@@ -0,0 +1,508 @@
+"""Compliance check recording, current-state and history queries."""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.config import settings
+from contract_service.utils import cursor as keyset
+from contract_service.models import (
+    ComplianceCheck,
+    ComplianceRollup,
+    ComplianceState,
+    Contract,
+)
+
+FAILING_STATUSES = ("fail", "error")
+
+COUNTED_STATUSES = ("pass", "warning", "fail", "error")
+
+BUCKET_SIZES = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=31),
+}
+
+# Severity used to pick a contract's worst status across check types
+STATUS_RANK = {"pass": 0, "warning": 1, "fail": 2, "error": 3}
+
+
+class ComplianceCRUD:
+    """Compliance history and latest-state operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_check(
+        self,
+        contract_id: UUID,
+        check_type: str,
+        status: str,
+        details: dict[str, Any],
+        error_message: str | None = None,
+        checked_at: datetime | None = None,
+    ) -> ComplianceCheck:
+        """Append a check to history and fold it into the latest state."""
+        checked_at = checked_at or datetime.utcnow()
+        check = ComplianceCheck(
+            contract_id=contract_id,
+            check_type=check_type,
+            status=status,
+            details=details,
+            error_message=error_message,
+            checked_at=checked_at,
+        )
+        self.db.add(check)
+        await self.db.flush()
+
+        await self._upsert_state(check)
+        return check
+
+    async def _upsert_state(self, check: ComplianceCheck) -> None:
+        """
+        Upsert the (contract, check type) state row in a single statement.
+
+        Counters are computed from the stored row inside the upsert, so
+        concurrent writers cannot lose updates. Checks older than the stored
+        state (late deliveries) only bump the totals.
+        """
+        failed = 1 if check.status in FAILING_STATUSES else 0
+        stmt = self._insert(ComplianceState).values(
+            contract_id=check.contract_id,
+            check_type=check.check_type,
+            status=check.status,
+            previous_status=None,
+            streak=1,
+            total_checks=1,
+            failure_count=failed,
+            details_summary=_summarize_details(check.details),
+            error_message=check.error_message,
+            last_checked_at=check.checked_at,
+            status_changed_at=check.checked_at,
+        )
+        current = ComplianceState.__table__.c
+        newer = stmt.excluded.last_checked_at >= current.last_checked_at
+        same_status = current.status == stmt.excluded.status
+
+        def latest(value: Any, column: Any) -> Any:
+            return case((newer, value), else_=column)
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["contract_id", "check_type"],
+            set_={
+                "status": latest(stmt.excluded.status, current.status),
+                "previous_status": latest(
+                    case((same_status, current.previous_status), else_=current.status),
+                    current.previous_status,
+                ),
+                "streak": latest(
+                    case((same_status, current.streak + 1), else_=1), current.streak
+                ),
+                "total_checks": current.total_checks + 1,
+                "failure_count": current.failure_count + failed,
+                "details_summary": latest(
+                    stmt.excluded.details_summary, current.details_summary
+                ),
+                "error_message": latest(stmt.excluded.error_message, current.error_message),
+                "last_checked_at": latest(
+                    stmt.excluded.last_checked_at, current.last_checked_at
+                ),
+                "status_changed_at": latest(
+                    case(
+                        (same_status, current.status_changed_at),
+                        else_=stmt.excluded.last_checked_at,
+                    ),
+                    current.status_changed_at,
+                ),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def get_state(self, contract_id: UUID) -> list[ComplianceState]:
+        """Get the latest state of every check type for a contract."""
+        result = await self.db.execute(
+            select(ComplianceState)
+            .where(ComplianceState.contract_id == contract_id)
+            .order_by(ComplianceState.check_type)
+        )
+        return list(result.scalars().all())
+
+    async def get_fleet_health(
+        self,
+        statuses: list[str] | None = None,
+        check_type: str | None = None,
+        team: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """
+        Summarize current compliance across all contracts.
+
+        Reads only ``compliance_state``, so the cost depends on the number of
+        (contract, check type) pairs rather than on the size of the history.
+        Entries default to failing checks, longest-failing first.
+        """
+        statuses = statuses or list(FAILING_STATUSES)
+
+        def scoped(stmt: Any) -> Any:
+            stmt = stmt.join(Contract, Contract.id == ComplianceState.contract_id)
+            if check_type:
+                stmt = stmt.where(ComplianceState.check_type == check_type)
+            if team:
+                stmt = stmt.where(Contract.publisher_team == team)
+            return stmt
+
+        by_status = await self.db.execute(
+            scoped(
+                select(ComplianceState.status, func.count()).select_from(ComplianceState)
+            ).group_by(ComplianceState.status)
+        )
+
+        rank = case(
+            *[(ComplianceState.status == s, r) for s, r in STATUS_RANK.items()],
+            else_=STATUS_RANK["warning"],
+        )
+        worst = (
+            scoped(
+                select(func.max(rank).label("rank")).select_from(ComplianceState)
+            )
+            .group_by(ComplianceState.contract_id)
+            .subquery()
+        )
+        by_contract = await self.db.execute(
+            select(worst.c.rank, func.count()).group_by(worst.c.rank)
+        )
+        rank_names = {r: s for s, r in STATUS_RANK.items()}
+
+        filtered = scoped(
+            select(ComplianceState, Contract.name, Contract.publisher_team).select_from(
+                ComplianceState
+            )
+        ).where(ComplianceState.status.in_(statuses))
+        total = await self.db.scalar(
+            select(func.count()).select_from(filtered.subquery())
+        )
+        entries = await self.db.execute(
+            filtered.order_by(
+                ComplianceState.status_changed_at.asc(),
+                ComplianceState.contract_id,
+                ComplianceState.check_type,
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+
+        return {
+            "checks_by_status": dict(by_status.all()),
+            "contracts_by_status": {
+                rank_names[rank]: count for rank, count in by_contract.all()
+            },
+            "entries": [
+                {
+                    **{
+                        column.key: getattr(state, column.key)
+                        for column in ComplianceState.__table__.c
+                    },
+                    "contract_name": name,
+                    "publisher_team": publisher_team,
+                }
+                for state, name, publisher_team in entries.all()
+            ],
+            "total_entries": total or 0,
+        }
+
+    async def get_history(
+        self,
+        contract_id: UUID,
+        check_type: str | None = None,
+        status: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[ComplianceCheck], str | None]:
+        """
+        Get raw checks for a contract, newest first, with keyset pagination.
+
+        The cursor encodes the (checked_at, id) of the last row returned, so
+        each page is an index range scan regardless of how deep it is.
+        """
+        query = select(ComplianceCheck).where(ComplianceCheck.contract_id == contract_id)
+        if check_type:
+            query = query.where(ComplianceCheck.check_type == check_type)
+        if status:
+            query = query.where(ComplianceCheck.status == status)
+        if cursor:
+            checked_at, check_id = decode_cursor(cursor)
+            query = query.where(
+                or_(
+                    ComplianceCheck.checked_at < checked_at,
+                    and_(
+                        ComplianceCheck.checked_at == checked_at,
+                        ComplianceCheck.id < check_id,
+                    ),
+                )
+            )
+
+        result = await self.db.execute(
+            query.order_by(ComplianceCheck.checked_at.desc(), ComplianceCheck.id.desc())
+            .limit(limit + 1)
+        )
+        checks = list(result.scalars().all())
+        has_more = len(checks) > limit
+        checks = checks[:limit]
+        next_cursor = encode_cursor(checks[-1]) if has_more else None
+        return checks, next_cursor
+
+    async def get_trend(
+        self,
+        bucket: str,
+        since: datetime,
+        until: datetime,
+        contract_id: UUID | None = None,
+        check_type: str | None = None,
+        team: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Aggregate compliance history into time buckets.
+
+        Buckets are computed in SQL from raw checks. For the part of the range
+        older than the oldest retained check, counts come from rollups
+        instead, so long-range trends survive partition retention. MTTR is the
+        mean time from a check starting to fail until it stops failing.
+        """
+
+        def scoped(query: Any, model: Any) -> Any:
+            query = query.where(model.contract_id == contract_id) if contract_id else query
+            if check_type:
+                query = query.where(model.check_type == check_type)
+            if team:
+                query = query.join(Contract, Contract.id == model.contract_id).where(
+                    Contract.publisher_team == team
+                )
+            return query
+
+        oldest = await self.db.scalar(
+            scoped(select(func.min(ComplianceCheck.checked_at)), ComplianceCheck)
+        )
+        raw_start = since
+        if oldest is None:
+            raw_start = until
+        elif oldest > since:
+            raw_start = max(since, truncate_time("day", oldest))
+
+        rows: list[Any] = []
+        if raw_start > since:
+            rollup_bucket = time_bucket(self.db, bucket, ComplianceRollup.bucket_start)
+            result = await self.db.execute(
+                scoped(
+                    select(
+                        rollup_bucket,
+                        func.sum(ComplianceRollup.pass_count),
+                        func.sum(ComplianceRollup.warning_count),
+                        func.sum(ComplianceRollup.fail_count),
+                        func.sum(ComplianceRollup.error_count),
+                        func.sum(ComplianceRollup.total_count),
+                    ),
+                    ComplianceRollup,
+                )
+                .where(
+                    ComplianceRollup.granularity == ("hour" if bucket == "hour" else "day"),
+                    ComplianceRollup.bucket_start >= since,
+                    ComplianceRollup.bucket_start < min(raw_start, until),
+                )
+                .group_by(rollup_bucket)
+            )
+            rows.extend(result.all())
+
+        raw_bucket = time_bucket(self.db, bucket, ComplianceCheck.checked_at)
+        result = await self.db.execute(
+            scoped(
+                select(
+                    raw_bucket,
+                    *[
+                        func.sum(case((ComplianceCheck.status == s, 1), else_=0))
+                        for s in COUNTED_STATUSES
+                    ],
+                    func.count(),
+                ),
+                ComplianceCheck,
+            )
+            .where(
+                ComplianceCheck.checked_at >= raw_start,
+                ComplianceCheck.checked_at < until,
+            )
+            .group_by(raw_bucket)
+        )
+        rows.extend(result.all())
+
+        # Merge buckets that straddle the rollup/raw boundary
+        merged: dict[Any, list[int]] = defaultdict(lambda: [0] * 5)
+        for bucket_start, *counts in rows:
+            totals = merged[bucket_start]
+            for index, count in enumerate(counts):
+                totals[index] += int(count or 0)
+
+        buckets = [
+            _trend_bucket(bucket_start, counts)
+            for bucket_start, counts in sorted(merged.items(), key=lambda item: item[0])
+        ]
+        overall = [sum(b[key] for b in buckets) for key in _COUNT_KEYS]
+        incidents, mttr = await self._mttr(scoped, raw_start, until)
+
+        return {
+            "bucket": bucket,
+            "since": since,
+            "until": until,
+            "buckets": buckets,
+            **{k: v for k, v in _trend_bucket(None, overall).items() if k != "bucket_start"},
+            "incidents": incidents,
+            "mttr_seconds": mttr,
+        }
+
+    async def _mttr(
+        self, scoped: Any, since: datetime, until: datetime
+    ) -> tuple[int, float | None]:
+        """Count recovered incidents and their mean time to recovery in SQL."""
+        failing = ComplianceCheck.status.in_(FAILING_STATUSES)
+        series = (ComplianceCheck.contract_id, ComplianceCheck.check_type)
+        ordered = scoped(
+            select(
+                ComplianceCheck.contract_id,
+                ComplianceCheck.check_type,
+                ComplianceCheck.checked_at,
+                case((failing, 1), else_=0).label("failing"),
+                func.lag(case((failing, 1), else_=0))
+                .over(partition_by=series, order_by=ComplianceCheck.checked_at)
+                .label("was_failing"),
+            ),
+            ComplianceCheck,
+        ).where(
+            ComplianceCheck.checked_at >= since,
+            ComplianceCheck.checked_at < until,
+            ComplianceCheck.status.in_(COUNTED_STATUSES),
+        ).subquery()
+
+        # Keep only edges: the first failing check and the first check after it
+        # that is no longer failing
+        edges = (
+            select(
+                ordered.c.contract_id,
+                ordered.c.check_type,
+                ordered.c.checked_at,
+                ordered.c.failing,
+            )
+            .where(ordered.c.failing != func.coalesce(ordered.c.was_failing, 0))
+            .subquery()
+        )
+        paired = select(
+            edges.c.failing,
+            edges.c.checked_at.label("started_at"),
+            func.lead(edges.c.checked_at)
+            .over(
+                partition_by=(edges.c.contract_id, edges.c.check_type),
+                order_by=edges.c.checked_at,
+            )
+            .label("recovered_at"),
+        ).subquery()
+
+        duration = seconds_between(self.db, paired.c.recovered_at, paired.c.started_at)
+        result = await self.db.execute(
+            select(func.count(), func.avg(duration)).where(
+                paired.c.failing == 1, paired.c.recovered_at.is_not(None)
+            )
+        )
+        incidents, mttr = result.one()
+        return incidents or 0, float(mttr) if mttr is not None else None
+
+    def _insert(self, model: type) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(model)
+        return pg_insert(model)
+
+
+def _summarize_details(details: dict[str, Any] | None) -> dict[str, Any]:
+    """Keep check details small enough to live on the state row."""
+    if not details:
+        return {}
+    if len(json.dumps(details, default=str)) <= settings.compliance_state_details_max_bytes:
+        return details
+    # Too large: keep scalar values and note what was dropped
+    summary = {
+        key: value
+        for key, value in details.items()
+        if isinstance(value, (str, int, float, bool)) and len(str(value)) <= 200
+    }
+    summary["truncated"] = sorted(set(details) - set(summary))
+    return summary
+
+
+_COUNT_KEYS = ("pass_count", "warning_count", "fail_count", "error_count", "total_count")
+
+
+def _trend_bucket(bucket_start: Any, counts: list[int]) -> dict[str, Any]:
+    """Shape one bucket of counts, deriving the pass rate."""
+    bucket = {"bucket_start": bucket_start, **dict(zip(_COUNT_KEYS, counts, strict=True))}
+    total = bucket["total_count"]
+    bucket["pass_rate"] = bucket["pass_count"] / total if total else None
+    return bucket
+
+
+def encode_cursor(check: ComplianceCheck) -> str:
+    """Opaque keyset cursor for a compliance check."""
+    return keyset.encode_cursor(check.checked_at.isoformat(), check.id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for malformed input."""
+    checked_at, check_id = keyset.decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(checked_at), UUID(check_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def time_bucket(db: AsyncSession, granularity: str, column: Any) -> Any:
+    """SQL expression truncating a timestamp to an hour, day, week or month bucket."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc(granularity, column)
+    # SQLite stores DateTime as text; match SQLAlchemy's format so buckets
+    # compare correctly against bound datetimes
+    if granularity == "week":
+        # Move to the following Sunday, then back to Monday
+        return func.strftime("%Y-%m-%d 00:00:00.000000", column, "weekday 0", "-6 days")
+    fmt = {
+        "hour": "%Y-%m-%d %H:00:00.000000",
+        "day": "%Y-%m-%d 00:00:00.000000",
+        "month": "%Y-%m-01 00:00:00.000000",
+    }[granularity]
+    return func.strftime(fmt, column)
+
+
+def truncate_time(granularity: str, value: datetime) -> datetime:
+    """Python equivalent of ``time_bucket``."""
+    value = value.replace(minute=0, second=0, microsecond=0)
+    if granularity == "hour":
+        return value
+    value = value.replace(hour=0)
+    if granularity == "week":
+        return value - timedelta(days=value.weekday())
+    if granularity == "month":
+        return value.replace(day=1)
+    return value
+
+
+def seconds_between(db: AsyncSession, later: Any, earlier: Any) -> Any:
+    """SQL expression for the number of seconds between two timestamps."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.extract("epoch", later - earlier)
+    return (func.julianday(later) - func.julianday(earlier)) * 86400.0
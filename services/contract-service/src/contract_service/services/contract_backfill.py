@@ -0,0 +1,384 @@
+"""Organization-wide backfill of the registry from contract repositories."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+import httpx
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.config import settings
+from contract_service.models import ContractSource, RepositorySync
+from contract_service.schemas.contract import ContractCreate
+from contract_service.services.contract_service import ContractCRUD
+from contract_service.services.github_service import GitHubService
+from contract_service.utils.yaml_parser import (
+    ContractParseError,
+    is_contract_file,
+    parse_contract_yaml,
+    to_contract_payload,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def git_blob_sha(content: bytes) -> str:
+    """SHA-1 git assigns to a blob with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def parse_contract_file(content: str, repository_url: str | None) -> ContractCreate:
+    """
+    Parse a contract file from a repository into a validated contract.
+
+    The publisher's repository URL defaults to the repository the file was
+    read from. Raises ``ContractParseError`` or ``ValidationError``.
+    """
+    item = to_contract_payload(parse_contract_yaml(content))
+    if not item["publisher"].get("repository_url"):
+        item["publisher"]["repository_url"] = repository_url
+    return ContractCreate.model_validate(item)
+
+
+@dataclass
+class Repository:
+    """A repository to scan for contract files."""
+
+    name: str
+    url: str | None = None
+    ref: str | None = None
+
+
+@dataclass
+class SourceFile:
+    """A contract file and the SHA of its content."""
+
+    path: str
+    sha: str
+
+
+class ContractSourceReader(Protocol):
+    """Where a backfill finds repositories and reads their contract files."""
+
+    async def repositories(self) -> list[Repository]: ...
+
+    async def contract_files(self, repo: Repository) -> tuple[str | None, list[SourceFile]]:
+        """The repository's revision and its contract files."""
+        ...
+
+    async def read(self, repo: Repository, file: SourceFile) -> str | None: ...
+
+
+class GitHubOrgSource:
+    """
+    Contract files on the default branch of every repository in an org.
+
+    Each repository costs one tree request to list its files, and each
+    changed file one blob request, all through the shared rate-limited
+    GitHub client.
+    """
+
+    def __init__(
+        self,
+        org: str,
+        github: GitHubService | None = None,
+        include_archived: bool = False,
+    ):
+        self.org = org
+        self.github = github or GitHubService()
+        self.include_archived = include_archived
+
+    async def repositories(self) -> list[Repository]:
+        repos = await self.github.list_org_repositories(self.org)
+        return [
+            Repository(name=r["full_name"], url=r.get("html_url"), ref=r.get("default_branch"))
+            for r in repos
+            if self.include_archived or not r.get("archived")
+        ]
+
+    async def contract_files(self, repo: Repository) -> tuple[str | None, list[SourceFile]]:
+        owner, name = repo.name.split("/", 1)
+        try:
+            tree = await self.github.get_tree(owner, name, repo.ref or "HEAD")
+        except httpx.HTTPStatusError as e:
+            # Empty repositories have no tree
+            if e.response.status_code in (404, 409):
+                return None, []
+            raise
+        if tree.get("truncated"):
+            logger.warning(f"Tree of {repo.name} is truncated; some contracts may be missed")
+
+        files = [
+            SourceFile(path=entry["path"], sha=entry["sha"])
+            for entry in tree.get("tree", [])
+            if entry.get("type") == "blob" and is_contract_file(entry["path"])
+        ]
+        return tree.get("sha"), files
+
+    async def read(self, repo: Repository, file: SourceFile) -> str | None:
+        owner, name = repo.name.split("/", 1)
+        return await self.github.get_blob(owner, name, file.sha)
+
+
+class LocalDirectorySource:
+    """
+    Contract files in a directory of repository checkouts.
+
+    Every subdirectory of ``root`` is a repository. Files are hashed the
+    way git hashes blobs, so the stored SHAs match those of a GitHub sync.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    async def repositories(self) -> list[Repository]:
+        return [
+            Repository(name=path.name)
+            for path in sorted(self.root.iterdir())
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
+    async def contract_files(self, repo: Repository) -> tuple[str | None, list[SourceFile]]:
+        return await asyncio.to_thread(self._scan, self.root / repo.name)
+
+    async def read(self, repo: Repository, file: SourceFile) -> str | None:
+        path = self.root / repo.name / file.path
+        try:
+            return await asyncio.to_thread(path.read_text, encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _scan(checkout: Path) -> tuple[str | None, list[SourceFile]]:
+        """Hash every contract file; the revision hashes the whole listing."""
+        files = []
+        for dirpath, dirnames, filenames in os.walk(checkout):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for filename in sorted(filenames):
+                path = Path(dirpath, filename)
+                relative = path.relative_to(checkout).as_posix()
+                if is_contract_file(relative):
+                    files.append(SourceFile(relative, git_blob_sha(path.read_bytes())))
+
+        listing = "\n".join(f"{f.path} {f.sha}" for f in files)
+        return hashlib.sha1(listing.encode()).hexdigest(), files
+
+
+@dataclass
+class BackfillReport:
+    """Counts and throughput of a backfill run."""
+
+    repositories: int = 0
+    repositories_skipped: int = 0
+    files: int = 0
+    files_unchanged: int = 0
+    files_fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "repositories": self.repositories,
+            "repositories_skipped": self.repositories_skipped,
+            "files": self.files,
+            "files_unchanged": self.files_unchanged,
+            "files_fetched": self.files_fetched,
+            "contracts": {
+                "created": self.created,
+                "updated": self.updated,
+                "unchanged": self.unchanged,
+            },
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "files_per_second": round(self.files_per_second, 1),
+        }
+
+
+class ContractBackfill:
+    """
+    Sync every contract file from a set of repositories into the registry.
+
+    Repositories are synced one at a time, each committed on its own with
+    the blob SHA of every synced file and the repository's revision. A
+    later run skips repositories whose revision is unchanged and files
+    whose blob SHA is unchanged, so an interrupted backfill resumes where
+    it stopped. Contracts whose files were deleted are left in place.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        source: ContractSourceReader,
+        full: bool = False,
+        concurrency: int | None = None,
+    ):
+        self.db = db
+        self.source = source
+        self.full = full
+        self.concurrency = concurrency or settings.github_fetch_concurrency
+
+    async def run(self) -> BackfillReport:
+        """Sync all repositories of the source."""
+        report = BackfillReport()
+        for repo in await self.source.repositories():
+            report.repositories += 1
+            try:
+                await self.sync_repository(repo, report)
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(f"Backfill of {repo.name} failed: {e}")
+                report.errors.append({"repository": repo.name, "error": str(e)})
+            logger.info(
+                f"Backfilled {report.repositories} repositories, {report.files} files "
+                f"({report.files_per_second:.1f} files/s)"
+            )
+        report.finished = time.monotonic()
+        return report
+
+    async def sync_repository(self, repo: Repository, report: BackfillReport) -> None:
+        """Sync the changed contract files of one repository."""
+        revision, files = await self.source.contract_files(repo)
+        report.files += len(files)
+
+        state = await self.db.get(RepositorySync, repo.name)
+        if not self.full and revision and state and state.revision == revision:
+            report.repositories_skipped += 1
+            report.files_unchanged += len(files)
+            return
+
+        result = await self.db.execute(
+            select(ContractSource.path, ContractSource.blob_sha).where(
+                ContractSource.repository == repo.name
+            )
+        )
+        known = dict(result.all())
+        changed = [f for f in files if self.full or known.get(f.path) != f.sha]
+        report.files_unchanged += len(files) - len(changed)
+        report.files_fetched += len(changed)
+
+        contents = await self._read_files(repo, changed)
+
+        contracts: list[ContractCreate] = []
+        synced: dict[str, SourceFile] = {}
+        failed = False
+        for file, content in zip(changed, contents, strict=True):
+            error = None
+            if not content:
+                error = "not found or empty"
+            else:
+                try:
+                    contract = parse_contract_file(content, repo.url)
+                except (ContractParseError, ValidationError) as e:
+                    error = str(e)
+                else:
+                    if contract.name in synced:
+                        duplicate_of = synced[contract.name].path
+                        error = f"Contract '{contract.name}' is also defined in {duplicate_of}"
+            if error:
+                failed = True
+                report.errors.append({"repository": repo.name, "path": file.path, "error": error})
+                continue
+            synced[contract.name] = file
+            contracts.append(contract)
+
+        if contracts:
+            # One chunk, so the repository's contracts land in one transaction
+            results = await ContractCRUD(self.db).bulk_upsert(
+                contracts, chunk_size=len(contracts)
+            )
+            for r in results:
+                if r["status"] == "error":
+                    failed = True
+                    file = synced.pop(r["name"])
+                    report.errors.append({
+                        "repository": repo.name,
+                        "path": file.path,
+                        "error": "; ".join(r.get("errors", [])),
+                    })
+                else:
+                    setattr(report, r["status"], getattr(report, r["status"]) + 1)
+
+        await self._record_sources(repo, synced, {f.path for f in files})
+        # Without a revision, failed files are retried on the next run
+        if revision and not failed:
+            await self.db.merge(
+                RepositorySync(
+                    repository=repo.name, revision=revision, synced_at=datetime.utcnow()
+                )
+            )
+        await self.db.commit()
+
+    async def _read_files(self, repo: Repository, files: list[SourceFile]) -> list[str | None]:
+        """Read file contents concurrently, with bounded parallelism."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def read(file: SourceFile) -> str | None:
+            async with semaphore:
+                return await self.source.read(repo, file)
+
+        return await asyncio.gather(*(read(file) for file in files))
+
+    async def _record_sources(
+        self, repo: Repository, synced: dict[str, SourceFile], present: set[str]
+    ) -> None:
+        """Store the blob SHAs just synced and forget files no longer present."""
+        await self.db.execute(
+            delete(ContractSource).where(
+                ContractSource.repository == repo.name,
+                ContractSource.path.not_in(present),
+            )
+        )
+        if not synced:
+            return
+
+        now = datetime.utcnow()
+        stmt = self._insert().values([
+            {
+                "repository": repo.name,
+                "path": file.path,
+                "blob_sha": file.sha,
+                "contract_name": name,
+                "synced_at": now,
+            }
+            for name, file in synced.items()
+        ])
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["repository", "path"],
+                set_={
+                    "blob_sha": stmt.excluded.blob_sha,
+                    "contract_name": stmt.excluded.contract_name,
+                    "synced_at": stmt.excluded.synced_at,
+                },
+            )
+        )
+
+    def _insert(self) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(ContractSource)
+        return pg_insert(ContractSource)
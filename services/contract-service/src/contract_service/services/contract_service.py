@@ -2,27 +2,48 @@
 
 from __future__ import annotations
 
+import json
+import uuid
+import zlib
+from collections import Counter
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, case, delete, func, insert, or_, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
+from contract_service.config import settings
 from contract_service.models import (
     AccessConfig,
     ComplianceCheck,
     Contract,
+    ContractChange,
     ContractField,
     ContractVersion,
     QualityMetric,
     Subscriber,
+    SubscriberFieldUsage,
 )
 from contract_service.schemas import (
+    ContractChangeSet,
     ContractCreate,
     ContractUpdate,
 )
+from contract_service.schemas.field import FieldCreate
+from contract_service.services.change_stream import (
+    PENDING_EVENTS_KEY,
+    change_event,
+    publish_pending_changes,
+)
+from contract_service.services.compliance_service import ComplianceCRUD
+from contract_service.utils.json_patch import apply_patch, make_patch
+
+# Advisory lock serializing change feed appends on PostgreSQL
+CHANGE_FEED_LOCK_ID = 0x636F6E7472616374  # "contract"
 
 
 class ContractCRUD:
@@ -90,6 +111,7 @@ class ContractCRUD:
             self.db.add(access)
 
         # Create subscribers
+        subscribers = []
         for sub_data in contract_data.subscribers:
             subscriber = Subscriber(
                 contract_id=contract.id,
@@ -99,12 +121,296 @@ class ContractCRUD:
                 contact_email=sub_data.contact_email,
             )
             self.db.add(subscriber)
+            subscribers.append(subscriber)
 
         await self.db.flush()
+        await self._sync_field_usage(
+            [(s.id, s.contract_id, s.fields_used) for s in subscribers]
+        )
+        await self.record_change(contract.id, "created")
 
         # Return with all relationships loaded
         return await self.get(contract.id)
 
+    async def bulk_upsert(
+        self, contracts: list[ContractCreate], chunk_size: int = 200
+    ) -> list[dict[str, Any]]:
+        """
+        Create or replace many contracts with set-based statements.
+
+        Each chunk is written and committed in its own transaction: one
+        multi-row upsert for contracts and one multi-row INSERT per child
+        table. Contracts identical to the stored state are left untouched.
+        A failing chunk is rolled back and its items are reported as errors.
+        """
+        results: list[dict[str, Any]] = []
+
+        for start in range(0, len(contracts), chunk_size):
+            chunk = contracts[start : start + chunk_size]
+            try:
+                chunk_results = await self._upsert_chunk(chunk)
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                self.db.info.pop(PENDING_EVENTS_KEY, None)
+                chunk_results = [
+                    {"name": data.name, "status": "error", "id": None, "errors": [str(e)]}
+                    for data in chunk
+                ]
+            else:
+                await publish_pending_changes(self.db)
+
+            # Keep the identity map from growing across chunks
+            self.db.expunge_all()
+
+            for offset, result in enumerate(chunk_results):
+                result["index"] = start + offset
+            results.extend(chunk_results)
+
+        return results
+
+    async def upsert_many(
+        self, contracts: list[ContractCreate], change_summary: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Create or update many contracts in the current transaction.
+
+        New contracts are written with set-based INSERTs; existing ones go
+        through ``update_with_changes``, so only the child rows that differ
+        are touched. Unlike ``bulk_upsert`` nothing is committed and errors
+        propagate, so the caller decides the transaction boundary. Change
+        events are published by calling ``publish_pending_changes`` after
+        the commit.
+        """
+        existing = dict(
+            (
+                await self.db.execute(
+                    select(Contract.name, Contract.id).where(
+                        Contract.name.in_([data.name for data in contracts])
+                    )
+                )
+            ).all()
+        )
+
+        created = [data for data in contracts if data.name not in existing]
+        results = {
+            result["name"]: result
+            for result in (await self._upsert_chunk(created) if created else [])
+        }
+        for data in contracts:
+            if data.name not in existing:
+                continue
+            _, changes = await self.update_with_changes(
+                existing[data.name],
+                ContractUpdate(
+                    version=data.version,
+                    description=data.description,
+                    status=data.status,
+                    publisher=data.publisher,
+                    schema_fields=data.schema_fields,
+                    quality=data.quality,
+                    access=data.access,
+                    tags=data.tags,
+                    metadata=data.metadata,
+                    change_summary=change_summary,
+                ),
+            )
+            results[data.name] = {
+                "name": data.name,
+                "status": "unchanged" if changes.is_empty else "updated",
+                "id": existing[data.name],
+            }
+
+        return [
+            {**results[data.name], "index": index} for index, data in enumerate(contracts)
+        ]
+
+    async def _upsert_chunk(self, chunk: list[ContractCreate]) -> list[dict[str, Any]]:
+        """Write one bulk upsert chunk in the current transaction."""
+        result = await self.db.execute(
+            select(Contract)
+            .options(
+                selectinload(Contract.fields),
+                selectinload(Contract.quality_metrics),
+                selectinload(Contract.access_config),
+                selectinload(Contract.subscribers),
+            )
+            .where(Contract.name.in_([data.name for data in chunk]))
+        )
+        existing = {contract.name: contract for contract in result.scalars()}
+
+        statuses: dict[str, str] = {}
+        for data in chunk:
+            current = existing.get(data.name)
+            if current is None:
+                statuses[data.name] = "created"
+            elif self._current_state(current, data) == self._desired_state(data):
+                statuses[data.name] = "unchanged"
+            else:
+                statuses[data.name] = "updated"
+
+        writes = [data for data in chunk if statuses[data.name] != "unchanged"]
+        if not writes:
+            return [
+                {"name": data.name, "status": "unchanged", "id": existing[data.name].id}
+                for data in chunk
+            ]
+
+        now = datetime.utcnow()
+
+        # Snapshot replaced contracts before they change
+        snapshots = await self._version_rows(
+            [
+                (existing[data.name], "Bulk upsert", None)
+                for data in writes
+                if statuses[data.name] == "updated"
+            ],
+            now,
+        )
+        if snapshots:
+            await self.db.execute(insert(ContractVersion), snapshots)
+
+        stmt = self._insert(Contract)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                column: stmt.excluded[column.key]
+                for column in Contract.__table__.c
+                if column.key not in ("id", "name", "created_at")
+            },
+        ).returning(Contract.id, Contract.name)
+        rows = await self.db.execute(
+            stmt,
+            [
+                {
+                    "id": existing[data.name].id if data.name in existing else uuid.uuid4(),
+                    "name": data.name,
+                    "version": data.version,
+                    "description": data.description,
+                    "status": data.status,
+                    "publisher_team": data.publisher.team,
+                    "publisher_owner": data.publisher.owner,
+                    "repository_url": data.publisher.repository_url,
+                    "contact_email": data.publisher.contact_email,
+                    "tags": data.tags,
+                    "metadata_": data.metadata,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for data in writes
+            ],
+        )
+        ids = {name: contract_id for contract_id, name in rows.all()}
+
+        # Replace child rows of updated contracts with one DELETE per table
+        replaced = [ids[data.name] for data in writes if statuses[data.name] == "updated"]
+        if replaced:
+            for model in (ContractField, QualityMetric, AccessConfig):
+                await self.db.execute(delete(model).where(model.contract_id.in_(replaced)))
+
+        field_rows = [
+            {
+                "contract_id": ids[data.name],
+                "name": f.name,
+                "data_type": f.data_type,
+                "description": f.description,
+                "nullable": f.nullable,
+                "is_pii": f.is_pii,
+                "is_primary_key": f.is_primary_key,
+                "is_foreign_key": f.is_foreign_key,
+                "foreign_key_reference": f.foreign_key_reference,
+                "example_value": f.example_value,
+                "constraints": [c.model_dump() for c in f.constraints],
+            }
+            for data in writes
+            for f in data.schema_fields
+        ]
+        if field_rows:
+            await self.db.execute(insert(ContractField), field_rows)
+
+        metric_rows = [
+            {
+                "contract_id": ids[data.name],
+                "metric_type": m.metric_type,
+                "threshold": m.threshold,
+                "measurement_method": m.measurement_method,
+                "alert_on_breach": m.alert_on_breach,
+            }
+            for data in writes
+            for m in data.quality
+        ]
+        if metric_rows:
+            await self.db.execute(insert(QualityMetric), metric_rows)
+
+        access_rows = [
+            {
+                "contract_id": ids[data.name],
+                "endpoint_url": data.access.endpoint_url,
+                "methods": data.access.methods,
+                "auth_type": data.access.auth_type,
+                "required_scopes": data.access.required_scopes,
+                "rate_limit": data.access.rate_limit,
+            }
+            for data in writes
+            if data.access
+        ]
+        if access_rows:
+            await self.db.execute(insert(AccessConfig), access_rows)
+
+        # Subscribers listed in the payload are upserted; others are kept
+        subscriber_rows = [
+            {
+                "id": uuid.uuid4(),
+                "contract_id": ids[data.name],
+                "team": sub.team,
+                "use_case": sub.use_case,
+                "fields_used": sub.fields_used,
+                "contact_email": sub.contact_email,
+                "subscribed_at": now,
+            }
+            for data in writes
+            for sub in data.subscribers
+        ]
+        if subscriber_rows:
+            stmt = self._insert(Subscriber)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["contract_id", "team"],
+                set_={
+                    "use_case": stmt.excluded.use_case,
+                    "fields_used": stmt.excluded.fields_used,
+                    "contact_email": stmt.excluded.contact_email,
+                },
+            )
+            stmt = stmt.returning(Subscriber.id, Subscriber.contract_id, Subscriber.fields_used)
+            await self._sync_field_usage((await self.db.execute(stmt, subscriber_rows)).all())
+
+        await self._lock_change_feed()
+        changes = await self.db.scalars(
+            insert(ContractChange).returning(ContractChange, sort_by_parameter_order=True),
+            [
+                {
+                    "contract_id": ids[data.name],
+                    "contract_name": data.name,
+                    "change_type": statuses[data.name],
+                    "version": data.version,
+                    "changed_at": now,
+                }
+                for data in writes
+            ],
+        )
+        events = self.db.info.setdefault(PENDING_EVENTS_KEY, [])
+        for change, data in zip(changes.all(), writes, strict=True):
+            events.append(change_event(change, data.publisher.team, data.tags))
+
+        return [
+            {
+                "name": data.name,
+                "status": statuses[data.name],
+                "id": ids.get(data.name) or existing[data.name].id,
+            }
+            for data in chunk
+        ]
+
     async def get(self, contract_id: UUID) -> Contract | None:
         """Get a contract by ID with all relationships."""
         result = await self.db.execute(
@@ -133,15 +439,51 @@ class ContractCRUD:
         )
         return result.scalar_one_or_none()
 
+    async def get_many(
+        self, ids: list[UUID] | None = None, names: list[str] | None = None
+    ) -> list[Contract]:
+        """
+        Get contracts by ID and/or name with all relationships.
+
+        Issues one query for the contracts and one IN query per relationship,
+        however many contracts are requested.
+        """
+        conditions = []
+        if ids:
+            conditions.append(Contract.id.in_(ids))
+        if names:
+            conditions.append(Contract.name.in_(names))
+        if not conditions:
+            return []
+
+        result = await self.db.execute(
+            select(Contract)
+            .options(
+                selectinload(Contract.fields),
+                selectinload(Contract.quality_metrics),
+                selectinload(Contract.access_config),
+                selectinload(Contract.subscribers),
+            )
+            .where(or_(*conditions))
+        )
+        return list(result.scalars().all())
+
     async def list(
         self,
         skip: int = 0,
         limit: int = 50,
         status: str | None = None,
         publisher_team: str | None = None,
-        tag: str | None = None,
+        tag: str | list[str] | None = None,
+        tag_match: str = "all",
     ) -> tuple[list[Contract], int]:
-        """List contracts with filtering and pagination."""
+        """
+        List contracts with filtering and pagination.
+
+        Several tags match contracts carrying all of them, or any of them
+        when ``tag_match`` is ``"any"``.
+        """
+        filters = self._contract_filters(status, publisher_team, tag, tag_match)
         query = select(Contract).options(
             selectinload(Contract.fields),
             selectinload(Contract.quality_metrics),
@@ -149,125 +491,249 @@ class ContractCRUD:
             selectinload(Contract.subscribers),
         )
 
-        # Apply filters
-        if status:
-            query = query.where(Contract.status == status)
-        if publisher_team:
-            query = query.where(Contract.publisher_team == publisher_team)
-        if tag:
-            query = query.where(Contract.tags.contains([tag]))
-
         # Get total count
-        count_query = select(func.count(Contract.id))
-        if status:
-            count_query = count_query.where(Contract.status == status)
-        if publisher_team:
-            count_query = count_query.where(Contract.publisher_team == publisher_team)
-        if tag:
-            count_query = count_query.where(Contract.tags.contains([tag]))
-
-        total_result = await self.db.execute(count_query)
+        total_result = await self.db.execute(select(func.count(Contract.id)).where(*filters))
         total = total_result.scalar() or 0
 
         # Apply pagination
-        query = query.offset(skip).limit(limit).order_by(Contract.created_at.desc())
+        query = (
+            query.where(*filters)
+            .offset(skip)
+            .limit(limit)
+            .order_by(Contract.created_at.desc())
+        )
 
         result = await self.db.execute(query)
         contracts = list(result.scalars().all())
 
         return contracts, total
 
+    async def tag_facets(
+        self,
+        status: str | None = None,
+        publisher_team: str | None = None,
+        tag: str | list[str] | None = None,
+        tag_match: str = "all",
+        limit: int = 100,
+    ) -> dict[str, int]:
+        """
+        Count contracts per tag, most common first.
+
+        Counting is done in SQL over the contracts matching the filters, so
+        a tag selection narrows the facets the way it narrows ``list``.
+        """
+        element = self._tag_elements()
+        count = func.count()
+        result = await self.db.execute(
+            select(element.c.value, count)
+            .select_from(Contract)
+            .join(element, true())
+            .where(*self._contract_filters(status, publisher_team, tag, tag_match))
+            .group_by(element.c.value)
+            .order_by(count.desc(), element.c.value)
+            .limit(limit)
+        )
+        return {value: total for value, total in result.all()}
+
+    def _contract_filters(
+        self,
+        status: str | None,
+        publisher_team: str | None,
+        tag: str | list[str] | None,
+        tag_match: str,
+    ) -> list[Any]:
+        """WHERE clauses shared by contract listing and tag facets."""
+        filters = []
+        if status:
+            filters.append(Contract.status == status)
+        if publisher_team:
+            filters.append(Contract.publisher_team == publisher_team)
+        tags = [tag] if isinstance(tag, str) else list(dict.fromkeys(tag or []))
+        if tags:
+            filters.append(self._tag_filter(tags, tag_match))
+        return filters
+
+    def _tag_filter(self, tags: list[str], match: str) -> Any:
+        """
+        Match contracts carrying all (or any) of ``tags``.
+
+        On PostgreSQL this is containment, which the ``jsonb_path_ops`` GIN
+        index serves; "any" becomes an OR of single-tag containments so
+        each arm is still an index scan.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            if match == "any":
+                return or_(*(Contract.tags.contains([t]) for t in tags))
+            return Contract.tags.contains(tags)
+
+        element = self._tag_elements()
+        conditions = [
+            select(element.c.value).where(element.c.value == t).exists() for t in tags
+        ]
+        return or_(*conditions) if match == "any" else and_(*conditions)
+
+    def _tag_elements(self) -> Any:
+        """Table-valued function yielding one ``value`` row per contract tag."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.jsonb_array_elements_text(Contract.tags).table_valued("value").lateral()
+        return func.json_each(Contract.tags).table_valued("value")
+
     async def update(
         self, contract_id: UUID, update_data: ContractUpdate
     ) -> Contract | None:
         """Update a contract and create a version snapshot."""
+        contract, _ = await self.update_with_changes(contract_id, update_data)
+        return contract
+
+    async def update_with_changes(
+        self, contract_id: UUID, update_data: ContractUpdate
+    ) -> tuple[Contract | None, ContractChangeSet]:
+        """
+        Update a contract by applying only what differs from the stored state.
+
+        Fields are matched by name and written with set-based UPDATE, INSERT
+        and DELETE statements for the rows that changed. A version snapshot
+        and a change feed entry are only created when something changed.
+        """
+        changes = ContractChangeSet()
         contract = await self.get(contract_id)
         if not contract:
-            return None
-
-        # Create version snapshot before updating
-        await self._create_version_snapshot(
-            contract,
-            update_data.change_summary,
-            update_data.changed_by,
-        )
+            return None, changes
 
-        # Update basic fields
-        if update_data.version is not None:
-            contract.version = update_data.version
-        if update_data.description is not None:
-            contract.description = update_data.description
-        if update_data.status is not None:
-            contract.status = update_data.status
-        if update_data.tags is not None:
-            contract.tags = update_data.tags
-        if update_data.metadata is not None:
-            contract.metadata_ = update_data.metadata
-
-        # Update publisher info
+        # Basic attributes
+        attributes: dict[str, Any] = {
+            "version": update_data.version,
+            "description": update_data.description,
+            "status": update_data.status,
+            "tags": update_data.tags,
+            "metadata_": update_data.metadata,
+        }
         if update_data.publisher:
-            contract.publisher_team = update_data.publisher.team
-            contract.publisher_owner = update_data.publisher.owner
-            contract.repository_url = update_data.publisher.repository_url
-            contract.contact_email = update_data.publisher.contact_email
+            attributes.update(
+                publisher_team=update_data.publisher.team,
+                publisher_owner=update_data.publisher.owner,
+                repository_url=update_data.publisher.repository_url,
+                contact_email=update_data.publisher.contact_email,
+            )
+        attributes = {
+            name: value
+            for name, value in attributes.items()
+            if value is not None and getattr(contract, name) != value
+        }
+        changes.contract = [name.rstrip("_") for name in attributes]
 
-        # Update fields if provided (replace all)
+        # Fields, matched by name
+        field_inserts: list[dict[str, Any]] = []
+        field_updates: list[dict[str, Any]] = []
+        field_deletes: list[UUID] = []
         if update_data.schema_fields is not None:
-            # Delete existing fields
-            for field in contract.fields:
-                await self.db.delete(field)
-
-            # Create new fields
-            for field_data in update_data.schema_fields:
-                field = ContractField(
-                    contract_id=contract.id,
-                    name=field_data.name,
-                    data_type=field_data.data_type,
-                    description=field_data.description,
-                    nullable=field_data.nullable,
-                    is_pii=field_data.is_pii,
-                    is_primary_key=field_data.is_primary_key,
-                    is_foreign_key=field_data.is_foreign_key,
-                    foreign_key_reference=field_data.foreign_key_reference,
-                    example_value=field_data.example_value,
-                    constraints=[c.model_dump() for c in field_data.constraints],
-                )
-                self.db.add(field)
+            stored = {f.name: f for f in contract.fields}
+            incoming = {f.name: _field_values(f) for f in update_data.schema_fields}
+
+            for name, values in incoming.items():
+                current = stored.get(name)
+                if current is None:
+                    field_inserts.append({"contract_id": contract.id, "name": name, **values})
+                    changes.fields_added.append(name)
+                elif any(getattr(current, col) != value for col, value in values.items()):
+                    field_updates.append({"id": current.id, **values})
+                    changes.fields_modified.append(name)
+
+            for name, current in stored.items():
+                if name not in incoming:
+                    field_deletes.append(current.id)
+                    changes.fields_removed.append(name)
 
-        # Update quality metrics if provided (replace all)
+        # Quality metrics have no natural key; diff them as a multiset
+        metric_inserts: list[dict[str, Any]] = []
+        metric_deletes: list[UUID] = []
         if update_data.quality is not None:
+            wanted = Counter(
+                (m.metric_type, m.threshold, m.measurement_method, m.alert_on_breach)
+                for m in update_data.quality
+            )
             for metric in contract.quality_metrics:
-                await self.db.delete(metric)
-
-            for metric_data in update_data.quality:
-                metric = QualityMetric(
-                    contract_id=contract.id,
-                    metric_type=metric_data.metric_type,
-                    threshold=metric_data.threshold,
-                    measurement_method=metric_data.measurement_method,
-                    alert_on_breach=metric_data.alert_on_breach,
+                key = (
+                    metric.metric_type,
+                    metric.threshold,
+                    metric.measurement_method,
+                    metric.alert_on_breach,
                 )
-                self.db.add(metric)
+                if wanted[key] > 0:
+                    wanted[key] -= 1
+                else:
+                    metric_deletes.append(metric.id)
+            metric_inserts = [
+                {
+                    "contract_id": contract.id,
+                    "metric_type": metric_type,
+                    "threshold": threshold,
+                    "measurement_method": measurement_method,
+                    "alert_on_breach": alert_on_breach,
+                }
+                for metric_type, threshold, measurement_method, alert_on_breach in wanted.elements()
+            ]
+            changes.quality_metrics_added = len(metric_inserts)
+            changes.quality_metrics_removed = len(metric_deletes)
 
-        # Update access config if provided
+        # Access config is one row per contract; update it in place
+        access_values: dict[str, Any] = {}
         if update_data.access is not None:
-            if contract.access_config:
-                await self.db.delete(contract.access_config)
+            access_values = {
+                "endpoint_url": update_data.access.endpoint_url,
+                "methods": update_data.access.methods,
+                "auth_type": update_data.access.auth_type,
+                "required_scopes": update_data.access.required_scopes,
+                "rate_limit": update_data.access.rate_limit,
+            }
+            if contract.access_config is None:
+                changes.access_config = "created"
+            elif any(
+                getattr(contract.access_config, col) != value
+                for col, value in access_values.items()
+            ):
+                changes.access_config = "updated"
 
-            access = AccessConfig(
-                contract_id=contract.id,
-                endpoint_url=update_data.access.endpoint_url,
-                methods=update_data.access.methods,
-                auth_type=update_data.access.auth_type,
-                required_scopes=update_data.access.required_scopes,
-                rate_limit=update_data.access.rate_limit,
+        if changes.is_empty:
+            return contract, changes
+
+        # Create version snapshot before updating
+        await self._create_version_snapshot(
+            contract,
+            update_data.change_summary,
+            update_data.changed_by,
+        )
+
+        for name, value in attributes.items():
+            setattr(contract, name, value)
+
+        if field_deletes:
+            await self.db.execute(delete(ContractField).where(ContractField.id.in_(field_deletes)))
+        if field_updates:
+            await self.db.execute(update(ContractField), field_updates)
+        if field_inserts:
+            await self.db.execute(insert(ContractField), field_inserts)
+
+        if metric_deletes:
+            await self.db.execute(
+                delete(QualityMetric).where(QualityMetric.id.in_(metric_deletes))
             )
-            self.db.add(access)
+        if metric_inserts:
+            await self.db.execute(insert(QualityMetric), metric_inserts)
+
+        if changes.access_config == "created":
+            self.db.add(AccessConfig(contract_id=contract.id, **access_values))
+        elif changes.access_config == "updated":
+            for name, value in access_values.items():
+                setattr(contract.access_config, name, value)
 
         contract.updated_at = datetime.utcnow()
         await self.db.flush()
+        await self.record_change(contract_id, "updated")
 
-        return await self.get(contract_id)
+        # Bulk statements bypass the identity map; reload the child rows
+        self.db.expire_all()
+        return await self.get(contract_id), changes
 
     async def deprecate(self, contract_id: UUID) -> bool:
         """Soft delete a contract by setting status to deprecated."""
@@ -278,18 +744,61 @@ class ContractCRUD:
         contract.status = "deprecated"
         contract.updated_at = datetime.utcnow()
         await self.db.flush()
+        await self.record_change(contract_id, "deprecated")
 
         return True
 
-    async def get_versions(self, contract_id: UUID) -> list[ContractVersion]:
-        """Get version history for a contract."""
+    async def get_versions(
+        self, contract_id: UUID, skip: int = 0, limit: int = 50
+    ) -> list[ContractVersion]:
+        """Get a page of version history for a contract, newest first, without payloads."""
         result = await self.db.execute(
             select(ContractVersion)
             .where(ContractVersion.contract_id == contract_id)
-            .order_by(ContractVersion.created_at.desc())
+            .order_by(ContractVersion.sequence.desc())
+            .offset(skip)
+            .limit(limit)
         )
         return list(result.scalars().all())
 
+    async def get_version(
+        self, contract_id: UUID, version_id: UUID
+    ) -> tuple[ContractVersion, dict[str, Any]] | None:
+        """
+        Get a historical version together with its reconstructed snapshot.
+
+        Loads at most two payloads: the version itself and, for a delta, the
+        keyframe it was encoded against.
+        """
+        result = await self.db.execute(
+            select(ContractVersion)
+            .options(undefer(ContractVersion.payload), undefer(ContractVersion.payload_compressed))
+            .where(
+                ContractVersion.contract_id == contract_id,
+                ContractVersion.id == version_id,
+            )
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            return None
+
+        payload = _decode_payload(version.payload, version.payload_compressed)
+        if version.is_keyframe:
+            return version, payload
+
+        keyframe = await self.db.execute(
+            select(ContractVersion.payload, ContractVersion.payload_compressed)
+            .where(
+                ContractVersion.contract_id == contract_id,
+                ContractVersion.is_keyframe.is_(True),
+                ContractVersion.sequence < version.sequence,
+            )
+            .order_by(ContractVersion.sequence.desc())
+            .limit(1)
+        )
+        base = keyframe.one()
+        return version, apply_patch(_decode_payload(*base), payload)
+
     async def add_subscriber(
         self, contract_id: UUID, team: str, use_case: str | None, fields_used: list[str], contact_email: str | None
     ) -> Subscriber:
@@ -303,6 +812,8 @@ class ContractCRUD:
         )
         self.db.add(subscriber)
         await self.db.flush()
+        await self._sync_field_usage([(subscriber.id, contract_id, fields_used)])
+        await self.record_change(contract_id, "subscriber_added")
         return subscriber
 
     async def remove_subscriber(self, contract_id: UUID, subscriber_id: UUID) -> bool:
@@ -319,6 +830,7 @@ class ContractCRUD:
 
         await self.db.delete(subscriber)
         await self.db.flush()
+        await self.record_change(contract_id, "subscriber_removed")
         return True
 
     async def get_subscribers(self, contract_id: UUID) -> list[Subscriber]:
@@ -328,6 +840,51 @@ class ContractCRUD:
         )
         return list(result.scalars().all())
 
+    async def get_field_impact(
+        self, contract_id: UUID, field_names: list[str]
+    ) -> list[tuple[Subscriber, list[str]]]:
+        """
+        Subscribers of a contract that read any of the given fields.
+
+        Answered from the field usage index in one query; each subscriber is
+        returned with the subset of ``field_names`` it uses.
+        """
+        if not field_names:
+            return []
+        result = await self.db.execute(
+            select(Subscriber, SubscriberFieldUsage.field_name)
+            .join(SubscriberFieldUsage, SubscriberFieldUsage.subscriber_id == Subscriber.id)
+            .where(
+                SubscriberFieldUsage.contract_id == contract_id,
+                SubscriberFieldUsage.field_name.in_(set(field_names)),
+            )
+            .order_by(Subscriber.team, SubscriberFieldUsage.field_name)
+        )
+        impact: dict[UUID, tuple[Subscriber, list[str]]] = {}
+        for subscriber, field_name in result.all():
+            impact.setdefault(subscriber.id, (subscriber, []))[1].append(field_name)
+        return list(impact.values())
+
+    async def _sync_field_usage(
+        self, subscribers: list[tuple[UUID, UUID, list[str]]]
+    ) -> None:
+        """Rewrite the field usage index rows of (subscriber_id, contract_id, fields_used)."""
+        subscribers = list(subscribers)
+        if not subscribers:
+            return
+        await self.db.execute(
+            delete(SubscriberFieldUsage).where(
+                SubscriberFieldUsage.subscriber_id.in_([s[0] for s in subscribers])
+            )
+        )
+        rows = [
+            {"subscriber_id": subscriber_id, "contract_id": contract_id, "field_name": name}
+            for subscriber_id, contract_id, fields_used in subscribers
+            for name in dict.fromkeys(fields_used or [])
+        ]
+        if rows:
+            await self.db.execute(insert(SubscriberFieldUsage), rows)
+
     async def record_compliance_check(
         self,
         contract_id: UUID,
@@ -336,17 +893,82 @@ class ContractCRUD:
         details: dict[str, Any],
         error_message: str | None = None,
     ) -> ComplianceCheck:
-        """Record a compliance check result."""
-        check = ComplianceCheck(
+        """Record a compliance check result and update the latest compliance state."""
+        return await ComplianceCRUD(self.db).record_check(
             contract_id=contract_id,
             check_type=check_type,
             status=status,
             details=details,
             error_message=error_message,
         )
-        self.db.add(check)
+
+    async def record_change(
+        self, contract_id: UUID, change_type: str
+    ) -> ContractChange | None:
+        """
+        Append an entry to the change feed in the current transaction.
+
+        The contract is usually already in the session's identity map, so this
+        costs the feed lock and a single INSERT.
+        """
+        contract = await self.db.get(Contract, contract_id)
+        if not contract:
+            return None
+
+        await self._lock_change_feed()
+        change = ContractChange(
+            contract_id=contract.id,
+            contract_name=contract.name,
+            change_type=change_type,
+            version=contract.version,
+        )
+        self.db.add(change)
         await self.db.flush()
-        return check
+
+        # Published to stream subscribers once the transaction commits
+        self.db.info.setdefault(PENDING_EVENTS_KEY, []).append(
+            change_event(change, contract.publisher_team, contract.tags)
+        )
+        return change
+
+    async def get_changes(
+        self,
+        since: int = 0,
+        limit: int = 100,
+        contract_id: UUID | None = None,
+    ) -> tuple[list[ContractChange], bool]:
+        """
+        Get change feed entries with a sequence number greater than ``since``.
+
+        Returns the page of changes and whether more entries are available.
+        """
+        query = select(ContractChange).where(ContractChange.seq > since)
+        if contract_id:
+            query = query.where(ContractChange.contract_id == contract_id)
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(
+            query.order_by(ContractChange.seq.asc()).limit(limit + 1)
+        )
+        changes = list(result.scalars().all())
+        return changes[:limit], len(changes) > limit
+
+    async def get_latest_change_seq(self) -> int:
+        """Sequence number of the newest change feed entry, or 0 if there is none."""
+        return await self.db.scalar(select(func.max(ContractChange.seq))) or 0
+
+    async def get_change_events(
+        self, since: int = 0, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Get change feed entries after ``since`` as stream events."""
+        result = await self.db.execute(
+            select(ContractChange, Contract.publisher_team, Contract.tags)
+            .outerjoin(Contract, Contract.id == ContractChange.contract_id)
+            .where(ContractChange.seq > since)
+            .order_by(ContractChange.seq.asc())
+            .limit(limit)
+        )
+        return [change_event(change, team, tags) for change, team, tags in result.all()]
 
     async def _create_version_snapshot(
         self,
@@ -355,7 +977,179 @@ class ContractCRUD:
         changed_by: str | None,
     ) -> ContractVersion:
         """Create a version snapshot of the current contract state."""
-        snapshot = {
+        (row,) = await self._version_rows(
+            [(contract, change_summary, changed_by)], datetime.utcnow()
+        )
+        version = ContractVersion(**row)
+        self.db.add(version)
+        await self.db.flush()
+
+        return version
+
+    async def _version_rows(
+        self,
+        entries: list[tuple[Contract, str | None, str | None]],
+        created_at: datetime,
+    ) -> list[dict[str, Any]]:
+        """
+        Build version history rows for contracts about to change.
+
+        Every ``version_keyframe_interval``-th version is stored as a full
+        keyframe; the rest are JSON Patches against the latest keyframe, so
+        reconstruction never applies more than one patch. A delta that would
+        not be smaller than the snapshot is stored as a keyframe instead.
+        The contract rows are locked until the transaction ends.
+        """
+        if not entries:
+            return []
+
+        ids = [contract.id for contract, _, _ in entries]
+        # Concurrent changes to a contract would otherwise pick the same next
+        # sequence; lock the rows in id order so the second waits and reads
+        # the first one's version. No-op on SQLite, which serializes writers.
+        await self.db.execute(
+            select(Contract.id).where(Contract.id.in_(ids)).order_by(Contract.id).with_for_update()
+        )
+        positions = (
+            select(
+                ContractVersion.contract_id,
+                func.max(ContractVersion.sequence).label("last_sequence"),
+                func.max(
+                    case((ContractVersion.is_keyframe, ContractVersion.sequence))
+                ).label("keyframe_sequence"),
+            )
+            .where(ContractVersion.contract_id.in_(ids))
+            .group_by(ContractVersion.contract_id)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                positions.c.contract_id,
+                positions.c.last_sequence,
+                positions.c.keyframe_sequence,
+                ContractVersion.payload,
+                ContractVersion.payload_compressed,
+            ).outerjoin(
+                ContractVersion,
+                and_(
+                    ContractVersion.contract_id == positions.c.contract_id,
+                    ContractVersion.sequence == positions.c.keyframe_sequence,
+                ),
+            )
+        )
+        history = {
+            row.contract_id: (
+                row.last_sequence,
+                row.keyframe_sequence,
+                _decode_payload(row.payload, row.payload_compressed)
+                if row.keyframe_sequence is not None
+                else None,
+            )
+            for row in result
+        }
+
+        rows = []
+        for contract, change_summary, changed_by in entries:
+            snapshot = self._snapshot(contract)
+            last_sequence, keyframe_sequence, keyframe = history.get(
+                contract.id, (0, None, None)
+            )
+            sequence = last_sequence + 1
+
+            payload: Any = snapshot
+            is_keyframe = (
+                keyframe is None
+                or sequence - keyframe_sequence >= settings.version_keyframe_interval
+            )
+            if not is_keyframe:
+                patch = make_patch(keyframe, snapshot)
+                if len(json.dumps(patch)) < len(json.dumps(snapshot)):
+                    payload = patch
+                else:
+                    is_keyframe = True
+
+            stored, compressed = _encode_payload(payload)
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "contract_id": contract.id,
+                    "version": contract.version,
+                    "sequence": sequence,
+                    "is_keyframe": is_keyframe,
+                    "payload": stored,
+                    "payload_compressed": compressed,
+                    "change_summary": change_summary,
+                    "changed_by": changed_by,
+                    "created_at": created_at,
+                }
+            )
+        return rows
+
+    async def _lock_change_feed(self) -> None:
+        """
+        Hold the change feed lock until the transaction ends.
+
+        Sequence numbers are assigned at INSERT but become visible at COMMIT,
+        so without the lock a transaction could commit a lower seq after a
+        reader had already moved its cursor past it, and that change would
+        never be delivered. Holding the lock from the append until commit
+        makes seqs commit in order. SQLite serializes writers already.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            await self.db.execute(select(func.pg_advisory_xact_lock(CHANGE_FEED_LOCK_ID)))
+
+    def _insert(self, model: type) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(model)
+        return pg_insert(model)
+
+    @staticmethod
+    def _desired_state(data: ContractCreate) -> dict[str, Any]:
+        """Comparable state of an incoming contract."""
+        return {
+            "contract": (
+                data.version,
+                data.description,
+                data.status,
+                data.publisher.team,
+                data.publisher.owner,
+                data.publisher.repository_url,
+                data.publisher.contact_email,
+                data.tags,
+                data.metadata,
+            ),
+            **_child_state(data.schema_fields, data.quality, data.access, data.subscribers),
+        }
+
+    @staticmethod
+    def _current_state(contract: Contract, data: ContractCreate) -> dict[str, Any]:
+        """Comparable state of a stored contract, scoped to the incoming subscribers."""
+        teams = {s.team for s in data.subscribers}
+        return {
+            "contract": (
+                contract.version,
+                contract.description,
+                contract.status,
+                contract.publisher_team,
+                contract.publisher_owner,
+                contract.repository_url,
+                contract.contact_email,
+                contract.tags,
+                contract.metadata_,
+            ),
+            **_child_state(
+                contract.fields,
+                contract.quality_metrics,
+                contract.access_config,
+                [s for s in contract.subscribers if s.team in teams],
+            ),
+        }
+
+    @staticmethod
+    def _snapshot(contract: Contract) -> dict[str, Any]:
+        """Serialize the current contract state for version history."""
+        return {
             "name": contract.name,
             "version": contract.version,
             "description": contract.description,
@@ -411,14 +1205,85 @@ class ContractCRUD:
             ],
         }
 
-        version = ContractVersion(
-            contract_id=contract.id,
-            version=contract.version,
-            contract_snapshot=snapshot,
-            change_summary=change_summary,
-            changed_by=changed_by,
-        )
-        self.db.add(version)
-        await self.db.flush()
 
-        return version
+def _child_state(
+    fields: list[Any], metrics: list[Any], access: Any, subscribers: list[Any]
+) -> dict[str, Any]:
+    """
+    Order-independent state of a contract's child rows.
+
+    Works on both ORM rows and create schemas, which share attribute names.
+    """
+    return {
+        "fields": sorted(
+            [
+                (
+                    f.name,
+                    f.data_type,
+                    f.description,
+                    f.nullable,
+                    f.is_pii,
+                    f.is_primary_key,
+                    f.is_foreign_key,
+                    f.foreign_key_reference,
+                    f.example_value,
+                    [c if isinstance(c, dict) else c.model_dump() for c in f.constraints],
+                )
+                for f in fields
+            ],
+            key=repr,
+        ),
+        "quality": sorted(
+            [
+                (m.metric_type, m.threshold, m.measurement_method, m.alert_on_breach)
+                for m in metrics
+            ],
+            key=repr,
+        ),
+        "access": (
+            (
+                access.endpoint_url,
+                access.methods,
+                access.auth_type,
+                access.required_scopes,
+                access.rate_limit,
+            )
+            if access
+            else None
+        ),
+        "subscribers": sorted(
+            [(s.team, s.use_case, s.fields_used, s.contact_email) for s in subscribers],
+            key=repr,
+        ),
+    }
+
+
+def _encode_payload(payload: Any) -> tuple[Any, bytes | None]:
+    """Split a version payload into its JSON or compressed column value."""
+    if settings.version_compression_enabled:
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        if len(raw) >= settings.version_compression_min_bytes:
+            return None, zlib.compress(raw)
+    return payload, None
+
+
+def _decode_payload(payload: Any, compressed: bytes | None) -> Any:
+    """Inverse of ``_encode_payload``."""
+    if compressed is not None:
+        return json.loads(zlib.decompress(compressed))
+    return payload
+
+
+def _field_values(field_data: FieldCreate) -> dict[str, Any]:
+    """Column values for a field definition, excluding identity columns."""
+    return {
+        "data_type": field_data.data_type,
+        "description": field_data.description,
+        "nullable": field_data.nullable,
+        "is_pii": field_data.is_pii,
+        "is_primary_key": field_data.is_primary_key,
+        "is_foreign_key": field_data.is_foreign_key,
+        "foreign_key_reference": field_data.foreign_key_reference,
+        "example_value": field_data.example_value,
+        "constraints": [c.model_dump() for c in field_data.constraints],
+    }
@@ -0,0 +1,134 @@
+"""Cross-contract field catalog queries."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Float, and_, cast, func, null, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contract_service.config import settings
+from contract_service.models import Contract, ContractField
+from contract_service.utils import cursor as keyset
+
+NAME_MATCHES = ("exact", "prefix", "fuzzy")
+
+
+def encode_cursor(field: ContractField, score: float | None = None) -> str:
+    """Opaque keyset cursor for a catalog field and its fuzzy match score."""
+    return keyset.encode_cursor(score, field.name, field.id)
+
+
+def decode_cursor(cursor: str) -> tuple[float | None, str, UUID]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for malformed input."""
+    score, name, field_id = keyset.decode_cursor(cursor, 3)
+    if not (score is None or isinstance(score, (int, float))) or not isinstance(name, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    try:
+        return score, name, UUID(field_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class FieldCatalogCRUD:
+    """Field queries across every contract in the registry."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        name: str | None = None,
+        match: str = "exact",
+        data_type: str | None = None,
+        is_pii: bool | None = None,
+        publisher_team: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Find fields across contracts.
+
+        Exact and prefix name matches use B-tree indexes on ``name`` and are
+        ordered by (name, id). Fuzzy matches use the pg_trgm ``%`` operator
+        and its GIN index on PostgreSQL and are ordered by similarity, best
+        first, then (name, id); elsewhere they fall back to a
+        case-insensitive substring match scored by how much of the name the
+        query covers. The cursor encodes the sort key of the last row, so
+        every page continues where the previous one ended.
+        """
+        score = self._fuzzy_score(name) if name and match == "fuzzy" else None
+        query = select(
+            ContractField,
+            Contract.name.label("contract_name"),
+            Contract.publisher_team,
+            (score if score is not None else null()).label("score"),
+        ).join(Contract, Contract.id == ContractField.contract_id)
+
+        if name:
+            query = query.where(await self._name_filter(name, match))
+        if data_type:
+            query = query.where(ContractField.data_type == data_type)
+        if is_pii is not None:
+            query = query.where(ContractField.is_pii.is_(is_pii))
+        if publisher_team:
+            query = query.where(Contract.publisher_team == publisher_team)
+        if cursor:
+            last_score, last_name, last_id = decode_cursor(cursor)
+            after = or_(
+                ContractField.name > last_name,
+                and_(ContractField.name == last_name, ContractField.id > last_id),
+            )
+            if score is not None and last_score is not None:
+                after = or_(score < last_score, and_(score == last_score, after))
+            query = query.where(after)
+
+        order = [ContractField.name, ContractField.id]
+        if score is not None:
+            order.insert(0, score.desc())
+        result = await self.db.execute(query.order_by(*order).limit(limit + 1))
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        entries = [
+            {
+                **{
+                    column.key: getattr(field, column.key)
+                    for column in ContractField.__table__.columns
+                },
+                "contract_name": contract_name,
+                "publisher_team": team,
+            }
+            for field, contract_name, team, _ in rows
+        ]
+        next_cursor = encode_cursor(rows[-1][0], rows[-1].score) if has_more else None
+        return entries, next_cursor
+
+    def _fuzzy_score(self, name: str) -> Any:
+        """How closely a field name matches ``name``, from 0 to 1."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.similarity(ContractField.name, name)
+        return cast(len(name), Float) / func.length(ContractField.name)
+
+    async def _name_filter(self, name: str, match: str) -> Any:
+        """WHERE clause for a name lookup in the given match mode."""
+        if match == "prefix":
+            return ContractField.name.startswith(name, autoescape=True)
+        if match == "fuzzy":
+            if self.db.get_bind().dialect.name == "postgresql":
+                # The % operator is what the trigram GIN index serves;
+                # its cut-off is a per-transaction setting
+                await self.db.execute(
+                    select(
+                        func.set_config(
+                            "pg_trgm.similarity_threshold",
+                            str(settings.field_catalog_similarity_threshold),
+                            True,
+                        )
+                    )
+                )
+                return ContractField.name.op("%")(name)
+            return func.lower(ContractField.name).contains(name.lower(), autoescape=True)
+        return ContractField.name == name
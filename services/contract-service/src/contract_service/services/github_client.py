@@ -0,0 +1,224 @@
+"""Shared GitHub HTTP client with conditional-request caching and rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from contract_service.config import settings
+from contract_service.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Below this share of the hourly quota, requests are spread out until reset
+PACING_THRESHOLD = 0.5
+
+# Describe the body as sent; the cache holds it already decoded
+ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class CachedResponse:
+    """Validators and body of a GET response, for revalidation."""
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    content: bytes
+
+
+class RateLimiter:
+    """
+    Token bucket paced by GitHub's rate-limit headers.
+
+    Requests run at up to ``max_per_second`` while more than half of the
+    quota is left. Below that, the refill rate is the quota left above the
+    reserve spread over the time until reset, and once only the reserve is
+    left, requests wait for the reset.
+    """
+
+    def __init__(self, max_per_second: float, reserve: int):
+        self.max_per_second = max_per_second
+        self.reserve = reserve
+        self.capacity = max(1.0, max_per_second)
+        self.rate = max_per_second
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for permission to send one request."""
+        async with self._lock:
+            while True:
+                wait = self.blocked_until - time.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Adjust pacing from the ``X-RateLimit-*`` headers of a response."""
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset_at = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+
+        spendable = remaining - self.reserve
+        if spendable <= 0:
+            self.blocked_until = max(self.blocked_until, reset_at)
+            return
+        if limit and remaining / limit > PACING_THRESHOLD:
+            self.rate = self.max_per_second
+        else:
+            seconds = max(reset_at - time.time(), 1.0)
+            self.rate = min(self.max_per_second, spendable / seconds)
+
+    def backoff(self, seconds: float) -> None:
+        """Hold all requests for ``seconds``."""
+        self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+
+def retry_delay(response: httpx.Response) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, else ``None``."""
+    if response.status_code not in (403, 429):
+        return None
+    if "retry-after" in response.headers:
+        try:
+            return float(response.headers["retry-after"])
+        except ValueError:
+            return None
+    if response.headers.get("x-ratelimit-remaining") == "0":
+        try:
+            return max(float(response.headers["x-ratelimit-reset"]) - time.time(), 0.0)
+        except (KeyError, ValueError):
+            return None
+    # A 403 without rate-limit signals is a permission error
+    return None
+
+
+class GitHubClient:
+    """
+    Long-lived GitHub API client shared by all ``GitHubService`` instances.
+
+    GET responses carrying an ETag or Last-Modified are cached per URL and
+    revalidated with conditional requests; a 304 is answered from the cache
+    and does not count against GitHub's rate limit. File contents are also
+    cached by blob SHA, since a blob never changes.
+    """
+
+    def __init__(self, token: str | None = None, base_url: str = GITHUB_API_URL):
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        self.http = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=30.0)
+        self.responses = LRUCache(settings.github_cache_max_entries)
+        self.blobs = LRUCache(settings.github_blob_cache_max_entries)
+        self.limiter = RateLimiter(
+            settings.github_max_requests_per_second, settings.github_rate_limit_reserve
+        )
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, revalidating cached GET responses."""
+        request = self.http.build_request(method, url, **kwargs)
+        if method != "GET":
+            return await self._send(request)
+
+        key = str(request.url)
+        cached = self.responses.get(key)
+        if cached:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._send(request)
+        if response.status_code == 304 and cached:
+            return httpx.Response(
+                200, headers=cached.headers, content=cached.content, request=request
+            )
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.responses.set(
+                key,
+                CachedResponse(
+                    etag,
+                    last_modified,
+                    {
+                        name: value
+                        for name, value in response.headers.items()
+                        if name not in ENCODING_HEADERS
+                    },
+                    response.content,
+                ),
+            )
+        return response
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send through the rate limiter, retrying rate-limited responses."""
+        for attempt in range(settings.github_max_retries + 1):
+            await self.limiter.acquire()
+            response = await self.http.send(request)
+            self.limiter.update(response.headers)
+
+            delay = retry_delay(response)
+            if (
+                delay is None
+                or attempt == settings.github_max_retries
+                or delay > settings.github_max_retry_wait_seconds
+            ):
+                return response
+            logger.warning(f"GitHub rate limited {request.url}; retrying in {delay:.0f}s")
+            self.limiter.backoff(delay)
+        return response
+
+
+_shared_clients: dict[str | None, GitHubClient] = {}
+
+
+def shared_client(token: str | None) -> GitHubClient:
+    """The process-wide client for a token, created on first use."""
+    client = _shared_clients.get(token)
+    if client is None:
+        client = _shared_clients[token] = GitHubClient(token)
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close all shared clients; called on application shutdown."""
+    while _shared_clients:
+        _, client = _shared_clients.popitem()
+        await client.aclose()
@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from contract_service.config import settings
+from contract_service.services.github_client import GITHUB_API_URL, GitHubClient, shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,40 +15,28 @@ logger = logging.getLogger(__name__)
 class GitHubService:
     """Service for interacting with GitHub API."""
 
-    GITHUB_API_URL = "https://api.github.com"
+    GITHUB_API_URL = GITHUB_API_URL
 
-    def __init__(self, token: str | None = None):
+    def __init__(self, token: str | None = None, client: GitHubClient | None = None):
         """
         Initialize GitHub service.
 
         Args:
             token: GitHub API token (personal access token or GitHub App token)
+            client: Client to use instead of the shared client for the token
         """
         self.token = token or settings.github_token
-        self._client: httpx.AsyncClient | None = None
+        self._client = client
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with auth headers."""
+    async def _get_client(self) -> GitHubClient:
+        """Get the HTTP client, sharing its cache and rate limits process-wide."""
         if self._client is None:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
-
-            self._client = httpx.AsyncClient(
-                base_url=self.GITHUB_API_URL,
-                headers=headers,
-                timeout=30.0,
-            )
+            self._client = shared_client(self.token)
         return self._client
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the client; shared clients stay open for reuse."""
+        self._client = None
 
     async def get_pr_files(
         self,
@@ -98,6 +87,7 @@ class GitHubService:
         repo: str,
         path: str,
         ref: str = "main",
+        sha: str | None = None,
     ) -> str | None:
         """
         Get content of a file from a repository.
@@ -107,11 +97,14 @@ class GitHubService:
             repo: Repository name
             path: File path within repository
             ref: Git reference (branch, tag, or commit SHA)
+            sha: Blob SHA of the file, if known; served from cache without a request
 
         Returns:
             File content as string, or None if not found
         """
         client = await self._get_client()
+        if sha and (content := client.blobs.get(sha)) is not None:
+            return content
 
         try:
             resp = await client.get(
@@ -128,6 +121,8 @@ class GitHubService:
             # GitHub returns base64-encoded content
             if data.get("encoding") == "base64" and data.get("content"):
                 content = base64.b64decode(data["content"]).decode("utf-8")
+                if data.get("sha"):
+                    client.blobs.set(data["sha"], content)
                 return content
 
             return None
@@ -379,3 +374,93 @@ class GitHubService:
         resp.raise_for_status()
 
         return resp.json()
+
+    async def list_org_repositories(self, org: str) -> list[dict[str, Any]]:
+        """
+        List all repositories of an organization.
+
+        Args:
+            org: Organization login
+
+        Returns:
+            List of repository objects, sorted by full name
+        """
+        client = await self._get_client()
+
+        repos = []
+        page = 1
+        per_page = 100
+
+        while True:
+            resp = await client.get(
+                f"/orgs/{org}/repos",
+                params={"type": "all", "page": page, "per_page": per_page},
+            )
+            resp.raise_for_status()
+
+            page_repos = resp.json()
+            repos.extend(page_repos)
+
+            if len(page_repos) < per_page:
+                break
+
+            page += 1
+
+        return sorted(repos, key=lambda r: r["full_name"])
+
+    async def get_tree(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+    ) -> dict[str, Any]:
+        """
+        Get the full file tree of a repository at a reference.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Git reference (branch, tag, or commit SHA)
+
+        Returns:
+            Tree object with its SHA and every entry's path, type and blob SHA
+        """
+        client = await self._get_client()
+
+        resp = await client.get(
+            f"/repos/{owner}/{repo}/git/trees/{ref}",
+            params={"recursive": 1},
+        )
+        resp.raise_for_status()
+
+        return resp.json()
+
+    async def get_blob(
+        self,
+        owner: str,
+        repo: str,
+        sha: str,
+    ) -> str | None:
+        """
+        Get content of a blob by SHA.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Blob SHA
+
+        Returns:
+            Blob content as string, or None if not found
+        """
+        client = await self._get_client()
+        if (content := client.blobs.get(sha)) is not None:
+            return content
+
+        resp = await client.get(f"/repos/{owner}/{repo}/git/blobs/{sha}")
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+
+        content = base64.b64decode(resp.json()["content"]).decode("utf-8")
+        client.blobs.set(sha, content)
+        return content
@@ -0,0 +1,350 @@
+"""Durable queue and worker pool for GitHub webhook deliveries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from contract_service.config import settings
+from contract_service.database import async_session_maker
+from contract_service.models import WebhookDelivery
+from contract_service.services.change_stream import publish_pending_changes
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict[str, Any], AsyncSession], Awaitable[dict[str, Any]]]
+
+TERMINAL_STATUSES = ("done", "superseded", "failed")
+
+# How often idle workers delete old finished deliveries
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def coalesce_key(event: str, payload: dict[str, Any]) -> tuple[str | None, str | None]:
+    """
+    Key grouping deliveries whose processing makes older ones redundant.
+
+    Returns the key and the head SHA the delivery refers to. Pull request
+    checks only matter for the latest head, so they coalesce per PR. Pushes
+    never coalesce: each syncs only the files it changed, read at its own
+    commit, so skipping one would leave its contracts unsynced.
+    """
+    repo = payload.get("repository", {})
+    full_name = f"{repo.get('owner', {}).get('login', '')}/{repo.get('name', '')}"
+    if event == "pull_request":
+        pr = payload.get("pull_request", {})
+        return f"pull_request:{full_name}#{pr.get('number')}", pr.get("head", {}).get("sha")
+    return None, None
+
+
+class WebhookQueue:
+    """
+    Stores webhook deliveries and processes them on background workers.
+
+    The table is the queue: workers claim a pending row with a conditional
+    UPDATE, so several workers or app instances never process the same
+    delivery twice. A failed delivery is retried with exponential backoff,
+    and one left ``processing`` by a crashed worker is reclaimed once its
+    heartbeat is older than the processing timeout. Outcomes are only
+    recorded while the worker's claim holds, so a reclaimed run cannot
+    overwrite the newer one. When a worker claims a delivery whose coalesce key
+    is still being processed by an older one, the older one is cancelled.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, Handler],
+        session_maker: async_sessionmaker | None = None,
+        workers: int | None = None,
+    ):
+        self.handlers = handlers
+        self.session_maker = session_maker or async_session_maker
+        self.workers = settings.webhook_workers if workers is None else workers
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._pruned_at = 0.0
+        # Coalesce key -> receipt time and task of the delivery being processed
+        self._running: dict[str, tuple[datetime, asyncio.Task]] = {}
+
+    async def enqueue(
+        self, db: AsyncSession, delivery_id: str, event: str, payload: dict[str, Any]
+    ) -> bool:
+        """
+        Store a delivery in the caller's transaction.
+
+        Returns ``False`` if the delivery ID was already received. Pending
+        deliveries with the same coalesce key are marked superseded.
+        """
+        now = datetime.utcnow()
+        key, head_sha = coalesce_key(event, payload)
+        stmt = (
+            self._insert(db)
+            .values(
+                delivery_id=delivery_id,
+                event=event,
+                action=payload.get("action"),
+                coalesce_key=key,
+                head_sha=head_sha,
+                payload=payload,
+                status="pending",
+                attempts=0,
+                received_at=now,
+                next_attempt_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["delivery_id"])
+            .returning(WebhookDelivery.delivery_id)
+        )
+        if await db.scalar(stmt) is None:
+            return False
+
+        if key:
+            await db.execute(
+                update(WebhookDelivery)
+                .where(
+                    WebhookDelivery.coalesce_key == key,
+                    WebhookDelivery.status == "pending",
+                    WebhookDelivery.delivery_id != delivery_id,
+                )
+                .values(status="superseded", completed_at=now)
+            )
+        return True
+
+    def notify(self) -> None:
+        """Wake idle workers after a delivery was committed."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the worker pool."""
+        for i in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(i)))
+
+    async def stop(self) -> None:
+        """Cancel the workers; unfinished deliveries are reclaimed later."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+
+    async def process_pending(self) -> int:
+        """Process deliveries inline until none are due; returns how many ran."""
+        processed = 0
+        while await self.process_next():
+            processed += 1
+        return processed
+
+    async def process_next(self) -> bool:
+        """Claim and process one due delivery; ``False`` if there was none."""
+        delivery = await self._claim()
+        if delivery is None:
+            return False
+
+        # Only the newest delivery per coalesce key is worth finishing
+        key = delivery.coalesce_key
+        running = self._running.get(key) if key else None
+        if running:
+            if running[0] > delivery.received_at:
+                await self._supersede(delivery)
+                return True
+            running[1].cancel()
+
+        task = asyncio.create_task(self._process(delivery))
+        if key:
+            self._running[key] = (delivery.received_at, task)
+        try:
+            await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            logger.info(f"Webhook delivery {delivery.delivery_id} superseded while processing")
+            await self._supersede(delivery)
+        finally:
+            if key and self._running.get(key, (None, None))[1] is task:
+                del self._running[key]
+        return True
+
+    async def _process(self, delivery: WebhookDelivery) -> None:
+        """Run the delivery's handler and record the outcome."""
+        handler = self.handlers.get(delivery.event)
+        heartbeat = asyncio.create_task(self._heartbeat(delivery))
+        try:
+            async with self.session_maker() as session:
+                if handler is None:
+                    result = {"status": "ignored", "event": delivery.event}
+                else:
+                    result = await handler(delivery.payload, session)
+                # Finished in the same transaction as the handler's own writes
+                finished = await session.execute(
+                    update(WebhookDelivery)
+                    .where(*self._claimed(delivery))
+                    .values(
+                        status="done",
+                        result=result,
+                        error=None,
+                        completed_at=datetime.utcnow(),
+                    )
+                )
+                if finished.rowcount != 1:
+                    # Reclaimed by another worker; its run owns the outcome
+                    await session.rollback()
+                    logger.warning(
+                        f"Webhook delivery {delivery.delivery_id} was reclaimed; "
+                        "discarding this run"
+                    )
+                    return
+                await session.commit()
+                await publish_pending_changes(session)
+        except Exception as e:
+            logger.error(f"Error processing webhook delivery {delivery.delivery_id}: {e}")
+            await self._record_failure(delivery, str(e))
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, delivery: WebhookDelivery) -> None:
+        """Keep a long-running delivery from being reclaimed as stale."""
+        interval = settings.webhook_processing_timeout_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with self.session_maker() as session:
+                    await session.execute(
+                        update(WebhookDelivery)
+                        .where(*self._claimed(delivery))
+                        .values(started_at=datetime.utcnow())
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.warning(f"Heartbeat for webhook delivery {delivery.delivery_id} failed: {e}")
+
+    @staticmethod
+    def _claimed(delivery: WebhookDelivery) -> tuple[Any, ...]:
+        """Conditions matching a delivery only while this worker's claim holds."""
+        return (
+            WebhookDelivery.delivery_id == delivery.delivery_id,
+            WebhookDelivery.status == "processing",
+            WebhookDelivery.attempts == delivery.attempts,
+        )
+
+    async def prune(self, now: datetime | None = None) -> int:
+        """Delete finished deliveries older than the retention window."""
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=settings.webhook_delivery_retention_days)
+        async with self.session_maker() as session:
+            result = await session.execute(
+                delete(WebhookDelivery).where(
+                    WebhookDelivery.status.in_(TERMINAL_STATUSES),
+                    WebhookDelivery.completed_at < cutoff,
+                )
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    async def _claim(self) -> WebhookDelivery | None:
+        """Mark the oldest due delivery as processing and return it."""
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=settings.webhook_processing_timeout_seconds)
+        async with self.session_maker() as session:
+            result = await session.execute(
+                select(WebhookDelivery)
+                .where(
+                    or_(
+                        and_(
+                            WebhookDelivery.status == "pending",
+                            WebhookDelivery.next_attempt_at <= now,
+                        ),
+                        and_(
+                            WebhookDelivery.status == "processing",
+                            WebhookDelivery.started_at < stale,
+                        ),
+                    )
+                )
+                .order_by(WebhookDelivery.received_at)
+                .limit(max(self.workers, 1) * 2)
+            )
+            for delivery in result.scalars().all():
+                # Only succeeds for the worker that still sees the row unchanged
+                claimed = await session.execute(
+                    update(WebhookDelivery)
+                    .where(
+                        WebhookDelivery.delivery_id == delivery.delivery_id,
+                        WebhookDelivery.status == delivery.status,
+                        WebhookDelivery.attempts == delivery.attempts,
+                    )
+                    .values(
+                        status="processing",
+                        attempts=delivery.attempts + 1,
+                        started_at=now,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if claimed.rowcount == 1:
+                    await session.commit()
+                    delivery.attempts += 1
+                    return delivery
+            return None
+
+    async def _supersede(self, delivery: WebhookDelivery) -> None:
+        """Mark a delivery made redundant by a newer one as superseded."""
+        async with self.session_maker() as session:
+            await session.execute(
+                update(WebhookDelivery)
+                .where(*self._claimed(delivery))
+                .values(status="superseded", completed_at=datetime.utcnow())
+            )
+            await session.commit()
+
+    async def _record_failure(self, delivery: WebhookDelivery, error: str) -> None:
+        """Schedule a retry, or give up after the maximum number of attempts."""
+        now = datetime.utcnow()
+        if delivery.attempts >= settings.webhook_max_attempts:
+            values = {"status": "failed", "error": error, "completed_at": now}
+        else:
+            backoff = settings.webhook_retry_backoff_seconds * 2 ** (delivery.attempts - 1)
+            values = {
+                "status": "pending",
+                "error": error,
+                "next_attempt_at": now + timedelta(seconds=backoff),
+            }
+        async with self.session_maker() as session:
+            await session.execute(
+                update(WebhookDelivery).where(*self._claimed(delivery)).values(**values)
+            )
+            await session.commit()
+
+    async def _worker(self, index: int) -> None:
+        """Process deliveries as they arrive, polling for retries in between."""
+        while True:
+            self._wakeup.clear()
+            try:
+                if await self.process_next():
+                    continue
+                if time.monotonic() - self._pruned_at > PRUNE_INTERVAL_SECONDS:
+                    self._pruned_at = time.monotonic()
+                    await self.prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Webhook worker {index} failed: {e}")
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), settings.webhook_poll_interval_seconds
+                )
+
+    @staticmethod
+    def _insert(db: AsyncSession) -> Any:
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(WebhookDelivery)
+        return pg_insert(WebhookDelivery)
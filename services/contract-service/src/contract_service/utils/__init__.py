@@ -1,9 +1,27 @@
 """Utility functions for Contract Service."""
 
+from contract_service.utils.json_patch import (
+    JsonPatchError,
+    apply_patch,
+    make_patch,
+)
 from contract_service.utils.yaml_parser import (
     parse_contract_yaml,
+    parse_contract_yaml_documents,
+    parse_contract_yaml_batch,
     contract_to_yaml,
+    to_contract_payload,
     ContractParseError,
 )
 
-__all__ = ["parse_contract_yaml", "contract_to_yaml", "ContractParseError"]
+__all__ = [
+    "parse_contract_yaml",
+    "parse_contract_yaml_documents",
+    "parse_contract_yaml_batch",
+    "contract_to_yaml",
+    "to_contract_payload",
+    "ContractParseError",
+    "make_patch",
+    "apply_patch",
+    "JsonPatchError",
+]
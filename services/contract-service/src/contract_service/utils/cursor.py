@@ -0,0 +1,26 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import json
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    """Cursor holding the sort key of the last row of a page."""
+    raw = json.dumps([v if v is None or isinstance(v, (int, float)) else str(v) for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Sort key values of a cursor made by ``encode_cursor``.
+
+    Raises ``ValueError`` unless the cursor holds exactly ``size`` values.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
@@ -0,0 +1,110 @@
+"""Minimal JSON Patch (RFC 6902) diff and apply for version history."""
+
+import copy
+from typing import Any
+
+
+class JsonPatchError(Exception):
+    """Raised when a patch cannot be applied to a document."""
+
+    pass
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(source: Any, target: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Compute a JSON Patch turning ``source`` into ``target``.
+
+    Objects are diffed key by key and lists element by element, with extra
+    elements added or removed at the tail. Only ``add``, ``remove`` and
+    ``replace`` operations are produced.
+    """
+    if type(source) is not type(target):
+        return [{"op": "replace", "path": path, "value": copy.deepcopy(target)}]
+
+    if isinstance(source, dict):
+        ops: list[dict[str, Any]] = []
+        for key in source:
+            child = f"{path}/{_escape(str(key))}"
+            if key not in target:
+                ops.append({"op": "remove", "path": child})
+            else:
+                ops.extend(make_patch(source[key], target[key], child))
+        for key in target:
+            if key not in source:
+                ops.append(
+                    {
+                        "op": "add",
+                        "path": f"{path}/{_escape(str(key))}",
+                        "value": copy.deepcopy(target[key]),
+                    }
+                )
+        return ops
+
+    if isinstance(source, list):
+        ops = []
+        common = min(len(source), len(target))
+        for index in range(common):
+            ops.extend(make_patch(source[index], target[index], f"{path}/{index}"))
+        # Remove from the end so earlier indexes stay valid
+        for index in range(len(source) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(common, len(target)):
+            ops.append(
+                {"op": "add", "path": f"{path}/-", "value": copy.deepcopy(target[index])}
+            )
+        return ops
+
+    if source != target:
+        return [{"op": "replace", "path": path, "value": copy.deepcopy(target)}]
+    return []
+
+
+def apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """Apply a JSON Patch to a copy of ``document`` and return the result."""
+    result = copy.deepcopy(document)
+
+    for operation in patch:
+        op = operation.get("op")
+        path = operation.get("path", "")
+        if op not in ("add", "remove", "replace"):
+            raise JsonPatchError(f"Unsupported patch operation: {op}")
+
+        if path == "":
+            if op == "remove":
+                raise JsonPatchError("Cannot remove the document root")
+            result = copy.deepcopy(operation["value"])
+            continue
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        container = result
+        try:
+            for token in parents:
+                container = container[int(token) if isinstance(container, list) else token]
+
+            if isinstance(container, list):
+                if op == "add":
+                    index = len(container) if last == "-" else int(last)
+                    container.insert(index, copy.deepcopy(operation["value"]))
+                elif op == "remove":
+                    del container[int(last)]
+                else:
+                    container[int(last)] = copy.deepcopy(operation["value"])
+            else:
+                if op == "remove":
+                    del container[last]
+                elif op == "replace" and last not in container:
+                    raise KeyError(last)
+                else:
+                    container[last] = copy.deepcopy(operation["value"])
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise JsonPatchError(f"Cannot apply {op} at {path}: {e}") from e
+
+    return result
@@ -1,9 +1,26 @@
 """YAML parser utility for contract files."""
 
+import copy
+import hashlib
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import yaml
 
+from contract_service.config import settings
+from contract_service.utils.cache import LRUCache
+
+# libyaml's loader is several times faster than the pure-Python one
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Basenames of files holding a data contract
+CONTRACT_FILE_PATTERNS = [
+    "contract.yaml",
+    "contract.yml",
+    "datapact.yaml",
+    "datapact.yml",
+]
+
 
 class ContractParseError(Exception):
     """Raised when contract YAML parsing fails."""
@@ -11,12 +28,18 @@ class ContractParseError(Exception):
     pass
 
 
+def is_contract_file(filename: str) -> bool:
+    """Check if file is a contract file."""
+    return any(filename.endswith(pattern) for pattern in CONTRACT_FILE_PATTERNS)
+
+
 def parse_contract_yaml(content: str) -> dict[str, Any]:
     """
     Parse a contract YAML string into a dictionary.
 
     Handles the transformation from YAML format to the internal
-    contract representation expected by the API.
+    contract representation expected by the API. Results are cached by
+    content hash, so the same file is only parsed once.
 
     Args:
         content: YAML content as string
@@ -27,8 +50,84 @@ def parse_contract_yaml(content: str) -> dict[str, Any]:
     Raises:
         ContractParseError: If YAML is invalid or missing required fields
     """
+    return _cached("contract", content, _parse_contract)
+
+
+def parse_contract_yaml_documents(content: str) -> list[dict[str, Any]]:
+    """
+    Parse a multi-document YAML stream of contracts.
+
+    Documents are separated by ``---``; empty documents are skipped.
+    Results are cached by content hash like ``parse_contract_yaml``.
+
+    Args:
+        content: YAML content as string
+
+    Returns:
+        List of parsed contracts in API format
+
+    Raises:
+        ContractParseError: If the YAML is invalid or a document is not an object
+    """
+    return _cached("documents", content, _parse_contract_documents)
+
+
+def parse_contract_yaml_batch(
+    contents: Sequence[str],
+) -> list[dict[str, Any] | ContractParseError]:
+    """
+    Parse many contract YAML strings.
+
+    Identical contents are parsed once, through the parse cache. An
+    invalid item does not fail the batch; its error is returned in its place.
+
+    Args:
+        contents: YAML contents as strings
+
+    Returns:
+        Parsed contract or ``ContractParseError`` for each item, in order
+    """
+    results: list[dict[str, Any] | ContractParseError] = []
+    for content in contents:
+        try:
+            results.append(parse_contract_yaml(content))
+        except ContractParseError as e:
+            results.append(e)
+    return results
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached parse results."""
+    _parse_cache.clear()
+
+
+_parse_cache = LRUCache(settings.yaml_parse_cache_max_entries)
+
+
+def _cached(kind: str, content: str, parse: Callable[[str], Any]) -> Any:
+    """
+    Parse ``content`` through the cache.
+
+    Callers get their own copy, since they commonly modify the result.
+    Parse errors are cached as well, so invalid files are not re-parsed.
+    """
+    key = f"{kind}:{hashlib.sha256(content.encode()).hexdigest()}"
+    result = _parse_cache.get(key)
+    if result is None:
+        try:
+            result = parse(content)
+        except ContractParseError as e:
+            result = e
+        _parse_cache.set(key, result)
+
+    if isinstance(result, ContractParseError):
+        raise ContractParseError(str(result))
+    return copy.deepcopy(result)
+
+
+def _parse_contract(content: str) -> dict[str, Any]:
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ContractParseError(f"Invalid YAML: {e}")
 
@@ -39,6 +138,56 @@ def parse_contract_yaml(content: str) -> dict[str, Any]:
     return _transform_contract(data)
 
 
+def _parse_contract_documents(content: str) -> list[dict[str, Any]]:
+    try:
+        documents = [
+            doc for doc in yaml.load_all(content, Loader=SafeLoader) if doc is not None
+        ]
+    except yaml.YAMLError as e:
+        raise ContractParseError(f"Invalid YAML: {e}") from e
+
+    contracts = []
+    for i, data in enumerate(documents):
+        if not isinstance(data, dict):
+            raise ContractParseError(f"Document {i} must be a YAML object")
+        contracts.append(_transform_contract(data))
+    return contracts
+
+
+def to_contract_payload(contract: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a parsed contract into the request body accepted by the API.
+
+    ``parse_contract_yaml`` flattens publisher fields and uses ``fields``;
+    the create/update schemas expect a nested ``publisher`` and ``schema``.
+
+    Args:
+        contract: Contract data as returned by ``parse_contract_yaml``
+
+    Returns:
+        Dictionary that validates as ``ContractCreate``
+    """
+    payload: dict[str, Any] = {
+        "name": contract.get("name"),
+        "version": contract.get("version"),
+        "description": contract.get("description"),
+        "status": contract.get("status", "active"),
+        "publisher": {
+            "team": contract.get("publisher_team"),
+            "owner": contract.get("publisher_owner"),
+            "repository_url": contract.get("repository_url"),
+            "contact_email": contract.get("contact_email"),
+        },
+        "schema": contract.get("fields", []),
+        "quality": contract.get("quality_metrics", []),
+        "access": contract.get("access_config"),
+        "subscribers": contract.get("subscribers", []),
+        "tags": contract.get("tags", []),
+        "metadata": contract.get("metadata", {}),
+    }
+    return {k: v for k, v in payload.items() if v is not None}
+
+
 def _transform_contract(data: dict[str, Any]) -> dict[str, Any]:
     """
     Transform contract data from YAML format to API format.
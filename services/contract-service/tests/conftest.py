@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from contract_service.main import app
 from contract_service.models import Base
-from contract_service.api.dependencies import get_db
+from contract_service.api.dependencies import get_db, get_primary_db
 
 
 # Use SQLite for testing
@@ -59,6 +59,7 @@ async def get_test_db() -> AsyncGenerator[AsyncSession, None]:
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Create async test client."""
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_primary_db] = get_test_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -0,0 +1,133 @@
+"""Tests for the organization-wide contract backfill."""
+
+import base64
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from contract_service.services.contract_backfill import (
+    ContractBackfill,
+    GitHubOrgSource,
+    LocalDirectorySource,
+    git_blob_sha,
+)
+from contract_service.services.github_client import GitHubClient
+from contract_service.services.github_service import GitHubService
+from tests.conftest import async_session_maker
+
+CONTRACT_YAML = """
+name: {name}
+version: 1.0.0
+publisher:
+  team: commerce
+  owner: orders-service
+schema:
+  - name: order_id
+    type: uuid
+    primary_key: true
+"""
+
+
+def _write(root: Path, path: str, content: str) -> None:
+    file = root / path
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(content)
+
+
+async def _backfill(source, full: bool = False):
+    async with async_session_maker() as db:
+        return await ContractBackfill(db, source, full=full).run()
+
+
+def test_git_blob_sha():
+    """Test that blob SHAs match git's (``git hash-object``)."""
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_and_skips_unchanged(client, tmp_path: Path):
+    """Test that re-runs only sync repositories and files that changed."""
+    _write(tmp_path, "orders/contract.yaml", CONTRACT_YAML.format(name="orders"))
+    _write(tmp_path, "orders/services/refunds/datapact.yml", CONTRACT_YAML.format(name="refunds"))
+    _write(tmp_path, "orders/README.md", "not a contract")
+    _write(tmp_path, "crm/contract.yaml", "name: [broken")
+    source = LocalDirectorySource(tmp_path)
+
+    report = await _backfill(source)
+    assert report.repositories == 2
+    assert report.files == 3
+    assert report.created == 2
+    assert [(e["repository"], e["path"]) for e in report.errors] == [("crm", "contract.yaml")]
+    assert (await client.get("/api/v1/contracts/name/refunds")).status_code == 200
+
+    # Synced repositories are skipped; the failed file is retried
+    report = await _backfill(source)
+    assert report.repositories_skipped == 1
+    assert report.files_fetched == 1
+    assert report.created == 0
+
+    _write(tmp_path, "crm/contract.yaml", CONTRACT_YAML.format(name="customers"))
+    _write(
+        tmp_path,
+        "orders/contract.yaml",
+        CONTRACT_YAML.format(name="orders").replace("1.0.0", "1.1.0"),
+    )
+    report = await _backfill(source)
+    assert report.errors == []
+    assert report.files_unchanged == 1
+    assert (report.files_fetched, report.created, report.updated) == (2, 1, 1)
+
+    contract = await client.get("/api/v1/contracts/name/orders")
+    assert contract.json()["version"] == "1.1.0"
+
+    report = await _backfill(source, full=True)
+    assert (report.files_fetched, report.unchanged) == (3, 3)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_backfill_github_org(client):
+    """Test syncing an org's repositories through the tree and blob APIs."""
+    respx.get("https://api.github.com/orgs/example/repos").mock(
+        return_value=httpx.Response(200, json=[
+            {
+                "full_name": "example/orders-service",
+                "html_url": "https://github.com/example/orders-service",
+                "default_branch": "main",
+            },
+            {"full_name": "example/old", "default_branch": "main", "archived": True},
+        ])
+    )
+    respx.get("https://api.github.com/repos/example/orders-service/git/trees/main").mock(
+        return_value=httpx.Response(200, json={
+            "sha": "tree1",
+            "tree": [
+                {"path": "contract.yaml", "type": "blob", "sha": "blob1"},
+                {"path": "src/app.py", "type": "blob", "sha": "blob2"},
+            ],
+        })
+    )
+    blob = respx.get(
+        "https://api.github.com/repos/example/orders-service/git/blobs/blob1"
+    ).mock(return_value=httpx.Response(200, json={
+        "content": base64.b64encode(CONTRACT_YAML.format(name="orders").encode()).decode(),
+        "encoding": "base64",
+    }))
+
+    github_client = GitHubClient(token="test-token")
+    source = GitHubOrgSource("example", GitHubService(client=github_client))
+    try:
+        report = await _backfill(source)
+        assert (report.repositories, report.files, report.created) == (1, 1, 1)
+        assert blob.call_count == 1
+
+        contract = await client.get("/api/v1/contracts/name/orders")
+        assert contract.json()["repository_url"] == "https://github.com/example/orders-service"
+
+        report = await _backfill(source)
+        assert report.repositories_skipped == 1
+        assert blob.call_count == 1
+    finally:
+        await github_client.aclose()
@@ -0,0 +1,144 @@
+"""Tests for bulk contract upsert."""
+
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+
+def _contracts(sample_contract: dict[str, Any], names: list[str]) -> list[dict[str, Any]]:
+    return [{**sample_contract, "name": name} for name in names]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_creates_contracts(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test creating several contracts in one call."""
+    response = await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        json=_contracts(sample_contract, ["test_orders", "test_customers"]),
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 2
+    assert [r["status"] for r in data["results"]] == ["created", "created"]
+    assert [r["index"] for r in data["results"]] == [0, 1]
+
+    contract = await client.get("/api/v1/contracts/name/test_customers")
+    assert contract.status_code == 200
+    assert len(contract.json()["fields"]) == 4
+    assert len(contract.json()["quality_metrics"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_updates_and_skips_unchanged(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that existing contracts are replaced only when they differ."""
+    await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        json=_contracts(sample_contract, ["test_orders", "test_customers"]),
+    )
+
+    changed = {**sample_contract, "name": "test_orders", "version": "1.1.0"}
+    changed["schema"] = sample_contract["schema"][:2]
+    response = await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        json=[changed, {**sample_contract, "name": "test_customers"}],
+    )
+    data = response.json()
+    assert data["updated"] == 1
+    assert data["unchanged"] == 1
+
+    contract = (await client.get("/api/v1/contracts/name/test_orders")).json()
+    assert contract["version"] == "1.1.0"
+    assert len(contract["fields"]) == 2
+
+    versions = await client.get(f"/api/v1/contracts/{contract['id']}/versions")
+    assert len(versions.json()) == 1
+    assert versions.json()[0]["version"] == "1.0.0"
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_rejects_invalid_items(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that nothing is written when any item is invalid."""
+    invalid = {**sample_contract, "name": "Invalid-Name"}
+    duplicate = {**sample_contract}
+    response = await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        json=[sample_contract, invalid, duplicate],
+    )
+    assert response.status_code == 422
+
+    errors = response.json()["detail"]
+    assert [e["index"] for e in errors] == [1, 2]
+
+    contract = await client.get("/api/v1/contracts/name/test_orders")
+    assert contract.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_rejects_duplicate_subscriber_teams(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that a team subscribed twice is an item error, not a failed chunk."""
+    subscriber = {"team": "analytics", "use_case": "Reporting"}
+    response = await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        json=[{**sample_contract, "subscribers": [subscriber, subscriber]}],
+    )
+    assert response.status_code == 422
+
+    errors = response.json()["detail"]
+    assert [e["index"] for e in errors] == [0]
+    assert "analytics" in errors[0]["errors"][0]["msg"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_multi_document_yaml(client: AsyncClient):
+    """Test importing multi-document YAML in contract file format."""
+    content = """
+name: orders
+version: 1.0.0
+publisher:
+  team: commerce
+  owner: orders-service
+schema:
+  - name: order_id
+    type: uuid
+    primary_key: true
+---
+name: customers
+version: 2.0.0
+publisher:
+  team: crm
+  owner: customer-service
+schema:
+  - name: customer_id
+    type: uuid
+subscribers:
+  - team: commerce
+    fields: [customer_id]
+"""
+    response = await client.post(
+        "/api/v1/contracts:bulkUpsert",
+        content=content,
+        headers={"Content-Type": "application/yaml"},
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+
+    contract = (await client.get("/api/v1/contracts/name/customers")).json()
+    assert contract["fields"][0]["data_type"] == "uuid"
+    assert contract["subscribers"][0]["team"] == "commerce"
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_requires_array(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test that a non-array JSON body is rejected."""
+    response = await client.post("/api/v1/contracts:bulkUpsert", json=sample_contract)
+    assert response.status_code == 400
@@ -0,0 +1,164 @@
+"""Tests for the contract change stream."""
+
+import asyncio
+
+import pytest
+
+from contract_service.services.change_stream import (
+    RESYNC,
+    ChangeBroadcaster,
+    format_sse,
+    matches_filters,
+    stream_changes,
+)
+
+
+def _event(seq: int, team: str = "commerce", tags: list[str] | None = None) -> dict:
+    return {
+        "seq": seq,
+        "contract_id": f"00000000-0000-0000-0000-{seq:012d}",
+        "contract_name": f"contract_{seq}",
+        "change_type": "updated",
+        "version": "1.0.0",
+        "changed_at": "2024-01-01T00:00:00",
+        "publisher_team": team,
+        "tags": tags or [],
+    }
+
+
+async def _collect(stream, count: int) -> list[str]:
+    frames = []
+    async for frame in stream:
+        frames.append(frame)
+        if len(frames) == count:
+            break
+    return frames
+
+
+def _disconnect_after(polls: int):
+    state = {"polls": 0}
+
+    async def is_disconnected() -> bool:
+        state["polls"] += 1
+        return state["polls"] > polls
+
+    return is_disconnected
+
+
+class TestChangeStreamHelpers:
+    def test_matches_filters(self):
+        """Test per-connection team, tag and contract filters."""
+        event = _event(1, team="commerce", tags=["orders"])
+
+        assert matches_filters(event)
+        assert matches_filters(event, team="commerce", tag="orders")
+        assert not matches_filters(event, team="crm")
+        assert not matches_filters(event, tag="customers")
+        assert not matches_filters(event, contract_id="other")
+
+    def test_format_sse(self):
+        """Test that the sequence number is used as the event id."""
+        frame = format_sse(_event(7))
+
+        assert frame.startswith("id: 7\nevent: updated\ndata: {")
+        assert frame.endswith("\n\n")
+
+
+class TestChangeBroadcaster:
+    @pytest.mark.asyncio
+    async def test_dispatch_fans_out(self):
+        """Test that every attached stream receives each event."""
+        broadcaster = ChangeBroadcaster()
+        try:
+            first = broadcaster.subscribe()
+            second = broadcaster.subscribe()
+            broadcaster.dispatch(_event(1))
+
+            assert first.get_nowait()["seq"] == 1
+            assert second.get_nowait()["seq"] == 1
+
+            broadcaster.unsubscribe(second)
+            assert broadcaster.subscriber_count == 1
+        finally:
+            await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_gets_resync(self):
+        """Test that a full queue is replaced by a resync marker."""
+        broadcaster = ChangeBroadcaster(queue_size=2)
+        try:
+            queue = broadcaster.subscribe()
+            for seq in range(1, 4):
+                broadcaster.dispatch(_event(seq))
+
+            assert queue.qsize() == 1
+            assert queue.get_nowait() is RESYNC
+        finally:
+            await broadcaster.stop()
+
+
+class TestStreamChanges:
+    @pytest.mark.asyncio
+    async def test_replay_then_live_without_duplicates(self):
+        """Test that live events already replayed are skipped."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for seq in (2, 3, 4):
+            queue.put_nowait(_event(seq))
+
+        async def load_since(cursor: int) -> list[dict]:
+            return []
+
+        stream = stream_changes(
+            queue,
+            replay=[_event(2), _event(3)],
+            load_since=load_since,
+            is_disconnected=_disconnect_after(10),
+            since=1,
+        )
+        frames = await _collect(stream, 3)
+
+        assert [f.split("\n")[0] for f in frames] == ["id: 2", "id: 3", "id: 4"]
+
+    @pytest.mark.asyncio
+    async def test_filters_and_heartbeat(self):
+        """Test that filtered events are dropped and idle streams get heartbeats."""
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(_event(1, team="crm"))
+        queue.put_nowait(_event(2, team="commerce"))
+
+        async def load_since(cursor: int) -> list[dict]:
+            return []
+
+        stream = stream_changes(
+            queue,
+            replay=[],
+            load_since=load_since,
+            is_disconnected=_disconnect_after(10),
+            team="commerce",
+            heartbeat_seconds=0.01,
+        )
+        frames = await _collect(stream, 2)
+
+        assert frames[0].startswith("id: 2\n")
+        assert frames[1] == ": heartbeat\n\n"
+
+    @pytest.mark.asyncio
+    async def test_resync_loads_from_cursor(self):
+        """Test that a resync marker pages missed events from the database."""
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(_event(1))
+        queue.put_nowait(RESYNC)
+        pages = {1: [_event(2), _event(3)], 3: []}
+
+        async def load_since(cursor: int) -> list[dict]:
+            return pages[cursor]
+
+        stream = stream_changes(
+            queue,
+            replay=[],
+            load_since=load_since,
+            is_disconnected=_disconnect_after(10),
+        )
+        frames = await _collect(stream, 3)
+
+        assert [f.split("\n")[0] for f in frames] == ["id: 1", "id: 2", "id: 3"]
@@ -0,0 +1,137 @@
+"""Tests for the contract change feed."""
+
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from contract_service.api.dependencies import get_db
+from contract_service.main import app
+from contract_service.services.contract_service import ContractCRUD
+from tests.conftest import async_session_maker
+
+
+@pytest.mark.asyncio
+async def test_change_feed_records_create(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test that creating a contract appends a change entry."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    response = await client.get("/api/v1/contracts/changes")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data["changes"]) == 1
+    assert data["changes"][0]["contract_id"] == contract_id
+    assert data["changes"][0]["change_type"] == "created"
+    assert data["changes"][0]["version"] == "1.0.0"
+    assert data["next_cursor"] == data["changes"][0]["seq"]
+    assert data["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_change_feed_since_cursor(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+    sample_subscriber: dict[str, Any],
+):
+    """Test that only changes after the cursor are returned, in order."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    first = await client.get("/api/v1/contracts/changes")
+    cursor = first.json()["next_cursor"]
+
+    await client.put(f"/api/v1/contracts/{contract_id}", json={"version": "1.1.0"})
+    await client.post(f"/api/v1/contracts/{contract_id}/subscribers", json=sample_subscriber)
+    await client.delete(f"/api/v1/contracts/{contract_id}")
+
+    response = await client.get("/api/v1/contracts/changes", params={"since": cursor})
+    data = response.json()
+
+    assert [c["change_type"] for c in data["changes"]] == [
+        "updated",
+        "subscriber_added",
+        "deprecated",
+    ]
+    assert data["changes"][0]["version"] == "1.1.0"
+    assert data["changes"][0]["seq"] > cursor
+
+    # Nothing newer than the last cursor
+    response = await client.get(
+        "/api/v1/contracts/changes", params={"since": data["next_cursor"]}
+    )
+    assert response.json()["changes"] == []
+    assert response.json()["next_cursor"] == data["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_change_feed_pagination(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test that limit pages through the feed."""
+    for name in ["test_orders", "test_customers", "test_products"]:
+        await client.post("/api/v1/contracts", json={**sample_contract, "name": name})
+
+    response = await client.get("/api/v1/contracts/changes", params={"limit": 2})
+    data = response.json()
+    assert len(data["changes"]) == 2
+    assert data["has_more"] is True
+
+    response = await client.get(
+        "/api/v1/contracts/changes",
+        params={"since": data["next_cursor"], "limit": 2},
+    )
+    data = response.json()
+    assert len(data["changes"]) == 1
+    assert data["changes"][0]["contract_name"] == "test_products"
+    assert data["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_change_feed_records_field_mutations(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that field add/remove is recorded."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    field_resp = await client.post(
+        f"/api/v1/contracts/{contract_id}/fields",
+        json={"name": "currency", "data_type": "string"},
+    )
+    field_id = field_resp.json()["id"]
+    await client.delete(f"/api/v1/contracts/{contract_id}/fields/{field_id}")
+
+    response = await client.get(
+        "/api/v1/contracts/changes", params={"contract_id": contract_id}
+    )
+    change_types = [c["change_type"] for c in response.json()["changes"]]
+    assert change_types == ["created", "field_added", "field_removed"]
+
+
+@pytest.mark.asyncio
+async def test_latest_change_seq(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test the cursor a live-only stream starts from."""
+    async with async_session_maker() as db:
+        assert await ContractCRUD(db).get_latest_change_seq() == 0
+
+    await client.post("/api/v1/contracts", json=sample_contract)
+    changes = (await client.get("/api/v1/contracts/changes")).json()
+
+    async with async_session_maker() as db:
+        assert await ContractCRUD(db).get_latest_change_seq() == changes["next_cursor"]
+
+
+async def _replica_db():
+    raise AssertionError("change feed read from a replica-routed session")
+    yield
+
+
+@pytest.mark.asyncio
+async def test_change_feed_reads_primary(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test that the change feed never uses the replica-routed session."""
+    await client.post("/api/v1/contracts", json=sample_contract)
+    app.dependency_overrides[get_db] = _replica_db
+
+    response = await client.get("/api/v1/contracts/changes")
+    assert response.status_code == 200
+    assert len(response.json()["changes"]) == 1
@@ -0,0 +1,115 @@
+"""Tests for compliance history partitioning and rollups."""
+
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, select
+
+from contract_service.models import ComplianceCheck, ComplianceRollup
+from contract_service.services.compliance_maintenance import (
+    ComplianceMaintenance,
+    create_partition_sql,
+    partition_ranges,
+)
+from contract_service.services.compliance_service import ComplianceCRUD
+from tests.conftest import async_session_maker
+
+
+def test_partition_ranges_monthly():
+    """Test monthly partition bounds roll over years."""
+    assert partition_ranges(date(2023, 11, 15), date(2024, 1, 1), "month") == [
+        (date(2023, 11, 1), date(2023, 12, 1)),
+        (date(2023, 12, 1), date(2024, 1, 1)),
+        (date(2024, 1, 1), date(2024, 2, 1)),
+    ]
+
+
+def test_partition_ranges_daily():
+    """Test daily partition bounds and DDL."""
+    ranges = partition_ranges(date(2024, 2, 28), date(2024, 3, 1), "day")
+    assert len(ranges) == 3
+    assert create_partition_sql(*ranges[1]) == (
+        "CREATE TABLE IF NOT EXISTS compliance_checks_p20240229 "
+        "PARTITION OF compliance_checks "
+        "FOR VALUES FROM ('2024-02-29') TO ('2024-03-01')"
+    )
+
+
+@pytest.mark.asyncio
+async def test_rollups(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test hourly and daily rollups aggregate counts and worst status."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = UUID(create_resp.json()["id"])
+
+    checks = [
+        ("pass", datetime(2024, 3, 1, 10, 5)),
+        ("fail", datetime(2024, 3, 1, 10, 40)),
+        ("pass", datetime(2024, 3, 1, 11, 15)),
+        ("warning", datetime(2024, 3, 2, 9, 0)),
+    ]
+    async with async_session_maker() as session:
+        crud = ComplianceCRUD(session)
+        for status, checked_at in checks:
+            await crud.record_check(contract_id, "schema", status, {}, checked_at=checked_at)
+
+        maintenance = ComplianceMaintenance(session)
+        summary = await maintenance.run(now=datetime(2024, 3, 2, 12, 0))
+        # Re-running is idempotent
+        await maintenance.run(now=datetime(2024, 3, 2, 12, 0))
+        await session.commit()
+
+        result = await session.execute(
+            select(ComplianceRollup).order_by(
+                ComplianceRollup.granularity, ComplianceRollup.bucket_start
+            )
+        )
+        rollups = [
+            (r.granularity, r.bucket_start, r.total_count, r.fail_count, r.worst_status)
+            for r in result.scalars()
+        ]
+
+    assert summary["partitions_created"] == []  # not PostgreSQL
+    assert rollups == [
+        ("day", datetime(2024, 3, 1), 3, 1, "fail"),
+        ("day", datetime(2024, 3, 2), 1, 0, "warning"),
+        ("hour", datetime(2024, 3, 1, 10), 2, 1, "fail"),
+        ("hour", datetime(2024, 3, 1, 11), 1, 0, "pass"),
+        ("hour", datetime(2024, 3, 2, 9), 1, 0, "warning"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_trend_falls_back_to_rollups(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that trends cover history whose raw checks were dropped."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = UUID(create_resp.json()["id"])
+
+    async with async_session_maker() as session:
+        crud = ComplianceCRUD(session)
+        await crud.record_check(
+            contract_id, "schema", "fail", {}, checked_at=datetime(2024, 3, 1, 10)
+        )
+        await crud.record_check(
+            contract_id, "schema", "pass", {}, checked_at=datetime(2024, 3, 2, 10)
+        )
+        await ComplianceMaintenance(session).run(now=datetime(2024, 3, 2, 12))
+        # Simulate the March 1 partition passing retention
+        await session.execute(
+            delete(ComplianceCheck).where(ComplianceCheck.checked_at < datetime(2024, 3, 2))
+        )
+        await session.commit()
+
+        trend = await ComplianceCRUD(session).get_trend(
+            "day", datetime(2024, 2, 28), datetime(2024, 3, 3), contract_id=contract_id
+        )
+
+    assert [(b["fail_count"], b["pass_count"]) for b in trend["buckets"]] == [
+        (1, 0),
+        (0, 1),
+    ]
+    assert trend["pass_rate"] == pytest.approx(0.5)
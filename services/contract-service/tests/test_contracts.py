@@ -96,6 +96,52 @@ async def test_list_contracts_filter_by_status(
     assert response.json()["total"] == 1
 
 
+@pytest.mark.asyncio
+async def test_list_contracts_filter_by_tags(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test filtering contracts by several tags with all/any matching."""
+    await client.post("/api/v1/contracts", json=sample_contract)
+    await client.post(
+        "/api/v1/contracts",
+        json={**sample_contract, "name": "test_customers", "tags": ["customers", "commerce"]},
+    )
+
+    response = await client.get("/api/v1/contracts", params={"tag": "commerce"})
+    assert response.json()["total"] == 2
+
+    response = await client.get("/api/v1/contracts", params={"tag": ["orders", "commerce"]})
+    assert [c["name"] for c in response.json()["contracts"]] == ["test_orders"]
+
+    response = await client.get(
+        "/api/v1/contracts",
+        params={"tag": ["orders", "customers"], "tag_match": "any"},
+    )
+    assert response.json()["total"] == 2
+
+    response = await client.get("/api/v1/contracts", params={"tag": ["orders", "customers"]})
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tag_facets(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test counting contracts per tag."""
+    await client.post("/api/v1/contracts", json=sample_contract)
+    await client.post(
+        "/api/v1/contracts",
+        json={**sample_contract, "name": "test_customers", "tags": ["customers", "commerce"]},
+    )
+
+    response = await client.get("/api/v1/contracts/tags")
+    assert response.status_code == 200
+    tags = response.json()["tags"]
+    assert tags == {"commerce": 2, "customers": 1, "orders": 1}
+    assert list(tags) == ["commerce", "customers", "orders"]
+
+    response = await client.get("/api/v1/contracts/tags", params={"tag": "orders"})
+    assert response.json()["tags"] == {"commerce": 1, "orders": 1}
+
+
 @pytest.mark.asyncio
 async def test_update_contract(client: AsyncClient, sample_contract: dict[str, Any]):
     """Test updating a contract creates a new version."""
@@ -115,6 +161,63 @@ async def test_update_contract(client: AsyncClient, sample_contract: dict[str, A
     assert response.json()["description"] == "Updated description"
 
 
+@pytest.mark.asyncio
+async def test_update_contract_applies_field_diff(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that updating fields only touches rows that changed."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    created = create_resp.json()
+    field_ids = {f["name"]: f["id"] for f in created["fields"]}
+
+    schema = [dict(f) for f in sample_contract["schema"] if f["name"] != "status"]
+    schema[2]["description"] = "Order total in cents"
+    schema.append({"name": "currency", "data_type": "string"})
+
+    response = await client.put(
+        f"/api/v1/contracts/{created['id']}",
+        json={"version": "1.1.0", "schema": schema},
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["changes"]["contract"] == ["version"]
+    assert data["changes"]["fields_added"] == ["currency"]
+    assert data["changes"]["fields_removed"] == ["status"]
+    assert data["changes"]["fields_modified"] == ["total"]
+
+    fields = {f["name"]: f for f in data["fields"]}
+    assert set(fields) == {"order_id", "customer_id", "total", "currency"}
+    assert fields["total"]["description"] == "Order total in cents"
+    # Untouched and modified fields keep their identity
+    assert fields["order_id"]["id"] == field_ids["order_id"]
+    assert fields["total"]["id"] == field_ids["total"]
+
+
+@pytest.mark.asyncio
+async def test_update_contract_noop_skips_version(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that an update matching the stored state writes nothing."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    response = await client.put(
+        f"/api/v1/contracts/{contract_id}",
+        json={
+            "version": "1.0.0",
+            "schema": sample_contract["schema"],
+            "quality": sample_contract["quality"],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["changes"]["contract"] == []
+    assert response.json()["changes"]["fields_modified"] == []
+
+    versions = await client.get(f"/api/v1/contracts/{contract_id}/versions")
+    assert versions.json() == []
+
+
 @pytest.mark.asyncio
 async def test_deprecate_contract(client: AsyncClient, sample_contract: dict[str, Any]):
     """Test deprecating a contract (soft delete)."""
@@ -153,6 +256,50 @@ async def test_contract_versions(client: AsyncClient, sample_contract: dict[str,
     assert response.status_code == 200
     versions = response.json()
     assert len(versions) == 2  # Two updates = two version snapshots
+    assert [v["sequence"] for v in versions] == [2, 1]
+    assert "contract_snapshot" not in versions[0]
+
+    # Pagination
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/versions", params={"skip": 1, "limit": 1}
+    )
+    assert [v["version"] for v in response.json()] == ["1.0.0"]
+
+
+@pytest.mark.asyncio
+async def test_contract_version_reconstruction(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that delta-encoded versions reconstruct the historical snapshot."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    schema = list(sample_contract["schema"])
+    for minor in range(1, 4):
+        schema = schema + [{"name": f"extra_{minor}", "data_type": "string"}]
+        await client.put(
+            f"/api/v1/contracts/{contract_id}",
+            json={"version": f"1.{minor}.0", "schema": schema},
+        )
+
+    versions = (await client.get(f"/api/v1/contracts/{contract_id}/versions")).json()
+    assert [v["is_keyframe"] for v in versions] == [False, False, True]
+
+    # Newest entry holds the state before the last update
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/versions/{versions[0]['id']}"
+    )
+    assert response.status_code == 200
+    snapshot = response.json()["contract_snapshot"]
+    assert snapshot["version"] == "1.2.0"
+    names = {f["name"] for f in snapshot["fields"]}
+    assert {"extra_1", "extra_2"} <= names
+    assert "extra_3" not in names
+
+    missing = await client.get(
+        f"/api/v1/contracts/{contract_id}/versions/00000000-0000-0000-0000-000000000000"
+    )
+    assert missing.status_code == 404
 
 
 @pytest.mark.asyncio
@@ -162,3 +309,37 @@ async def test_health_endpoint(client: AsyncClient):
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
     assert response.json()["service"] == "contract-service"
+
+
+@pytest.mark.asyncio
+async def test_batch_get_contracts(client: AsyncClient, sample_contract: dict[str, Any]):
+    """Test fetching several contracts by ID and name in one call."""
+    orders = (await client.post("/api/v1/contracts", json=sample_contract)).json()
+    await client.post(
+        "/api/v1/contracts", json={**sample_contract, "name": "test_customers"}
+    )
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    response = await client.post(
+        "/api/v1/contracts:batchGet",
+        json={
+            "ids": [orders["id"], missing_id],
+            "names": ["test_customers", "test_unknown"],
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["contracts"]) == {orders["id"], "test_customers"}
+    assert data["contracts"]["test_customers"]["name"] == "test_customers"
+    assert len(data["contracts"][orders["id"]]["fields"]) == 4
+    assert data["not_found"] == [missing_id, "test_unknown"]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_contracts_limit(client: AsyncClient):
+    """Test that oversized batch requests are rejected."""
+    response = await client.post(
+        "/api/v1/contracts:batchGet",
+        json={"names": [f"contract_{i}" for i in range(501)]},
+    )
+    assert response.status_code == 413
@@ -0,0 +1,112 @@
+"""Tests for the cross-contract field catalog."""
+
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.fixture
+async def catalog_contracts(client: AsyncClient, sample_contract: dict[str, Any]) -> None:
+    """Two contracts from different teams sharing some field names."""
+    await client.post("/api/v1/contracts", json=sample_contract)
+    await client.post(
+        "/api/v1/contracts",
+        json={
+            "name": "test_customers",
+            "version": "1.0.0",
+            "publisher": {"team": "crm", "owner": "crm-service"},
+            "schema": [
+                {"name": "customer_id", "data_type": "uuid", "is_primary_key": True},
+                {"name": "customer_email", "data_type": "string", "is_pii": True},
+                {"name": "full_name", "data_type": "string", "is_pii": True},
+            ],
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_field_catalog_filters(client: AsyncClient, catalog_contracts: None):
+    """Test filtering catalog fields by name, type, PII flag and team."""
+    response = await client.get("/api/v1/fields", params={"name": "customer_id"})
+    assert response.status_code == 200
+    fields = response.json()["fields"]
+    assert {f["contract_name"] for f in fields} == {"test_orders", "test_customers"}
+
+    response = await client.get(
+        "/api/v1/fields", params={"name": "customer_", "match": "prefix"}
+    )
+    assert [f["name"] for f in response.json()["fields"]] == [
+        "customer_email",
+        "customer_id",
+        "customer_id",
+    ]
+
+    response = await client.get("/api/v1/fields", params={"name": "NAME", "match": "fuzzy"})
+    assert [f["name"] for f in response.json()["fields"]] == ["full_name"]
+
+    response = await client.get("/api/v1/fields", params={"data_type": "uuid"})
+    assert len(response.json()["fields"]) == 3
+
+    response = await client.get("/api/v1/fields", params={"is_pii": True})
+    assert [f["name"] for f in response.json()["fields"]] == ["customer_email", "full_name"]
+
+    response = await client.get(
+        "/api/v1/fields", params={"publisher_team": "commerce", "data_type": "uuid"}
+    )
+    fields = response.json()["fields"]
+    assert [f["name"] for f in fields] == ["customer_id", "order_id"]
+    assert all(f["publisher_team"] == "commerce" for f in fields)
+
+
+@pytest.mark.asyncio
+async def test_field_catalog_prefix_is_literal(client: AsyncClient, catalog_contracts: None):
+    """Test that LIKE wildcards in a prefix are matched literally."""
+    response = await client.get("/api/v1/fields", params={"name": "%", "match": "prefix"})
+    assert response.json()["fields"] == []
+
+
+@pytest.mark.asyncio
+async def test_field_catalog_keyset_pagination(client: AsyncClient, catalog_contracts: None):
+    """Test walking the catalog page by page."""
+    names = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/fields", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["fields"]) <= 2
+        names += [f["name"] for f in data["fields"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(names) == 7
+    assert names == sorted(names)
+
+    response = await client.get("/api/v1/fields", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_field_catalog_fuzzy_ranked_by_similarity(
+    client: AsyncClient, catalog_contracts: None
+):
+    """Test that fuzzy matches come best first, across pages."""
+    names = []
+    cursor = None
+    while True:
+        params = {"name": "id", "match": "fuzzy", "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        data = (await client.get("/api/v1/fields", params=params)).json()
+        names += [f["name"] for f in data["fields"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    # The closer match outranks names that sort before it
+    assert names == ["order_id", "customer_id", "customer_id"]
@@ -1,11 +1,15 @@
 """Tests for GitHub service."""
 
 import base64
+import gzip
+import time
 
 import pytest
 import respx
 import httpx
 
+from contract_service.config import settings
+from contract_service.services.github_client import GitHubClient, RateLimiter
 from contract_service.services.github_service import GitHubService
 
 
@@ -228,3 +232,130 @@ class TestGitHubService:
         # The auth header is set when the client is created
         # We can verify this by checking the token is stored
         assert github.token == "test-token"
+
+
+class TestGitHubClient:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_conditional_request_served_from_cache(self):
+        """Test that a 304 revalidation returns the cached response."""
+        route = respx.get("https://api.github.com/repos/owner/repo/pulls/42/files")
+        route.side_effect = [
+            httpx.Response(200, json=[{"filename": "a.py"}], headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        client = GitHubClient(token="test-token")
+        github = GitHubService(client=client)
+        try:
+            first = await github.get_pr_files("owner", "repo", 42)
+            second = await github.get_pr_files("owner", "repo", 42)
+
+            assert first == second == [{"filename": "a.py"}]
+            assert "if-none-match" not in route.calls[0].request.headers
+            assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        finally:
+            await client.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_compressed_response_served_from_cache(self):
+        """Test that a cached gzip response is replayed decoded after a 304."""
+        body = gzip.compress(b'[{"filename": "a.py"}]')
+        route = respx.get("https://api.github.com/repos/owner/repo/pulls/42/files")
+        route.side_effect = [
+            httpx.Response(
+                200,
+                content=body,
+                headers={
+                    "ETag": '"v1"',
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                    "Content-Length": str(len(body)),
+                },
+            ),
+            httpx.Response(304),
+        ]
+
+        client = GitHubClient(token="test-token")
+        github = GitHubService(client=client)
+        try:
+            first = await github.get_pr_files("owner", "repo", 42)
+            second = await github.get_pr_files("owner", "repo", 42)
+
+            assert first == second == [{"filename": "a.py"}]
+        finally:
+            await client.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_file_content_cached_by_blob_sha(self):
+        """Test that content with a known blob SHA is not fetched again."""
+        route = respx.get(
+            "https://api.github.com/repos/owner/repo/contents/contract.yaml"
+        ).mock(return_value=httpx.Response(200, json={
+            "content": base64.b64encode(b"name: test").decode(),
+            "encoding": "base64",
+            "sha": "blob123",
+        }))
+
+        client = GitHubClient(token="test-token")
+        github = GitHubService(client=client)
+        try:
+            assert await github.get_file_content("owner", "repo", "contract.yaml") == "name: test"
+            assert (
+                await github.get_file_content(
+                    "owner", "repo", "contract.yaml", ref="feature", sha="blob123"
+                )
+                == "name: test"
+            )
+            assert route.call_count == 1
+        finally:
+            await client.aclose()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_retried(self, monkeypatch):
+        """Test that a 429 with Retry-After is retried after waiting."""
+        monkeypatch.setattr(settings, "github_max_retries", 1)
+        route = respx.get("https://api.github.com/repos/owner/repo")
+        route.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"full_name": "owner/repo"}),
+        ]
+
+        client = GitHubClient(token="test-token")
+        github = GitHubService(client=client)
+        try:
+            result = await github.get_repository("owner", "repo")
+            assert result["full_name"] == "owner/repo"
+            assert route.call_count == 2
+        finally:
+            await client.aclose()
+
+    def test_rate_limiter_paces_low_quota(self):
+        """Test that pacing follows the remaining quota."""
+        limiter = RateLimiter(max_per_second=10, reserve=100)
+        reset = str(int(time.time()) + 1000)
+
+        limiter.update(httpx.Headers({
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "4000",
+            "x-ratelimit-reset": reset,
+        }))
+        assert limiter.rate == 10
+
+        limiter.update(httpx.Headers({
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "600",
+            "x-ratelimit-reset": reset,
+        }))
+        assert limiter.rate == pytest.approx(0.5, rel=0.05)
+        assert limiter.blocked_until == 0
+
+        limiter.update(httpx.Headers({
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "50",
+            "x-ratelimit-reset": reset,
+        }))
+        assert limiter.blocked_until == float(reset)
@@ -0,0 +1,122 @@
+"""Tests for Idempotency-Key support on write requests."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from contract_service.api.idempotency import idempotency_store, request_hash, storage_key
+from contract_service.models import IdempotencyKey
+from tests.conftest import async_session_maker
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    """Idempotency store backed by the test database."""
+    monkeypatch.setattr(idempotency_store, "session_maker", async_session_maker)
+    return idempotency_store
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_response(
+    client: AsyncClient, sample_contract: dict[str, Any], sample_subscriber: dict[str, Any]
+):
+    """Test that a retried write returns the stored response without re-running."""
+    headers = {"Idempotency-Key": "create-orders"}
+    first = await client.post("/api/v1/contracts", json=sample_contract, headers=headers)
+    assert first.status_code == 201
+    assert "idempotent-replayed" not in first.headers
+
+    retry = await client.post("/api/v1/contracts", json=sample_contract, headers=headers)
+    assert retry.status_code == 201
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+    contract_id = first.json()["id"]
+    headers = {"Idempotency-Key": "subscribe-analytics"}
+    for _ in range(2):
+        response = await client.post(
+            f"/api/v1/contracts/{contract_id}/subscribers",
+            json=sample_subscriber,
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    contract = await client.get(f"/api/v1/contracts/{contract_id}")
+    assert len(contract.json()["subscribers"]) == 1
+
+    # Without a key, the same request runs again
+    duplicate = await client.post("/api/v1/contracts", json=sample_contract)
+    assert duplicate.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_different_request(
+    client: AsyncClient, sample_contract: dict[str, Any]
+):
+    """Test that a key cannot be reused with a different body."""
+    headers = {"Idempotency-Key": "key-1"}
+    await client.post("/api/v1/contracts", json=sample_contract, headers=headers)
+
+    response = await client.post(
+        "/api/v1/contracts", json={**sample_contract, "name": "other"}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_key_scoped_to_endpoint_and_caller(
+    client: AsyncClient, sample_contract: dict[str, Any], sample_subscriber: dict[str, Any]
+):
+    """Test that the same key on another endpoint or from another caller is independent."""
+    created = await client.post(
+        "/api/v1/contracts", json=sample_contract, headers={"Idempotency-Key": "key-1"}
+    )
+    assert created.status_code == 201
+
+    response = await client.post(
+        f"/api/v1/contracts/{created.json()['id']}/subscribers",
+        json=sample_subscriber,
+        headers={"Idempotency-Key": "key-1"},
+    )
+    assert response.status_code == 201
+    assert "idempotent-replayed" not in response.headers
+
+    response = await client.post(
+        "/api/v1/contracts",
+        json={**sample_contract, "name": "other"},
+        headers={"Idempotency-Key": "key-1", "Authorization": "Bearer other-client"},
+    )
+    assert response.status_code == 201
+    assert response.json()["name"] == "other"
+
+
+@pytest.mark.asyncio
+async def test_key_in_progress_and_expired(
+    client: AsyncClient, store, sample_contract: dict[str, Any]
+):
+    """Test that a running request's key conflicts and an expired one is reused."""
+    scope = {"method": "POST", "path": "/api/v1/contracts", "query_string": b"", "headers": []}
+    body = b'{"name": "test_orders"}'
+    assert await store.reserve(storage_key(scope, "key-1"), request_hash(scope, body)) is None
+
+    response = await client.post(
+        "/api/v1/contracts",
+        content=body,
+        headers={"Idempotency-Key": "key-1", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 409
+
+    async with async_session_maker() as session:
+        await session.execute(
+            update(IdempotencyKey).values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    response = await client.post(
+        "/api/v1/contracts", json=sample_contract, headers={"Idempotency-Key": "key-1"}
+    )
+    assert response.status_code == 201
+    assert await store.prune() == 0
@@ -0,0 +1,42 @@
+"""Tests for JSON Patch utility."""
+
+import pytest
+
+from contract_service.utils.json_patch import JsonPatchError, apply_patch, make_patch
+
+
+class TestJsonPatch:
+    def test_round_trip_nested_changes(self):
+        """Test that applying a generated patch reproduces the target."""
+        source = {
+            "name": "orders",
+            "tags": ["a", "b", "c"],
+            "fields": [{"name": "id", "nullable": False}, {"name": "total"}],
+            "access_config": None,
+        }
+        target = {
+            "name": "orders",
+            "tags": ["a"],
+            "fields": [
+                {"name": "id", "nullable": True},
+                {"name": "total"},
+                {"name": "currency"},
+            ],
+            "access_config": {"auth_type": "oauth2"},
+            "owner/team": "x~y",
+        }
+
+        patch = make_patch(source, target)
+
+        assert apply_patch(source, patch) == target
+        assert source["tags"] == ["a", "b", "c"]  # input is not mutated
+
+    def test_identical_documents_produce_empty_patch(self):
+        """Test that no operations are generated for equal documents."""
+        doc = {"a": [1, {"b": 2}]}
+        assert make_patch(doc, {"a": [1, {"b": 2}]}) == []
+
+    def test_invalid_path_raises(self):
+        """Test that a patch that does not fit the document is rejected."""
+        with pytest.raises(JsonPatchError):
+            apply_patch({"a": 1}, [{"op": "remove", "path": "/missing"}])
@@ -0,0 +1,105 @@
+"""Tests for read-replica session routing."""
+
+import time
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from contract_service.database import PRIMARY_COOKIE, ReplicaRouter
+
+
+def _request(
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    path: str = "/api/v1/contracts",
+) -> Request:
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request(
+        {"type": "http", "method": method, "path": path, "query_string": b"", "headers": raw_headers}
+    )
+
+
+class _FakeSessionMaker:
+    """Stands in for a replica session factory reporting a fixed lag."""
+
+    def __init__(self, lag: float | None):
+        self.lag = lag
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        if self.lag is None:
+            raise ConnectionError("replica down")
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get_bind(self):
+        return self
+
+    @property
+    def dialect(self):
+        return self
+
+    name = "postgresql"
+
+    async def scalar(self, statement):
+        return self.lag
+
+
+PRIMARY = object()
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_and_writes_use_primary():
+    """Test that GETs go to a healthy replica and writes never do."""
+    replica = _FakeSessionMaker(lag=0.5)
+    router = ReplicaRouter(PRIMARY, replica, max_lag_seconds=5)
+
+    assert await router.session_maker_for(_request("GET")) is replica
+    assert await router.session_maker_for(_request("POST")) is PRIMARY
+    batch_get = _request("POST", path="/api/v1/contracts:batchGet")
+    assert await router.session_maker_for(batch_get) is replica
+    assert (
+        await router.session_maker_for(_request("GET", {"X-Read-Consistency": "primary"}))
+        is PRIMARY
+    )
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_when_replica_lags_or_is_down():
+    """Test fallback to the primary on replication lag or replica failure."""
+    lagging = ReplicaRouter(PRIMARY, _FakeSessionMaker(lag=30.0), max_lag_seconds=5)
+    down = ReplicaRouter(PRIMARY, _FakeSessionMaker(lag=None), max_lag_seconds=5)
+
+    assert await lagging.session_maker_for(_request("GET")) is PRIMARY
+    assert await down.session_maker_for(_request("GET")) is PRIMARY
+
+
+@pytest.mark.asyncio
+async def test_reads_stick_to_primary_after_write():
+    """Test read-your-writes stickiness via the write cookie."""
+    replica = _FakeSessionMaker(lag=0.0)
+    router = ReplicaRouter(PRIMARY, replica, sticky_seconds=5)
+
+    response = Response()
+    router.mark_write(response)
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{PRIMARY_COOKIE}=")
+
+    value = cookie.split(";")[0].split("=", 1)[1]
+    sticky = _request("GET", {"Cookie": f"{PRIMARY_COOKIE}={value}"})
+    assert await router.session_maker_for(sticky) is PRIMARY
+
+    expired = _request("GET", {"Cookie": f"{PRIMARY_COOKIE}={time.time() - 1:.3f}"})
+    assert await router.session_maker_for(expired) is replica
+
+
+def test_no_replica_configured():
+    """Test that nothing is marked when no replica is configured."""
+    response = Response()
+    ReplicaRouter(PRIMARY).mark_write(response)
+    assert "set-cookie" not in response.headers
@@ -105,3 +105,59 @@ async def test_duplicate_subscriber_rejected(
         json=sample_subscriber,
     )
     assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_field_impact(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+    sample_subscriber: dict[str, Any],
+):
+    """Test finding the subscribers affected by changing some fields."""
+    sample_contract["subscribers"] = [
+        {"team": "finance", "fields_used": ["order_id", "customer_id"]},
+    ]
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+    await client.post(
+        f"/api/v1/contracts/{contract_id}/subscribers",
+        json=sample_subscriber,
+    )
+
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/impact",
+        params={"fields": ["order_id", "total"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["teams"] == ["analytics", "finance"]
+    affected = {s["team"]: s["affected_fields"] for s in data["subscribers"]}
+    assert affected == {"analytics": ["order_id", "total"], "finance": ["order_id"]}
+
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/impact",
+        params={"fields": ["customer_id"]},
+    )
+    assert response.json()["teams"] == ["finance"]
+
+    # Re-publishing the subscription through bulk upsert refreshes the index
+    sample_contract["version"] = "1.1.0"
+    sample_contract["subscribers"] = [{"team": "finance", "fields_used": ["status"]}]
+    await client.post("/api/v1/contracts:bulkUpsert", json=[sample_contract])
+
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/impact",
+        params={"fields": ["customer_id", "status"]},
+    )
+    affected = {s["team"]: s["affected_fields"] for s in response.json()["subscribers"]}
+    assert affected == {"analytics": ["status"], "finance": ["status"]}
+
+
+@pytest.mark.asyncio
+async def test_field_impact_unknown_contract(client: AsyncClient):
+    """Test impact analysis for a contract that does not exist."""
+    response = await client.get(
+        "/api/v1/contracts/00000000-0000-0000-0000-000000000000/impact",
+        params={"fields": ["order_id"]},
+    )
+    assert response.status_code == 404
@@ -46,3 +46,163 @@ async def test_validate_contract_placeholder(
     response = await client.post(f"/api/v1/contracts/{contract_id}/validate")
     assert response.status_code == 200
     assert response.json()["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_compliance_state_tracks_latest_status(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+):
+    """Test that recorded checks maintain the latest state and streaks."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+
+    for check_status in ["pass", "fail", "fail"]:
+        await client.post(
+            f"/api/v1/contracts/{contract_id}/compliance",
+            json={"check_type": "schema", "status": check_status},
+        )
+    await client.post(
+        f"/api/v1/contracts/{contract_id}/compliance",
+        json={"check_type": "freshness", "status": "pass"},
+    )
+
+    response = await client.get(f"/api/v1/contracts/{contract_id}/compliance/state")
+    assert response.status_code == 200
+    states = {s["check_type"]: s for s in response.json()}
+    assert states["schema"]["status"] == "fail"
+    assert states["schema"]["previous_status"] == "pass"
+    assert states["schema"]["streak"] == 2
+    assert states["schema"]["total_checks"] == 3
+    assert states["schema"]["failure_count"] == 2
+    assert states["freshness"]["streak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fleet_health(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+):
+    """Test the fleet health summary reads current state across contracts."""
+    failing = await client.post("/api/v1/contracts", json=sample_contract)
+    healthy = await client.post(
+        "/api/v1/contracts", json={**sample_contract, "name": "test_customers"}
+    )
+
+    await client.post(
+        f"/api/v1/contracts/{failing.json()['id']}/compliance",
+        json={"check_type": "schema", "status": "fail", "error_message": "Missing column"},
+    )
+    await client.post(
+        f"/api/v1/contracts/{failing.json()['id']}/compliance",
+        json={"check_type": "freshness", "status": "pass"},
+    )
+    await client.post(
+        f"/api/v1/contracts/{healthy.json()['id']}/compliance",
+        json={"check_type": "schema", "status": "pass"},
+    )
+
+    response = await client.get("/api/v1/contracts/compliance/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["checks_by_status"] == {"fail": 1, "pass": 2}
+    assert data["contracts_by_status"] == {"fail": 1, "pass": 1}
+    assert data["total_entries"] == 1
+    assert data["entries"][0]["contract_name"] == "test_orders"
+    assert data["entries"][0]["error_message"] == "Missing column"
+
+    response = await client.get(
+        "/api/v1/contracts/compliance/health",
+        params={"status": "pass", "check_type": "schema"},
+    )
+    assert [e["contract_name"] for e in response.json()["entries"]] == ["test_customers"]
+
+
+async def _record_checks(
+    client: AsyncClient, contract_id: str, statuses: list[str], check_type: str = "schema"
+) -> None:
+    for check_status in statuses:
+        await client.post(
+            f"/api/v1/contracts/{contract_id}/compliance",
+            json={"check_type": check_type, "status": check_status},
+        )
+
+
+@pytest.mark.asyncio
+async def test_compliance_history_keyset_pagination(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+):
+    """Test paging through raw compliance checks with a cursor."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+    await _record_checks(client, contract_id, ["pass", "fail", "pass", "pass", "fail"])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(
+            f"/api/v1/contracts/{contract_id}/compliance", params=params
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(check["id"] for check in page["checks"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/compliance", params={"status": "fail"}
+    )
+    assert [c["status"] for c in response.json()["checks"]] == ["fail", "fail"]
+
+    response = await client.get(
+        f"/api/v1/contracts/{contract_id}/compliance", params={"cursor": "bogus"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_compliance_trend(
+    client: AsyncClient,
+    sample_contract: dict[str, Any],
+):
+    """Test bucketed counts, pass rate and MTTR, and conditional requests."""
+    create_resp = await client.post("/api/v1/contracts", json=sample_contract)
+    contract_id = create_resp.json()["id"]
+    await _record_checks(client, contract_id, ["pass", "fail", "error", "pass", "pass"])
+
+    response = await client.get(f"/api/v1/contracts/{contract_id}/compliance/trend")
+    assert response.status_code == 200
+    assert "max-age" in response.headers["cache-control"]
+    data = response.json()
+    assert data["bucket"] == "day"
+    assert len(data["buckets"]) == 1
+    assert data["buckets"][0]["total_count"] == 5
+    assert data["fail_count"] == 1
+    assert data["error_count"] == 1
+    assert data["pass_rate"] == pytest.approx(0.6)
+    assert data["incidents"] == 1
+    assert data["mttr_seconds"] >= 0
+
+    cached = await client.get(
+        f"/api/v1/contracts/{contract_id}/compliance/trend",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+    fleet = await client.get(
+        "/api/v1/contracts/compliance/trend", params={"bucket": "hour"}
+    )
+    assert fleet.status_code == 200
+    assert fleet.json()["total_count"] == 5
+
+    too_many = await client.get(
+        "/api/v1/contracts/compliance/trend",
+        params={"bucket": "hour", "since": "2000-01-01T00:00:00"},
+    )
+    assert too_many.status_code == 400
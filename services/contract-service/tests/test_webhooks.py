@@ -1,5 +1,6 @@
 """Tests for GitHub webhook handlers."""
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -11,6 +12,10 @@ from httpx import ASGITransport, AsyncClient
 
 from contract_service.main import app
 from contract_service.config import settings
+from contract_service.api.routes.webhooks import check_results, webhook_queue
+from contract_service.models import WebhookDelivery
+from contract_service.services.webhook_queue import WebhookQueue
+from tests.conftest import async_session_maker
 
 
 @pytest.fixture
@@ -83,6 +88,27 @@ schema:
 """
 
 
+@pytest.fixture
+def queue(monkeypatch):
+    """Webhook queue backed by the test database."""
+    monkeypatch.setattr(webhook_queue, "session_maker", async_session_maker)
+    check_results.clear()
+    return webhook_queue
+
+
+async def _process(client: AsyncClient, response: httpx.Response) -> dict:
+    """Run a queued delivery and return its processing result."""
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    assert await webhook_queue.process_pending() == 1
+
+    delivery_id = response.json()["delivery_id"]
+    delivery = await client.get(f"/api/v1/webhooks/github/deliveries/{delivery_id}")
+    assert delivery.status_code == 200
+    assert delivery.json()["status"] == "done"
+    return delivery.json()["result"]
+
+
 def _create_signature(payload: bytes, secret: str) -> str:
     """Create webhook signature."""
     sig = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
@@ -147,7 +173,7 @@ class TestWebhookHandler:
 
     @respx.mock
     @pytest.mark.asyncio
-    async def test_pr_no_schema_changes(self, pr_webhook_payload):
+    async def test_pr_no_schema_changes(self, client, queue, pr_webhook_payload):
         """Test PR with no schema changes passes."""
         # Mock GitHub API - PR files
         respx.get(
@@ -162,24 +188,21 @@ class TestWebhookHandler:
             "https://api.github.com/repos/example/orders-service/check-runs"
         ).mock(return_value=httpx.Response(201, json={"id": 1}))
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/v1/webhooks/github",
-                json=pr_webhook_payload,
-                headers={"X-GitHub-Event": "pull_request"},
-            )
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "approved"
-            assert data["reason"] == "no_schema_changes"
+        data = await _process(client, response)
+        assert data["status"] == "approved"
+        assert data["reason"] == "no_schema_changes"
 
     @respx.mock
     @pytest.mark.asyncio
-    async def test_pr_schema_change_without_contract(self, pr_webhook_payload):
+    async def test_pr_schema_change_without_contract(
+        self, client, queue, pr_webhook_payload
+    ):
         """Test PR with schema changes but no contract update is blocked."""
         # Mock GitHub API - PR files with schema change
         respx.get(
@@ -193,24 +216,21 @@ class TestWebhookHandler:
             "https://api.github.com/repos/example/orders-service/check-runs"
         ).mock(return_value=httpx.Response(201, json={"id": 1}))
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/v1/webhooks/github",
-                json=pr_webhook_payload,
-                headers={"X-GitHub-Event": "pull_request"},
-            )
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "blocked"
-            assert data["reason"] == "missing_contract_update"
+        data = await _process(client, response)
+        assert data["status"] == "blocked"
+        assert data["reason"] == "missing_contract_update"
 
     @respx.mock
     @pytest.mark.asyncio
-    async def test_pr_schema_and_contract_change(self, pr_webhook_payload, sample_contract_yaml):
+    async def test_pr_schema_and_contract_change(
+        self, client, queue, pr_webhook_payload, sample_contract_yaml
+    ):
         """Test PR with both schema and contract changes passes validation."""
         # Mock GitHub API - PR files
         respx.get(
@@ -235,19 +255,14 @@ class TestWebhookHandler:
             "https://api.github.com/repos/example/orders-service/check-runs"
         ).mock(return_value=httpx.Response(201, json={"id": 1}))
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/v1/webhooks/github",
-                json=pr_webhook_payload,
-                headers={"X-GitHub-Event": "pull_request"},
-            )
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "approved"
+        data = await _process(client, response)
+        assert data["status"] == "approved"
 
     @pytest.mark.asyncio
     async def test_push_ignored_branch(self, push_webhook_payload):
@@ -290,6 +305,366 @@ class TestWebhookHandler:
             assert data["reason"] == "no_contract_changes"
 
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_duplicate_delivery_dropped(self, client, queue, pr_webhook_payload):
+        """Test that a redelivery of the same delivery ID is not processed again."""
+        files = respx.get(
+            "https://api.github.com/repos/example/orders-service/pulls/42/files"
+        ).mock(return_value=httpx.Response(200, json=[]))
+        respx.post(
+            "https://api.github.com/repos/example/orders-service/check-runs"
+        ).mock(return_value=httpx.Response(201, json={"id": 1}))
+
+        headers = {"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"}
+        first = await client.post(
+            "/api/v1/webhooks/github", json=pr_webhook_payload, headers=headers
+        )
+        await _process(client, first)
+
+        second = await client.post(
+            "/api/v1/webhooks/github", json=pr_webhook_payload, headers=headers
+        )
+        assert second.status_code == 200
+        assert second.json() == {"status": "duplicate", "delivery_id": "delivery-1"}
+        assert await queue.process_pending() == 0
+        assert files.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_pr_deliveries_coalesced(self, client, queue, pr_webhook_payload):
+        """Test that only the latest pending delivery for a PR is processed."""
+        respx.get(
+            "https://api.github.com/repos/example/orders-service/pulls/42/files"
+        ).mock(return_value=httpx.Response(200, json=[]))
+        check_runs = respx.post(
+            "https://api.github.com/repos/example/orders-service/check-runs"
+        ).mock(return_value=httpx.Response(201, json={"id": 1}))
+
+        await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
+        pr_webhook_payload["action"] = "synchronize"
+        pr_webhook_payload["pull_request"]["head"]["sha"] = "fff999"
+        latest = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-2"},
+        )
+
+        result = await _process(client, latest)
+        assert result["status"] == "approved"
+        assert json.loads(check_runs.calls.last.request.content)["head_sha"] == "fff999"
+
+        superseded = await client.get("/api/v1/webhooks/github/deliveries/delivery-1")
+        assert superseded.json()["status"] == "superseded"
+        assert superseded.json()["attempts"] == 0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failed_delivery_retried(self, client, queue, pr_webhook_payload):
+        """Test that a delivery failing on GitHub errors is scheduled for retry."""
+        respx.get(
+            "https://api.github.com/repos/example/orders-service/pulls/42/files"
+        ).mock(return_value=httpx.Response(502))
+        respx.post(
+            "https://api.github.com/repos/example/orders-service/statuses/abc123def456"
+        ).mock(return_value=httpx.Response(201, json={}))
+
+        await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
+        assert await queue.process_pending() == 1
+
+        delivery = (
+            await client.get("/api/v1/webhooks/github/deliveries/delivery-1")
+        ).json()
+        assert delivery["status"] == "pending"
+        assert delivery["attempts"] == 1
+        assert delivery["error"]
+
+        # Not due again until the backoff has passed
+        assert await queue.process_pending() == 0
+
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_pr_verdict_cached(self, client, queue, pr_webhook_payload):
+        """Test that a push not touching schema or contract files reuses the verdict."""
+        files = respx.get(
+            "https://api.github.com/repos/example/orders-service/pulls/42/files"
+        )
+        files.side_effect = [
+            httpx.Response(200, json=[
+                {"filename": "alembic/versions/001_add_column.py", "status": "added",
+                 "sha": "s1"},
+                {"filename": "src/main.py", "status": "modified", "sha": "m1"},
+            ]),
+            httpx.Response(200, json=[
+                {"filename": "alembic/versions/001_add_column.py", "status": "added",
+                 "sha": "s1"},
+                {"filename": "src/main.py", "status": "modified", "sha": "m2"},
+            ]),
+        ]
+        check_runs = respx.post(
+            "https://api.github.com/repos/example/orders-service/check-runs"
+        ).mock(return_value=httpx.Response(201, json={"id": 1}))
+
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-1"},
+        )
+        first = await _process(client, response)
+        assert (first["status"], first["cached"]) == ("blocked", False)
+
+        pr_webhook_payload["action"] = "synchronize"
+        pr_webhook_payload["pull_request"]["head"]["sha"] = "fff999"
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-2"},
+        )
+        second = await _process(client, response)
+        assert (second["status"], second["cached"]) == ("blocked", True)
+
+        # Reopening re-posts the verdict without listing files again
+        pr_webhook_payload["action"] = "reopened"
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=pr_webhook_payload,
+            headers={"X-GitHub-Event": "pull_request", "X-GitHub-Delivery": "delivery-3"},
+        )
+        third = await _process(client, response)
+        assert third["cached"] is True
+        assert files.call_count == 2
+
+        assert check_runs.call_count == 3
+        request = json.loads(check_runs.calls.last.request.content)
+        assert (request["head_sha"], request["conclusion"]) == ("fff999", "failure")
+
+    @pytest.mark.asyncio
+    async def test_in_flight_check_cancelled(self, pr_webhook_payload):
+        """Test that a newer head SHA cancels the check still running for the PR."""
+        started = asyncio.Event()
+
+        async def handler(payload, db):
+            if payload["pull_request"]["head"]["sha"] == "abc123def456":
+                started.set()
+                await asyncio.sleep(60)
+            return {"status": "approved"}
+
+        queue = WebhookQueue({"pull_request": handler}, session_maker=async_session_maker)
+        async with async_session_maker() as db:
+            await queue.enqueue(db, "delivery-1", "pull_request", pr_webhook_payload)
+            await db.commit()
+        stale = asyncio.create_task(queue.process_next())
+        await started.wait()
+
+        payload = json.loads(json.dumps(pr_webhook_payload))
+        payload["pull_request"]["head"]["sha"] = "fff999"
+        async with async_session_maker() as db:
+            await queue.enqueue(db, "delivery-2", "pull_request", payload)
+            await db.commit()
+        assert await queue.process_next() is True
+        assert await stale is True
+
+        async with async_session_maker() as db:
+            statuses = {
+                delivery_id: (await db.get(WebhookDelivery, delivery_id)).status
+                for delivery_id in ("delivery-1", "delivery-2")
+            }
+        assert statuses == {"delivery-1": "superseded", "delivery-2": "done"}
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_run_does_not_record_outcome(self, push_webhook_payload):
+        """Test that a run whose claim was taken over leaves the delivery to the new run."""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def handler(payload, db):
+            started.set()
+            await release.wait()
+            return {"status": "synced"}
+
+        queue = WebhookQueue({"push": handler}, session_maker=async_session_maker)
+        async with async_session_maker() as db:
+            await queue.enqueue(db, "push-1", "push", push_webhook_payload)
+            await db.commit()
+        stale = asyncio.create_task(queue.process_next())
+        await started.wait()
+
+        # Another worker reclaims the delivery as if this run had timed out
+        async with async_session_maker() as db:
+            delivery = await db.get(WebhookDelivery, "push-1")
+            delivery.attempts += 1
+            await db.commit()
+        release.set()
+        assert await stale is True
+
+        async with async_session_maker() as db:
+            delivery = await db.get(WebhookDelivery, "push-1")
+        assert (delivery.status, delivery.attempts, delivery.result) == ("processing", 2, None)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_push_syncs_monorepo_contracts(
+        self, client, queue, push_webhook_payload, sample_contract_yaml
+    ):
+        """Test that every contract changed by a push is synced in one pass."""
+        import base64
+
+        push_webhook_payload["after"] = "def456"
+        push_webhook_payload["commits"] = [
+            {
+                "id": "c1",
+                "added": ["services/orders/contract.yaml", "services/legacy/contract.yaml"],
+                "modified": [],
+                "removed": [],
+            },
+            {
+                "id": "c2",
+                "added": [],
+                "modified": ["services/customers/datapact.yaml", "README.md"],
+                "removed": ["services/legacy/contract.yaml"],
+            },
+        ]
+        customers_yaml = sample_contract_yaml.replace("name: orders", "name: customers")
+        for path, content in [
+            ("services/orders/contract.yaml", sample_contract_yaml),
+            ("services/customers/datapact.yaml", customers_yaml),
+        ]:
+            respx.get(
+                f"https://api.github.com/repos/example/orders-service/contents/{path}",
+                params={"ref": "def456"},
+            ).mock(return_value=httpx.Response(200, json={
+                "content": base64.b64encode(content.encode()).decode(),
+                "encoding": "base64",
+            }))
+
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            json=push_webhook_payload,
+            headers={"X-GitHub-Event": "push", "X-GitHub-Delivery": "push-1"},
+        )
+
+        data = await _process(client, response)
+        assert data["status"] == "synced"
+        assert data["errors"] == []
+        assert {(c["path"], c["name"], c["status"]) for c in data["contracts"]} == {
+            ("services/orders/contract.yaml", "orders", "created"),
+            ("services/customers/datapact.yaml", "customers", "created"),
+        }
+
+        contract = await client.get("/api/v1/contracts/name/customers")
+        assert contract.status_code == 200
+        assert contract.json()["repository_url"] == (
+            "https://github.com/example/orders-service"
+        )
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_push_updates_only_changed_fields(
+        self, client, queue, push_webhook_payload, sample_contract_yaml
+    ):
+        """Test that a push to an existing contract keeps its unchanged field rows."""
+        import base64
+
+        updated_yaml = sample_contract_yaml + """  - name: currency
+    type: string
+    nullable: false
+"""
+        for sha, content in [("def456", sample_contract_yaml), ("fff999", updated_yaml)]:
+            respx.get(
+                "https://api.github.com/repos/example/orders-service/contents/contract.yaml",
+                params={"ref": sha},
+            ).mock(return_value=httpx.Response(200, json={
+                "content": base64.b64encode(content.encode()).decode(),
+                "encoding": "base64",
+            }))
+
+        push_webhook_payload["after"] = "def456"
+        created = await _process(client, await client.post(
+            "/api/v1/webhooks/github",
+            json=push_webhook_payload,
+            headers={"X-GitHub-Event": "push", "X-GitHub-Delivery": "push-1"},
+        ))
+        assert created["contracts"][0]["status"] == "created"
+        before = (await client.get("/api/v1/contracts/name/orders")).json()
+
+        push_webhook_payload["after"] = "fff999"
+        updated = await _process(client, await client.post(
+            "/api/v1/webhooks/github",
+            json=push_webhook_payload,
+            headers={"X-GitHub-Event": "push", "X-GitHub-Delivery": "push-2"},
+        ))
+        assert updated["contracts"][0]["status"] == "updated"
+        after = (await client.get("/api/v1/contracts/name/orders")).json()
+
+        field_ids = {f["name"]: f["id"] for f in after["fields"]}
+        assert {f["name"]: f["id"] for f in before["fields"]}.items() <= field_ids.items()
+        assert "currency" in field_ids
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_pushes_not_coalesced(
+        self, client, queue, push_webhook_payload, sample_contract_yaml
+    ):
+        """Test that each push to a branch syncs the contracts it changed."""
+        import base64
+
+        customers_yaml = sample_contract_yaml.replace("name: orders", "name: customers")
+        for path, sha, content in [
+            ("orders/contract.yaml", "def456", sample_contract_yaml),
+            ("customers/contract.yaml", "fff999", customers_yaml),
+        ]:
+            respx.get(
+                f"https://api.github.com/repos/example/orders-service/contents/{path}",
+                params={"ref": sha},
+            ).mock(return_value=httpx.Response(200, json={
+                "content": base64.b64encode(content.encode()).decode(),
+                "encoding": "base64",
+            }))
+
+            push_webhook_payload["after"] = sha
+            push_webhook_payload["commits"][0]["modified"] = [path]
+            await client.post(
+                "/api/v1/webhooks/github",
+                json=push_webhook_payload,
+                headers={"X-GitHub-Event": "push", "X-GitHub-Delivery": f"push-{sha}"},
+            )
+
+        assert await queue.process_pending() == 2
+        for name in ("orders", "customers"):
+            contract = await client.get(f"/api/v1/contracts/name/{name}")
+            assert contract.status_code == 200
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failed_push_retried(self, client, queue, push_webhook_payload):
+        """Test that a push failing on GitHub errors is scheduled for retry."""
+        push_webhook_payload.update(before="abc000", after="def456")
+        push_webhook_payload["commits"] *= 20
+        respx.get(
+            "https://api.github.com/repos/example/orders-service/compare/abc000...def456"
+        ).mock(return_value=httpx.Response(502))
+
+        await client.post(
+            "/api/v1/webhooks/github",
+            json=push_webhook_payload,
+            headers={"X-GitHub-Event": "push", "X-GitHub-Delivery": "push-1"},
+        )
+        assert await queue.process_pending() == 1
+
+        delivery = (await client.get("/api/v1/webhooks/github/deliveries/push-1")).json()
+        assert delivery["status"] == "pending"
+        assert delivery["attempts"] == 1
+        assert delivery["error"]
+
+
 class TestSignatureVerification:
     @pytest.mark.asyncio
     async def test_invalid_signature_rejected(self, pr_webhook_payload, monkeypatch):
@@ -316,7 +691,7 @@ class TestSignatureVerification:
             assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_valid_signature_accepted(self, pr_webhook_payload, monkeypatch):
+    async def test_valid_signature_accepted(self, client, pr_webhook_payload, monkeypatch):
         """Test that valid signatures are accepted."""
         secret = "test-secret"
         monkeypatch.setattr(settings, "github_webhook_secret", secret)
@@ -324,28 +699,14 @@ class TestSignatureVerification:
         payload_bytes = json.dumps(pr_webhook_payload).encode()
         signature = _create_signature(payload_bytes, secret)
 
-        # Mock GitHub API for the actual handler
-        with respx.mock:
-            respx.get(
-                "https://api.github.com/repos/example/orders-service/pulls/42/files"
-            ).mock(return_value=httpx.Response(200, json=[]))
-
-            respx.post(
-                "https://api.github.com/repos/example/orders-service/check-runs"
-            ).mock(return_value=httpx.Response(201, json={"id": 1}))
-
-            async with AsyncClient(
-                transport=ASGITransport(app=app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/v1/webhooks/github",
-                    content=payload_bytes,
-                    headers={
-                        "X-GitHub-Event": "pull_request",
-                        "X-Hub-Signature-256": signature,
-                        "Content-Type": "application/json",
-                    },
-                )
-
-                assert response.status_code == 200
+        response = await client.post(
+            "/api/v1/webhooks/github",
+            content=payload_bytes,
+            headers={
+                "X-GitHub-Event": "pull_request",
+                "X-Hub-Signature-256": signature,
+                "Content-Type": "application/json",
+            },
+        )
+
+        assert response.status_code == 202
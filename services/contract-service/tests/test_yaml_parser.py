@@ -2,8 +2,10 @@
 
 import pytest
 
+from contract_service.utils import yaml_parser
 from contract_service.utils.yaml_parser import (
     parse_contract_yaml,
+    parse_contract_yaml_batch,
     contract_to_yaml,
     ContractParseError,
 )
@@ -239,6 +241,49 @@ fields:
         assert result["fields"][0]["is_primary_key"] is True
 
 
+class TestParseCache:
+    CONTENT = """
+name: orders
+version: 1.0.0
+publisher:
+  team: commerce
+schema:
+  - name: order_id
+    type: uuid
+tags: [orders]
+"""
+
+    def test_parses_same_content_once(self, monkeypatch):
+        """Test that identical content is served from the cache."""
+        yaml_parser.clear_parse_cache()
+        calls = []
+        parse = yaml_parser._parse_contract
+        monkeypatch.setattr(
+            yaml_parser, "_parse_contract", lambda c: calls.append(c) or parse(c)
+        )
+
+        first = parse_contract_yaml(self.CONTENT)
+        first["tags"].append("mutated")
+        second = parse_contract_yaml(self.CONTENT)
+
+        assert len(calls) == 1
+        assert second["tags"] == ["orders"]
+
+        with pytest.raises(ContractParseError):
+            parse_contract_yaml("name: [broken")
+        with pytest.raises(ContractParseError):
+            parse_contract_yaml("name: [broken")
+        assert len(calls) == 2
+
+    def test_batch(self):
+        """Test that a batch returns results and errors in order."""
+        results = parse_contract_yaml_batch([self.CONTENT, "- a list", self.CONTENT])
+
+        assert results[0]["name"] == results[2]["name"] == "orders"
+        assert results[0] is not results[2]
+        assert isinstance(results[1], ContractParseError)
+
+
 class TestContractToYaml:
     def test_basic_contract_to_yaml(self):
         """Test converting a basic contract to YAML."""
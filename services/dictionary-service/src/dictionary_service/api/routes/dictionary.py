@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException, Query
 
-from dictionary_service.services.aggregator import DictionaryAggregator
+from dictionary_service.services.aggregator import DictionaryAggregator, dictionary_cache
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ async def get_dictionary():
 
     Returns all datasets, fields, teams, and summary statistics.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
         return dictionary
@@ -29,7 +29,7 @@ async def get_dictionary_summary():
 
     Returns high-level counts without full field details.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
         return {
@@ -50,7 +50,7 @@ async def list_datasets(
 
     Optional filters by team and status.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
 
@@ -77,7 +77,7 @@ async def get_dataset_details(dataset_name: str):
 
     Includes fields, quality metrics, subscribers, and access configuration.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         details = await aggregator.get_dataset_details(dataset_name)
         if not details:
@@ -97,7 +97,7 @@ async def list_teams():
 
     Returns teams that either publish or subscribe to datasets.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
         return {
@@ -113,7 +113,7 @@ async def get_team_datasets(team: str):
     """
     Get all datasets owned by a specific team.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         datasets = await aggregator.get_team_datasets(team)
         return {
@@ -138,7 +138,7 @@ async def list_fields(
 
     Optional filters by team, data type, and PII flag.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
 
@@ -175,7 +175,7 @@ async def list_pii_fields(
 
     This is a convenience endpoint for compliance and security audits.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
 
@@ -199,7 +199,7 @@ async def get_field_lineage(dataset_name: str, field_name: str):
 
     Shows upstream dependencies, downstream dependents, and similar fields.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         lineage = await aggregator.get_field_lineage(dataset_name, field_name)
 
@@ -219,7 +219,7 @@ async def list_relationships():
     """
     List all relationships (foreign keys) between datasets.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         dictionary = await aggregator.get_full_dictionary()
 
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Query
 from fastapi.responses import PlainTextResponse
 
-from dictionary_service.services.aggregator import DictionaryAggregator
+from dictionary_service.services.aggregator import DictionaryAggregator, dictionary_cache
 from dictionary_service.services.erd_generator import ERDGenerator
 
 router = APIRouter()
@@ -20,7 +20,7 @@ async def get_mermaid_erd(
     Returns a Mermaid diagram definition that can be rendered
     using Mermaid.js or compatible tools.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         erd_generator = ERDGenerator(aggregator)
         mermaid = await erd_generator.generate_mermaid(
@@ -43,7 +43,7 @@ async def get_json_erd(
     Returns nodes and edges suitable for visualization
     with React Flow, D3.js, or similar libraries.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         erd_generator = ERDGenerator(aggregator)
         erd_json = await erd_generator.generate_json(
@@ -65,7 +65,7 @@ async def get_plantuml_erd(
     Returns a PlantUML diagram definition that can be rendered
     using PlantUML or compatible tools.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         erd_generator = ERDGenerator(aggregator)
         plantuml = await erd_generator.generate_plantuml(team=team)
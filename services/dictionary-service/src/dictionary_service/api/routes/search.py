@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Query
 
-from dictionary_service.services.aggregator import DictionaryAggregator
+from dictionary_service.services.aggregator import DictionaryAggregator, dictionary_cache
 from dictionary_service.services.search_service import SearchService, SearchScope
 
 router = APIRouter()
@@ -24,7 +24,7 @@ async def search(
     Searches through field names, dataset names, and descriptions.
     Results are ranked by relevance.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         search_service = SearchService(aggregator)
         results = await search_service.search(
@@ -51,7 +51,7 @@ async def suggest(
 
     Returns suggestions grouped by type (fields, datasets, teams).
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         search_service = SearchService(aggregator)
         suggestions = await search_service.suggest(prefix=prefix, limit=limit)
@@ -67,7 +67,7 @@ async def search_by_type(data_type: str):
 
     Useful for finding all UUID fields, all timestamp fields, etc.
     """
-    aggregator = DictionaryAggregator()
+    aggregator = DictionaryAggregator(cache=dictionary_cache)
     try:
         search_service = SearchService(aggregator)
         fields = await search_service.get_fields_by_type(data_type)
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
 
     # Cache settings
     cache_ttl_seconds: int = 300  # 5 minutes
+    # How long past the TTL a snapshot is served while it refreshes
+    cache_max_stale_seconds: int = 3600
 
     class Config:
         env_prefix = ""
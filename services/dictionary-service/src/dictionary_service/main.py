@@ -6,12 +6,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from dictionary_service.config import settings
 from dictionary_service.api.routes import dictionary_router, search_router, erd_router
+from dictionary_service.services.aggregator import dictionary_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     yield
+    await dictionary_cache.close()
 
 
 app = FastAPI(
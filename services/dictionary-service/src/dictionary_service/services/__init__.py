@@ -2,6 +2,17 @@
 
 from dictionary_service.services.aggregator import DictionaryAggregator
 from dictionary_service.services.search_service import SearchService
+from dictionary_service.services.search_index import SearchIndex
 from dictionary_service.services.erd_generator import ERDGenerator
+from dictionary_service.services.dictionary_graph import DictionaryGraph
+from dictionary_service.services.snapshot import DictionarySnapshot, SnapshotCache
 
-__all__ = ["DictionaryAggregator", "SearchService", "ERDGenerator"]
+__all__ = [
+    "DictionaryAggregator",
+    "SearchService",
+    "SearchIndex",
+    "ERDGenerator",
+    "DictionaryGraph",
+    "DictionarySnapshot",
+    "SnapshotCache",
+]
@@ -1,18 +1,30 @@
 """Dictionary aggregation service."""
 
+import asyncio
 from typing import Any
 import httpx
 
 from dictionary_service.config import settings
+from dictionary_service.services.snapshot import DictionarySnapshot, SnapshotCache
 
 
 class DictionaryAggregator:
     """Aggregates all contracts into a unified data dictionary."""
 
-    def __init__(self, client: httpx.AsyncClient | None = None):
-        """Initialize aggregator with optional HTTP client."""
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        cache: SnapshotCache | None = None,
+    ):
+        """
+        Initialize aggregator with optional HTTP client.
+
+        With a snapshot cache, the dictionary is served from the cache
+        instead of being rebuilt on every call.
+        """
         self._client = client
         self._owns_client = client is None
+        self.cache = cache
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -30,7 +42,26 @@ class DictionaryAggregator:
             self._client = None
 
     async def get_full_dictionary(self) -> dict[str, Any]:
+        """Get the complete data dictionary; read-only when cached."""
+        return (await self.get_snapshot()).dictionary
+
+    async def get_snapshot(self) -> DictionarySnapshot:
+        """Get the current dictionary snapshot, from the cache if there is one."""
+        if self.cache is not None:
+            return await self.cache.get()
+        return await self.build_snapshot()
+
+    async def build_dictionary(self) -> dict[str, Any]:
         """Build complete data dictionary from all contracts."""
+        return (await self.build_snapshot()).dictionary
+
+    async def build_snapshot(self) -> DictionarySnapshot:
+        """
+        Build the data dictionary and the subscriptions to its datasets.
+
+        Subscriptions feed the snapshot's graph only; they are not part of
+        the dictionary served by the API.
+        """
         client = await self._get_client()
 
         # Fetch all contracts
@@ -45,6 +76,7 @@ class DictionaryAggregator:
             "pii_fields": [],
             "relationships": [],
         }
+        subscriptions: list[dict[str, Any]] = []
 
         for contract in contracts:
             # Add dataset entry
@@ -99,10 +131,16 @@ class DictionaryAggregator:
                             "type": "foreign_key",
                         })
 
-            # Track subscriber teams
+            # Track subscriber teams and their subscriptions
             for sub in contract.get("subscribers", []):
                 if sub.get("team"):
                     dictionary["teams"].add(sub["team"])
+                subscriptions.append({
+                    "dataset": contract["name"],
+                    "team": sub.get("team"),
+                    "use_case": sub.get("use_case"),
+                    "fields_used": sub.get("fields_used", []),
+                })
 
         # Convert teams set to sorted list
         dictionary["teams"] = sorted(dictionary["teams"])
@@ -122,7 +160,7 @@ class DictionaryAggregator:
             ),
         }
 
-        return dictionary
+        return DictionarySnapshot(dictionary, subscriptions)
 
     async def get_dataset_details(self, dataset_name: str) -> dict[str, Any] | None:
         """Get detailed information about a specific dataset."""
@@ -133,9 +171,11 @@ class DictionaryAggregator:
             return None
         resp.raise_for_status()
 
-        contract = resp.json()
+        return self._dataset_details(resp.json())
 
-        # Build detailed view
+    @staticmethod
+    def _dataset_details(contract: dict[str, Any]) -> dict[str, Any]:
+        """Build the detailed view of a dataset from its contract."""
         return {
             "id": contract.get("id"),
             "name": contract["name"],
@@ -184,14 +224,10 @@ class DictionaryAggregator:
 
     async def get_field_lineage(self, dataset_name: str, field_name: str) -> dict[str, Any]:
         """Get lineage information for a specific field."""
-        dictionary = await self.get_full_dictionary()
+        graph = (await self.get_snapshot()).graph
 
         # Find the field
-        field_info = None
-        for field in dictionary["fields"]:
-            if field["dataset"] == dataset_name and field["name"] == field_name:
-                field_info = field
-                break
+        field_info = graph.field(dataset_name, field_name)
 
         if not field_info:
             return {"error": "Field not found"}
@@ -208,14 +244,14 @@ class DictionaryAggregator:
                 })
 
         # Find downstream (fields that reference this field)
-        downstream = []
-        for rel in dictionary["relationships"]:
-            if rel["to_dataset"] == dataset_name and rel["to_field"] == field_name:
-                downstream.append({
-                    "dataset": rel["from_dataset"],
-                    "field": rel["from_field"],
-                    "relationship": "referenced_by",
-                })
+        downstream = [
+            {
+                "dataset": rel["from_dataset"],
+                "field": rel["from_field"],
+                "relationship": "referenced_by",
+            }
+            for rel in graph.references_to(dataset_name, field_name)
+        ]
 
         # Find fields with the same name across datasets
         similar_fields = [
@@ -224,8 +260,8 @@ class DictionaryAggregator:
                 "data_type": f["data_type"],
                 "description": f.get("description"),
             }
-            for f in dictionary["fields"]
-            if f["name"] == field_name and f["dataset"] != dataset_name
+            for f in graph.fields_named(field_name)
+            if f["dataset"] != dataset_name
         ]
 
         return {
@@ -234,3 +270,19 @@ class DictionaryAggregator:
             "downstream": downstream,
             "similar_fields": similar_fields,
         }
+
+
+async def load_snapshot() -> DictionarySnapshot:
+    """Build a snapshot with a client of its own, so it can outlive requests."""
+    aggregator = DictionaryAggregator()
+    try:
+        snapshot = await aggregator.build_snapshot()
+    finally:
+        await aggregator.close()
+    # Index off the event loop, before the snapshot is served
+    await asyncio.to_thread(lambda: (snapshot.search_index, snapshot.graph))
+    return snapshot
+
+
+# Process-wide dictionary snapshot shared by all requests
+dictionary_cache = SnapshotCache(load_snapshot)
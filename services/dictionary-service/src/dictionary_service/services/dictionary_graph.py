@@ -0,0 +1,78 @@
+"""Adjacency maps over a data dictionary snapshot."""
+
+from collections import defaultdict
+from typing import Any
+
+
+class DictionaryGraph:
+    """
+    Fields, relationships and subscriptions of a dictionary, indexed for
+    diagram and lineage lookups.
+
+    Built once per snapshot, so generating an ERD or a field's lineage
+    costs time proportional to the output rather than the whole catalog.
+    The lists hold the snapshot's own dicts, in the snapshot's order.
+    """
+
+    def __init__(
+        self, dictionary: dict[str, Any], subscriptions: list[dict[str, Any]] | None = None
+    ):
+        self.fields_by_dataset: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.fields_by_name: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.field_lookup: dict[tuple[str, str], dict[str, Any]] = {}
+        for field in dictionary["fields"]:
+            self.fields_by_dataset[field["dataset"]].append(field)
+            self.fields_by_name[field["name"]].append(field)
+            self.field_lookup.setdefault((field["dataset"], field["name"]), field)
+
+        # Foreign keys leaving a dataset, and those pointing at one of its fields
+        self.outbound: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.inbound: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for rel in dictionary["relationships"]:
+            self.outbound[rel["from_dataset"]].append(rel)
+            self.inbound[(rel["to_dataset"], rel["to_field"])].append(rel)
+
+        # Subscriptions to a dataset, and the datasets each team publishes
+        self.subscribers: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for subscription in subscriptions or []:
+            self.subscribers[subscription["dataset"]].append(subscription)
+        self.datasets_by_team: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for dataset in dictionary["datasets"]:
+            if dataset.get("publisher_team"):
+                self.datasets_by_team[dataset["publisher_team"]].append(dataset)
+
+        # Plain dicts, so lookups of unknown keys do not grow the maps
+        self.fields_by_dataset = dict(self.fields_by_dataset)
+        self.fields_by_name = dict(self.fields_by_name)
+        self.outbound = dict(self.outbound)
+        self.inbound = dict(self.inbound)
+        self.subscribers = dict(self.subscribers)
+        self.datasets_by_team = dict(self.datasets_by_team)
+
+    def dataset_fields(self, dataset: str) -> list[dict[str, Any]]:
+        """Fields of a dataset."""
+        return self.fields_by_dataset.get(dataset, [])
+
+    def field(self, dataset: str, name: str) -> dict[str, Any] | None:
+        """A field by dataset and name."""
+        return self.field_lookup.get((dataset, name))
+
+    def references_from(self, dataset: str) -> list[dict[str, Any]]:
+        """Foreign key relationships from the fields of a dataset."""
+        return self.outbound.get(dataset, [])
+
+    def references_to(self, dataset: str, field: str) -> list[dict[str, Any]]:
+        """Foreign key relationships pointing at a field."""
+        return self.inbound.get((dataset, field), [])
+
+    def fields_named(self, name: str) -> list[dict[str, Any]]:
+        """Fields with a name, across all datasets."""
+        return self.fields_by_name.get(name, [])
+
+    def subscribers_of(self, dataset: str) -> list[dict[str, Any]]:
+        """Subscriptions to a dataset."""
+        return self.subscribers.get(dataset, [])
+
+    def team_datasets(self, team: str | None) -> list[dict[str, Any]]:
+        """Datasets published by a team."""
+        return self.datasets_by_team.get(team, []) if team else []
@@ -4,6 +4,7 @@ from typing import Any
 from jinja2 import Template
 
 from dictionary_service.services.aggregator import DictionaryAggregator
+from dictionary_service.services.dictionary_graph import DictionaryGraph
 
 
 MERMAID_TEMPLATE = """erDiagram
@@ -44,18 +45,15 @@ class ERDGenerator:
         Returns:
             Mermaid ERD diagram syntax
         """
-        dictionary = await self.aggregator.get_full_dictionary()
+        snapshot = await self.aggregator.get_snapshot()
+        dictionary, graph = snapshot.dictionary, snapshot.graph
 
         datasets = []
         relationships = []
         processed_datasets = set()
 
         # Filter datasets by team if specified
-        filtered_datasets = dictionary["datasets"]
-        if team:
-            filtered_datasets = [
-                d for d in filtered_datasets if d.get("publisher_team") == team
-            ]
+        filtered_datasets = graph.team_datasets(team) if team else dictionary["datasets"]
 
         # Build dataset entities
         for dataset_info in filtered_datasets:
@@ -63,9 +61,7 @@ class ERDGenerator:
             processed_datasets.add(dataset_info["name"])
 
             # Get fields for this dataset
-            dataset_fields = [
-                f for f in dictionary["fields"] if f["dataset"] == dataset_info["name"]
-            ]
+            dataset_fields = graph.dataset_fields(dataset_info["name"])
 
             dataset = {
                 "name": dataset_name,
@@ -82,33 +78,29 @@ class ERDGenerator:
             datasets.append(dataset)
 
         # Add foreign key relationships
-        for rel in dictionary["relationships"]:
-            if rel["from_dataset"] in processed_datasets:
-                # Only include if target is also in the diagram or we have no filter
-                if team is None or rel["to_dataset"] in processed_datasets:
-                    relationships.append({
-                        "from_dataset": self._sanitize_name(rel["from_dataset"]),
-                        "to_dataset": self._sanitize_name(rel["to_dataset"]),
-                        "cardinality": "}o--||",  # Many to one
-                        "label": rel["from_field"],
-                    })
+        for rel in self._references_from(graph, filtered_datasets):
+            # Only include if target is also in the diagram or we have no filter
+            if team is None or rel["to_dataset"] in processed_datasets:
+                relationships.append({
+                    "from_dataset": self._sanitize_name(rel["from_dataset"]),
+                    "to_dataset": self._sanitize_name(rel["to_dataset"]),
+                    "cardinality": "}o--||",  # Many to one
+                    "label": rel["from_field"],
+                })
 
         # Add subscriber relationships if requested
         if include_subscribers:
             for dataset_info in filtered_datasets:
                 # Find contracts that subscribe to this dataset
-                full_details = await self.aggregator.get_dataset_details(dataset_info["name"])
-                if full_details:
-                    for subscriber in full_details.get("subscribers", []):
-                        # Check if subscriber team owns any contracts
-                        for other in dictionary["datasets"]:
-                            if other.get("publisher_team") == subscriber.get("team"):
-                                relationships.append({
-                                    "from_dataset": self._sanitize_name(other["name"]),
-                                    "to_dataset": self._sanitize_name(dataset_info["name"]),
-                                    "cardinality": "..>",  # Uses/depends on
-                                    "label": "subscribes",
-                                })
+                for subscriber in graph.subscribers_of(dataset_info["name"]):
+                    # Link the datasets the subscriber team owns
+                    for other in graph.team_datasets(subscriber.get("team")):
+                        relationships.append({
+                            "from_dataset": self._sanitize_name(other["name"]),
+                            "to_dataset": self._sanitize_name(dataset_info["name"]),
+                            "cardinality": "..>",  # Uses/depends on
+                            "label": "subscribes",
+                        })
 
         # Render template
         template = Template(MERMAID_TEMPLATE)
@@ -129,24 +121,19 @@ class ERDGenerator:
         Returns:
             JSON structure with nodes and edges
         """
-        dictionary = await self.aggregator.get_full_dictionary()
+        snapshot = await self.aggregator.get_snapshot()
+        dictionary, graph = snapshot.dictionary, snapshot.graph
 
         nodes = []
         edges = []
         node_ids = set()
 
         # Filter datasets by team if specified
-        filtered_datasets = dictionary["datasets"]
-        if team:
-            filtered_datasets = [
-                d for d in filtered_datasets if d.get("publisher_team") == team
-            ]
+        filtered_datasets = graph.team_datasets(team) if team else dictionary["datasets"]
 
         # Build nodes
         for dataset in filtered_datasets:
-            dataset_fields = [
-                f for f in dictionary["fields"] if f["dataset"] == dataset["name"]
-            ]
+            dataset_fields = graph.dataset_fields(dataset["name"])
 
             node = {
                 "id": dataset["name"],
@@ -173,44 +160,35 @@ class ERDGenerator:
             node_ids.add(dataset["name"])
 
         # Build foreign key edges
-        for rel in dictionary["relationships"]:
-            if rel["from_dataset"] in node_ids:
-                edge = {
-                    "id": f"{rel['from_dataset']}.{rel['from_field']}_{rel['to_dataset']}.{rel['to_field']}",
-                    "source": rel["from_dataset"],
-                    "target": rel["to_dataset"],
-                    "type": "foreign_key",
-                    "label": f"{rel['from_field']} -> {rel['to_field']}",
-                    "source_field": rel["from_field"],
-                    "target_field": rel["to_field"],
-                }
-                edges.append(edge)
+        for rel in self._references_from(graph, filtered_datasets):
+            edge = {
+                "id": f"{rel['from_dataset']}.{rel['from_field']}_{rel['to_dataset']}.{rel['to_field']}",
+                "source": rel["from_dataset"],
+                "target": rel["to_dataset"],
+                "type": "foreign_key",
+                "label": f"{rel['from_field']} -> {rel['to_field']}",
+                "source_field": rel["from_field"],
+                "target_field": rel["to_field"],
+            }
+            edges.append(edge)
 
         # Add subscription edges if requested
         if include_subscribers:
             for dataset in filtered_datasets:
-                full_details = await self.aggregator.get_dataset_details(dataset["name"])
-                if full_details:
-                    for subscriber in full_details.get("subscribers", []):
-                        # Add subscriber as a node if not already present
-                        subscriber_team = subscriber.get("team")
-                        if subscriber_team:
-                            # Find datasets owned by subscriber team
-                            for other in dictionary["datasets"]:
-                                if (
-                                    other.get("publisher_team") == subscriber_team
-                                    and other["name"] in node_ids
-                                ):
-                                    edge = {
-                                        "id": f"sub_{other['name']}_{dataset['name']}",
-                                        "source": other["name"],
-                                        "target": dataset["name"],
-                                        "type": "subscription",
-                                        "label": "subscribes",
-                                        "use_case": subscriber.get("use_case"),
-                                        "fields_used": subscriber.get("fields_used", []),
-                                    }
-                                    edges.append(edge)
+                for subscriber in graph.subscribers_of(dataset["name"]):
+                    # Find datasets owned by subscriber team
+                    for other in graph.team_datasets(subscriber.get("team")):
+                        if other["name"] in node_ids:
+                            edge = {
+                                "id": f"sub_{other['name']}_{dataset['name']}",
+                                "source": other["name"],
+                                "target": dataset["name"],
+                                "type": "subscription",
+                                "label": "subscribes",
+                                "use_case": subscriber.get("use_case"),
+                                "fields_used": subscriber.get("fields_used", []),
+                            }
+                            edges.append(edge)
 
         return {
             "nodes": nodes,
@@ -232,24 +210,19 @@ class ERDGenerator:
         Returns:
             PlantUML diagram syntax
         """
-        dictionary = await self.aggregator.get_full_dictionary()
+        snapshot = await self.aggregator.get_snapshot()
+        dictionary, graph = snapshot.dictionary, snapshot.graph
 
         lines = ["@startuml", "!define Table(name,desc) entity name as \"desc\" << (T,#FFAAAA) >>", ""]
 
         # Filter datasets
-        filtered_datasets = dictionary["datasets"]
-        if team:
-            filtered_datasets = [
-                d for d in filtered_datasets if d.get("publisher_team") == team
-            ]
+        filtered_datasets = graph.team_datasets(team) if team else dictionary["datasets"]
 
         processed_datasets = set()
 
         # Generate entity definitions
         for dataset in filtered_datasets:
-            dataset_fields = [
-                f for f in dictionary["fields"] if f["dataset"] == dataset["name"]
-            ]
+            dataset_fields = graph.dataset_fields(dataset["name"])
 
             lines.append(f'entity "{dataset["name"]}" as {self._sanitize_name(dataset["name"])} {{')
 
@@ -264,17 +237,24 @@ class ERDGenerator:
             processed_datasets.add(dataset["name"])
 
         # Generate relationships
-        for rel in dictionary["relationships"]:
-            if rel["from_dataset"] in processed_datasets:
-                from_name = self._sanitize_name(rel["from_dataset"])
-                to_name = self._sanitize_name(rel["to_dataset"])
-                lines.append(f'{from_name} }}o--|| {to_name} : "{rel["from_field"]}"')
+        for rel in self._references_from(graph, filtered_datasets):
+            from_name = self._sanitize_name(rel["from_dataset"])
+            to_name = self._sanitize_name(rel["to_dataset"])
+            lines.append(f'{from_name} }}o--|| {to_name} : "{rel["from_field"]}"')
 
         lines.append("")
         lines.append("@enduml")
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _references_from(
+        graph: DictionaryGraph, datasets: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Foreign key relationships from the given datasets, in dictionary order."""
+        names = dict.fromkeys(d["name"] for d in datasets)
+        return [rel for name in names for rel in graph.references_from(name)]
+
     def _sanitize_name(self, name: str) -> str:
         """Sanitize name for diagram syntax."""
         return name.replace("-", "_").replace(" ", "_").replace(".", "_")
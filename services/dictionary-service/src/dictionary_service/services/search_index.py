@@ -0,0 +1,273 @@
+"""In-memory search index over a data dictionary snapshot."""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Substrings up to this length are indexed; longer queries intersect them
+GRAM_SIZE = 3
+
+# Words of identifiers and prose: snake_case, camelCase, acronyms, numbers
+TOKEN_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+# Minimum trigram similarity for a vocabulary term to match a query term
+FUZZY_THRESHOLD = 0.4
+
+# Most vocabulary terms a query term is expanded to
+MAX_EXPANSIONS = 5
+
+# Query terms at least this long also match the words they start, e.g. "cust"
+MIN_PREFIX_LENGTH = 3
+
+
+def ngrams(text: str, size: int = GRAM_SIZE) -> set[str]:
+    """All substrings of ``text`` of length 1 to ``size``."""
+    return {
+        text[start : start + n]
+        for n in range(1, size + 1)
+        for start in range(len(text) - n + 1)
+    }
+
+
+class SubstringIndex:
+    """
+    Finds documents by exact, prefix or substring match on a text.
+
+    Documents sharing a text share one entry, and the n-gram postings point
+    at distinct texts, so the index grows with the vocabulary rather than
+    the number of documents. A query up to ``GRAM_SIZE`` long is answered
+    by its own postings; a longer one by intersecting the postings of its
+    n-grams and checking the few remaining texts.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, str]]):
+        """Index ``(doc_id, text)`` pairs; texts are expected lowercase."""
+        self._docs: dict[str, list[int]] = defaultdict(list)
+        for doc_id, text in entries:
+            if text:
+                self._docs[text].append(doc_id)
+
+        self._grams: dict[str, set[str]] = defaultdict(set)
+        for text in self._docs:
+            for gram in ngrams(text):
+                self._grams[gram].add(text)
+        self._sorted = sorted(self._docs)
+
+    def exact(self, query: str) -> list[int]:
+        """Documents whose text equals ``query``."""
+        return self._docs.get(query, [])
+
+    def prefixed(self, prefix: str) -> Iterator[int]:
+        """Documents whose text starts with ``prefix``."""
+        for text in _prefix_range(self._sorted, prefix):
+            yield from self._docs[text]
+
+    def containing(self, query: str) -> Iterator[int]:
+        """Documents whose text contains ``query``."""
+        for text in self._texts_containing(query):
+            yield from self._docs[text]
+
+    def _texts_containing(self, query: str) -> Iterable[str]:
+        if not query:
+            return self._docs
+        if len(query) <= GRAM_SIZE:
+            return self._grams.get(query, ())
+
+        postings = sorted(
+            (self._grams.get(query[i : i + GRAM_SIZE], set())
+             for i in range(len(query) - GRAM_SIZE + 1)),
+            key=len,
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return [text for text in candidates if query in text]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of a text, splitting identifiers into their parts."""
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+def trigrams(term: str) -> set[str]:
+    """Trigrams of a term padded at both ends, for similarity matching."""
+    padded = f"${term}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class RankedIndex:
+    """
+    BM25 ranking over tokenized texts, tolerant of typos.
+
+    The BM25 weight of every term in every document is computed when the
+    index is built, so a query only sums the postings of its terms. Each
+    query term is matched against the vocabulary by trigram similarity, so
+    "custmer" still finds "customer", and every match counts in proportion
+    to its similarity. A partial word also matches the words it starts, so
+    "cust" finds "customer" although their trigrams barely overlap.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, list[str]]], k1: float = 1.2, b: float = 0.75):
+        """Index ``(doc_id, tokens)`` pairs."""
+        docs = [(doc_id, Counter(tokens), len(tokens)) for doc_id, tokens in entries if tokens]
+        average_length = sum(length for _, _, length in docs) / len(docs) if docs else 0.0
+
+        frequencies: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for doc_id, counts, length in docs:
+            for term, count in counts.items():
+                frequencies[term].append((doc_id, count, length))
+
+        # Postings as parallel arrays, compact enough for large catalogs
+        self._postings: dict[str, tuple[array, array]] = {}
+        for term, postings in frequencies.items():
+            idf = math.log(1 + (len(docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+            self._postings[term] = (
+                array("i", (doc_id for doc_id, _, _ in postings)),
+                array("f", (
+                    idf * count * (k1 + 1)
+                    / (count + k1 * (1 - b + b * length / average_length))
+                    for _, count, length in postings
+                )),
+            )
+
+        self._terms = sorted(self._postings)
+        self._gram_counts = {term: len(trigrams(term)) for term in self._postings}
+        self._grams: dict[str, list[str]] = defaultdict(list)
+        for term in self._postings:
+            for gram in trigrams(term):
+                self._grams[gram].append(term)
+
+    def similar_terms(self, token: str) -> list[tuple[str, float]]:
+        """Vocabulary terms similar to ``token``, most similar first."""
+        grams = trigrams(token)
+        shared = Counter(term for gram in grams for term in self._grams.get(gram, ()))
+        similarity = {
+            term: count / (len(grams) + self._gram_counts[term] - count)
+            for term, count in shared.items()
+        }
+        if len(token) >= MIN_PREFIX_LENGTH:
+            for term in _prefix_range(self._terms, token):
+                similarity[term] = max(similarity.get(term, 0.0), FUZZY_THRESHOLD)
+        similar = ((score, term) for term, score in similarity.items())
+        return [
+            (term, similarity)
+            for similarity, term in heapq.nlargest(MAX_EXPANSIONS, similar)
+            if similarity >= FUZZY_THRESHOLD
+        ]
+
+    def score(self, tokens: list[str], scores: dict[int, float], weight: float = 1.0) -> None:
+        """Add the weighted BM25 score of ``tokens`` for each matching document to ``scores``."""
+        for token in set(tokens):
+            for term, similarity in self.similar_terms(token):
+                doc_ids, weights = self._postings[term]
+                factor = weight * similarity
+                for doc_id, term_weight in zip(doc_ids, weights, strict=True):
+                    scores[doc_id] = scores.get(doc_id, 0.0) + term_weight * factor
+
+
+class PrefixIndex:
+    """Sorted distinct names for autocomplete, matched case-insensitively."""
+
+    def __init__(self, names: Iterable[str]):
+        by_key: dict[str, set[str]] = defaultdict(set)
+        for name in names:
+            by_key[name.lower()].add(name)
+        self._names = by_key
+        self._sorted = sorted(by_key)
+
+    def complete(self, prefix: str, limit: int) -> list[str]:
+        """The first ``limit`` names, in sorted order, starting with ``prefix``."""
+        matches = (
+            name for key in _prefix_range(self._sorted, prefix) for name in self._names[key]
+        )
+        return heapq.nsmallest(limit, matches)
+
+
+def _prefix_range(keys: list[str], prefix: str) -> Iterator[str]:
+    """Keys of a sorted list starting with ``prefix``."""
+    for i in range(bisect_left(keys, prefix), len(keys)):
+        if not keys[i].startswith(prefix):
+            break
+        yield keys[i]
+
+
+class SearchIndex:
+    """
+    Search structures built once per dictionary snapshot.
+
+    Fields and datasets are identified by their position in the snapshot's
+    lists. Names are indexed for exact, prefix and substring matches, and
+    names, descriptions, datasets and tags for ranked search. Fields are
+    grouped by data type, PII flag and team, and datasets by team, so
+    filters are set lookups.
+    """
+
+    def __init__(self, dictionary: dict[str, Any]):
+        self.fields: list[dict[str, Any]] = dictionary["fields"]
+        self.datasets: list[dict[str, Any]] = dictionary["datasets"]
+
+        fields = list(enumerate(self.fields))
+        self.field_names = SubstringIndex((i, f["name"].lower()) for i, f in fields)
+        self.field_text = {
+            "name": RankedIndex((i, tokenize(f["name"])) for i, f in fields),
+            "description": RankedIndex(
+                (i, tokenize(f.get("description") or "")) for i, f in fields
+            ),
+            "dataset": RankedIndex((i, tokenize(f.get("dataset", ""))) for i, f in fields),
+        }
+
+        datasets = list(enumerate(self.datasets))
+        self.dataset_names = SubstringIndex((i, d["name"].lower()) for i, d in datasets)
+        self.dataset_text = {
+            "name": RankedIndex((i, tokenize(d["name"])) for i, d in datasets),
+            "description": RankedIndex(
+                (i, tokenize(d.get("description") or "")) for i, d in datasets
+            ),
+            "tags": RankedIndex(
+                (i, [t for tag in d.get("tags", []) for t in tokenize(tag)]) for i, d in datasets
+            ),
+        }
+
+        self.fields_by_type = _group(fields, lambda f: f.get("data_type"))
+        self.fields_by_pii = _group(fields, lambda f: bool(f.get("is_pii")))
+        self.fields_by_team = _group(fields, lambda f: f.get("publisher_team"))
+        self.datasets_by_team = _group(datasets, lambda d: d.get("publisher_team"))
+
+        self.field_suggestions = PrefixIndex(f["name"] for f in self.fields)
+        self.dataset_suggestions = PrefixIndex(d["name"] for d in self.datasets)
+        self.team_suggestions = PrefixIndex(dictionary["teams"])
+
+    def field_filter(
+        self,
+        data_type: str | None = None,
+        is_pii: bool | None = None,
+        team: str | None = None,
+    ) -> frozenset[int] | None:
+        """Fields passing all given filters, or ``None`` if there are none."""
+        groups = []
+        if data_type:
+            groups.append(self.fields_by_type.get(data_type, frozenset()))
+        if is_pii is not None:
+            groups.append(self.fields_by_pii.get(is_pii, frozenset()))
+        if team:
+            groups.append(self.fields_by_team.get(team, frozenset()))
+        if not groups:
+            return None
+        groups.sort(key=len)
+        return groups[0].intersection(*groups[1:])
+
+    def dataset_filter(self, team: str | None = None) -> frozenset[int] | None:
+        """Datasets passing the team filter, or ``None`` without one."""
+        if not team:
+            return None
+        return self.datasets_by_team.get(team, frozenset())
+
+
+def _group(items: list[tuple[int, dict[str, Any]]], key: Any) -> dict[Any, frozenset[int]]:
+    groups: dict[Any, set[int]] = defaultdict(set)
+    for i, item in items:
+        groups[key(item)].add(i)
+    return {k: frozenset(v) for k, v in groups.items()}
@@ -1,9 +1,17 @@
 """Search service for data dictionary."""
 
+import heapq
+from itertools import chain
 from typing import Any
 from enum import Enum
 
 from dictionary_service.services.aggregator import DictionaryAggregator
+from dictionary_service.services.search_index import (
+    RankedIndex,
+    SearchIndex,
+    SubstringIndex,
+    tokenize,
+)
 
 
 class SearchScope(str, Enum):
@@ -15,6 +23,24 @@ class SearchScope(str, Enum):
     DESCRIPTIONS = "descriptions"
 
 
+# Weight of each text's BM25 score, by scope
+FIELD_WEIGHTS = {
+    SearchScope.ALL: {"name": 2.0, "description": 1.0, "dataset": 0.5},
+    SearchScope.FIELDS: {"name": 2.0},
+    SearchScope.DESCRIPTIONS: {"description": 1.0},
+}
+DATASET_WEIGHTS = {
+    SearchScope.ALL: {"name": 2.0, "description": 1.0, "tags": 1.0},
+    SearchScope.DATASETS: {"name": 2.0},
+    SearchScope.DESCRIPTIONS: {"description": 1.0},
+}
+
+# Added to the BM25 score when the whole name matches the query
+EXACT_NAME_BOOST = 10.0
+PREFIX_NAME_BOOST = 5.0
+SUBSTRING_NAME_BOOST = 2.0
+
+
 class SearchService:
     """Search functionality across all contracts in the data dictionary."""
 
@@ -47,16 +73,16 @@ class SearchService:
         Returns:
             Search results with matched items
         """
-        dictionary = await self.aggregator.get_full_dictionary()
+        index = (await self.aggregator.get_snapshot()).search_index
         query_lower = query.lower().strip()
 
-        field_results = []
-        dataset_results = []
+        field_results: dict[int, float] = {}
+        dataset_results: dict[int, float] = {}
 
         # Search fields
         if scope in (SearchScope.ALL, SearchScope.FIELDS, SearchScope.DESCRIPTIONS):
             field_results = self._search_fields(
-                dictionary["fields"],
+                index,
                 query_lower,
                 scope,
                 data_type,
@@ -67,35 +93,32 @@ class SearchService:
         # Search datasets
         if scope in (SearchScope.ALL, SearchScope.DATASETS, SearchScope.DESCRIPTIONS):
             dataset_results = self._search_datasets(
-                dictionary["datasets"],
+                index,
                 query_lower,
                 scope,
                 team,
             )
 
-        # Combine and sort results by relevance
-        all_results = []
-
-        for field in field_results:
-            all_results.append({
-                "type": "field",
-                "relevance": field.pop("_relevance", 0),
-                "data": field,
-            })
-
-        for dataset in dataset_results:
-            all_results.append({
-                "type": "dataset",
-                "relevance": dataset.pop("_relevance", 0),
-                "data": dataset,
-            })
-
-        # Sort by relevance (higher is better)
-        all_results.sort(key=lambda x: x["relevance"], reverse=True)
+        # Select the requested page by relevance (higher is better), fields first on
+        # ties, without sorting every match
+        ranked = heapq.nsmallest(
+            offset + limit,
+            chain(
+                ((-relevance, 0, i) for i, relevance in field_results.items()),
+                ((-relevance, 1, i) for i, relevance in dataset_results.items()),
+            ),
+        )
 
         # Apply pagination
-        total = len(all_results)
-        paginated = all_results[offset : offset + limit]
+        total = len(field_results) + len(dataset_results)
+        paginated = [
+            {
+                "type": "field" if kind == 0 else "dataset",
+                "relevance": round(-relevance, 3),
+                "data": index.fields[i] if kind == 0 else index.datasets[i],
+            }
+            for relevance, kind, i in ranked[offset:]
+        ]
 
         return {
             "query": query,
@@ -113,101 +136,49 @@ class SearchService:
 
     def _search_fields(
         self,
-        fields: list[dict[str, Any]],
+        index: SearchIndex,
         query: str,
         scope: SearchScope,
         data_type: str | None,
         is_pii: bool | None,
         team: str | None,
-    ) -> list[dict[str, Any]]:
-        """Search through fields."""
-        results = []
-
-        for field in fields:
-            relevance = 0
-
-            # Apply filters first
-            if data_type and field.get("data_type") != data_type:
-                continue
-            if is_pii is not None and field.get("is_pii") != is_pii:
-                continue
-            if team and field.get("publisher_team") != team:
-                continue
-
-            # Calculate relevance score
-            name_lower = field["name"].lower()
-            desc_lower = (field.get("description") or "").lower()
-            dataset_lower = field.get("dataset", "").lower()
-
-            # Exact name match - highest score
-            if query == name_lower:
-                relevance = 100
-            # Name starts with query
-            elif name_lower.startswith(query):
-                relevance = 80
-            # Query in name
-            elif scope in (SearchScope.ALL, SearchScope.FIELDS) and query in name_lower:
-                relevance = 60
-            # Query in description
-            elif scope in (SearchScope.ALL, SearchScope.DESCRIPTIONS) and query in desc_lower:
-                relevance = 40
-            # Query in dataset name
-            elif scope == SearchScope.ALL and query in dataset_lower:
-                relevance = 20
-            else:
-                continue
-
-            result = field.copy()
-            result["_relevance"] = relevance
-            results.append(result)
-
-        return results
+    ) -> dict[int, float]:
+        """Search through fields; returns relevance by field index."""
+        relevance = _rank(
+            index.field_names,
+            index.field_text,
+            FIELD_WEIGHTS[scope],
+            query,
+            match_substring=scope in (SearchScope.ALL, SearchScope.FIELDS),
+        )
+
+        # Apply filters
+        allowed = index.field_filter(data_type=data_type, is_pii=is_pii, team=team)
+        if allowed is not None:
+            relevance = {i: relevance[i] for i in relevance.keys() & allowed}
+        return relevance
 
     def _search_datasets(
         self,
-        datasets: list[dict[str, Any]],
+        index: SearchIndex,
         query: str,
         scope: SearchScope,
         team: str | None,
-    ) -> list[dict[str, Any]]:
-        """Search through datasets."""
-        results = []
-
-        for dataset in datasets:
-            relevance = 0
-
-            # Apply team filter
-            if team and dataset.get("publisher_team") != team:
-                continue
-
-            name_lower = dataset["name"].lower()
-            desc_lower = (dataset.get("description") or "").lower()
-
-            # Exact name match
-            if query == name_lower:
-                relevance = 100
-            # Name starts with query
-            elif name_lower.startswith(query):
-                relevance = 80
-            # Query in name
-            elif scope in (SearchScope.ALL, SearchScope.DATASETS) and query in name_lower:
-                relevance = 60
-            # Query in description
-            elif scope in (SearchScope.ALL, SearchScope.DESCRIPTIONS) and query in desc_lower:
-                relevance = 40
-            # Query in tags
-            elif scope == SearchScope.ALL and any(
-                query in tag.lower() for tag in dataset.get("tags", [])
-            ):
-                relevance = 30
-            else:
-                continue
-
-            result = dataset.copy()
-            result["_relevance"] = relevance
-            results.append(result)
-
-        return results
+    ) -> dict[int, float]:
+        """Search through datasets; returns relevance by dataset index."""
+        relevance = _rank(
+            index.dataset_names,
+            index.dataset_text,
+            DATASET_WEIGHTS[scope],
+            query,
+            match_substring=scope in (SearchScope.ALL, SearchScope.DATASETS),
+        )
+
+        # Apply team filter
+        allowed = index.dataset_filter(team=team)
+        if allowed is not None:
+            relevance = {i: relevance[i] for i in relevance.keys() & allowed}
+        return relevance
 
     async def suggest(self, prefix: str, limit: int = 10) -> dict[str, Any]:
         """
@@ -220,33 +191,15 @@ class SearchService:
         Returns:
             Suggestions grouped by type
         """
-        dictionary = await self.aggregator.get_full_dictionary()
+        index = (await self.aggregator.get_snapshot()).search_index
         prefix_lower = prefix.lower().strip()
 
-        # Collect matching field names
-        field_names = set()
-        for field in dictionary["fields"]:
-            if field["name"].lower().startswith(prefix_lower):
-                field_names.add(field["name"])
-
-        # Collect matching dataset names
-        dataset_names = set()
-        for dataset in dictionary["datasets"]:
-            if dataset["name"].lower().startswith(prefix_lower):
-                dataset_names.add(dataset["name"])
-
-        # Collect matching team names
-        team_names = set()
-        for team in dictionary["teams"]:
-            if team.lower().startswith(prefix_lower):
-                team_names.add(team)
-
         return {
             "prefix": prefix,
             "suggestions": {
-                "fields": sorted(field_names)[:limit],
-                "datasets": sorted(dataset_names)[:limit],
-                "teams": sorted(team_names)[:limit],
+                "fields": index.field_suggestions.complete(prefix_lower, limit),
+                "datasets": index.dataset_suggestions.complete(prefix_lower, limit),
+                "teams": index.team_suggestions.complete(prefix_lower, limit),
             },
         }
 
@@ -279,10 +232,36 @@ class SearchService:
         Returns:
             List of fields with the specified type
         """
-        dictionary = await self.aggregator.get_full_dictionary()
-
-        return [
-            field
-            for field in dictionary["fields"]
-            if field.get("data_type") == data_type
-        ]
+        index = (await self.aggregator.get_snapshot()).search_index
+
+        return [index.fields[i] for i in sorted(index.fields_by_type.get(data_type, ()))]
+
+
+def _rank(
+    names: SubstringIndex,
+    texts: dict[str, RankedIndex],
+    weights: dict[str, float],
+    query: str,
+    match_substring: bool,
+) -> dict[int, float]:
+    """
+    Relevance of every matching document.
+
+    The weighted BM25 scores of the document's texts, plus a boost when its
+    whole name equals, starts with or contains the query. Exact and prefix
+    name matches count in any scope.
+    """
+    terms = tokenize(query)
+    scores: dict[int, float] = {}
+    for text, weight in weights.items():
+        texts[text].score(terms, scores, weight)
+
+    # Lower boosts first, so each document gets its best one
+    boosts: dict[int, float] = {}
+    if match_substring:
+        boosts.update(dict.fromkeys(names.containing(query), SUBSTRING_NAME_BOOST))
+    boosts.update(dict.fromkeys(names.prefixed(query), PREFIX_NAME_BOOST))
+    boosts.update(dict.fromkeys(names.exact(query), EXACT_NAME_BOOST))
+    for i, boost in boosts.items():
+        scores[i] = scores.get(i, 0.0) + boost
+    return scores
@@ -0,0 +1,113 @@
+"""Process-wide data dictionary snapshot cache."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from dictionary_service.config import settings
+from dictionary_service.services.dictionary_graph import DictionaryGraph
+from dictionary_service.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DictionarySnapshot:
+    """
+    A data dictionary built at one point in time, with the subscriptions
+    to its datasets.
+
+    Snapshots are shared by all requests and must be treated as read-only.
+    """
+
+    dictionary: dict[str, Any]
+    subscriptions: list[dict[str, Any]] = field(default_factory=list)
+    built_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+    @cached_property
+    def search_index(self) -> SearchIndex:
+        """Search index over the snapshot, built on first use."""
+        return SearchIndex(self.dictionary)
+
+    @cached_property
+    def graph(self) -> DictionaryGraph:
+        """Field, relationship and subscription adjacency maps, built on first use."""
+        return DictionaryGraph(self.dictionary, self.subscriptions)
+
+
+class SnapshotCache:
+    """
+    Holds the current dictionary snapshot and rebuilds it when it expires.
+
+    Concurrent requests share a single in-flight rebuild. Once the snapshot
+    is older than the TTL it is still served while a background refresh
+    runs; only a snapshot older than the TTL plus ``max_stale_seconds``, or
+    none at all, makes requests wait for the rebuild.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[DictionarySnapshot]],
+        ttl_seconds: float | None = None,
+        max_stale_seconds: float | None = None,
+    ):
+        self.loader = loader
+        self.ttl_seconds = settings.cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_stale_seconds = (
+            settings.cache_max_stale_seconds if max_stale_seconds is None else max_stale_seconds
+        )
+        self._snapshot: DictionarySnapshot | None = None
+        self._refresh: asyncio.Task | None = None
+
+    async def get(self) -> DictionarySnapshot:
+        """The current snapshot, rebuilding or refreshing it as needed."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            if snapshot.age < self.ttl_seconds:
+                return snapshot
+            if snapshot.age < self.ttl_seconds + self.max_stale_seconds:
+                self._start_refresh()
+                return snapshot
+
+        # Shielded so a cancelled request does not cancel the shared rebuild
+        return await asyncio.shield(self._start_refresh())
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next request rebuilds it."""
+        self._snapshot = None
+
+    async def close(self) -> None:
+        """Cancel a running refresh; called on application shutdown."""
+        if self._refresh is not None:
+            self._refresh.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._refresh
+            self._refresh = None
+
+    def _start_refresh(self) -> asyncio.Task:
+        """The in-flight rebuild, starting one if none is running."""
+        if self._refresh is None:
+            self._refresh = asyncio.create_task(self._rebuild())
+            # Background refresh failures are logged; the stale snapshot stays
+            self._refresh.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return self._refresh
+
+    async def _rebuild(self) -> DictionarySnapshot:
+        try:
+            snapshot = await self.loader()
+        except Exception as e:
+            logger.error(f"Failed to rebuild data dictionary: {e}")
+            raise
+        finally:
+            self._refresh = None
+        self._snapshot = snapshot
+        return snapshot
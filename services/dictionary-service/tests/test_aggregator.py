@@ -52,6 +52,26 @@ class TestDictionaryAggregator:
         finally:
             await aggregator.close()
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_subscriptions_kept_out_of_dictionary(self, sample_contracts_response):
+        """Test that subscriptions reach the snapshot graph but not the API payload."""
+        respx.get(f"{settings.contract_service_url}/api/v1/contracts").mock(
+            return_value=httpx.Response(200, json=sample_contracts_response)
+        )
+
+        aggregator = DictionaryAggregator()
+        try:
+            snapshot = await aggregator.get_snapshot()
+
+            assert "subscriptions" not in snapshot.dictionary
+            assert [s["team"] for s in snapshot.graph.subscribers_of("orders")] == [
+                "analytics",
+                "marketing",
+            ]
+        finally:
+            await aggregator.close()
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_dataset_details(self, sample_contracts_response):
@@ -146,3 +166,30 @@ class TestDictionaryAggregator:
             assert "error" in lineage
         finally:
             await aggregator.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_field_lineage_uses_graph(self, sample_contracts_response):
+        """Test field lineage across foreign keys and same-named fields."""
+        respx.get(f"{settings.contract_service_url}/api/v1/contracts").mock(
+            return_value=httpx.Response(200, json=sample_contracts_response)
+        )
+
+        aggregator = DictionaryAggregator()
+        try:
+            lineage = await aggregator.get_field_lineage("customers", "customer_id")
+
+            assert lineage["field"]["dataset"] == "customers"
+            assert lineage["upstream"] == []
+            assert lineage["downstream"] == [
+                {"dataset": "orders", "field": "customer_id", "relationship": "referenced_by"}
+            ]
+            assert [f["dataset"] for f in lineage["similar_fields"]] == ["orders"]
+
+            lineage = await aggregator.get_field_lineage("orders", "customer_id")
+            assert lineage["upstream"][0]["dataset"] == "customers"
+
+            missing = await aggregator.get_field_lineage("orders", "missing")
+            assert missing == {"error": "Field not found"}
+        finally:
+            await aggregator.close()
@@ -0,0 +1,45 @@
+"""Tests for the dictionary adjacency maps."""
+
+from dictionary_service.services.dictionary_graph import DictionaryGraph
+
+
+def test_fields_grouped_by_dataset_and_name(sample_dictionary):
+    """Test that the groups keep the dictionary's own field order."""
+    graph = DictionaryGraph(sample_dictionary)
+
+    assert [f["name"] for f in graph.dataset_fields("customers")] == [
+        "customer_id",
+        "email",
+        "name",
+        "created_at",
+    ]
+    assert graph.dataset_fields("missing") == []
+    assert [f["dataset"] for f in graph.fields_named("customer_id")] == ["orders", "customers"]
+    assert graph.field("orders", "total")["data_type"] == "decimal"
+    assert graph.field("customers", "total") is None
+
+
+def test_relationship_adjacency(sample_dictionary):
+    """Test outbound references by dataset and inbound ones by field."""
+    graph = DictionaryGraph(sample_dictionary)
+    relationship = sample_dictionary["relationships"][0]
+
+    assert graph.references_from("orders") == [relationship]
+    assert graph.references_from("customers") == []
+    assert graph.references_to("customers", "customer_id") == [relationship]
+    assert graph.references_to("orders", "customer_id") == []
+    # Lookups of unknown keys do not add entries
+    assert "customers" not in graph.outbound
+
+
+def test_subscriptions_and_team_datasets(sample_dictionary):
+    """Test subscriptions by dataset and datasets by publishing team."""
+    subscriptions = [
+        {"dataset": "customers", "team": "commerce", "use_case": None, "fields_used": []},
+    ]
+    graph = DictionaryGraph(sample_dictionary, subscriptions)
+
+    assert [s["team"] for s in graph.subscribers_of("customers")] == ["commerce"]
+    assert graph.subscribers_of("orders") == []
+    assert [d["name"] for d in graph.team_datasets("commerce")] == ["orders"]
+    assert graph.team_datasets(None) == []
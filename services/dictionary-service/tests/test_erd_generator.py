@@ -72,12 +72,6 @@ class TestERDGenerator:
             return_value=httpx.Response(200, json=sample_contracts_response)
         )
 
-        # Mock individual contract details for subscriber lookup
-        for contract in sample_contracts_response["contracts"]:
-            respx.get(
-                f"{settings.contract_service_url}/api/v1/contracts/name/{contract['name']}"
-            ).mock(return_value=httpx.Response(200, json=contract))
-
         aggregator = DictionaryAggregator()
         try:
             erd_generator = ERDGenerator(aggregator)
@@ -102,6 +96,12 @@ class TestERDGenerator:
             orders_node = next(n for n in erd_json["nodes"] if n["id"] == "orders")
             assert orders_node["publisher_team"] == "commerce"
             assert len(orders_node["fields"]) == 4
+
+            # Subscription edges come from the listing, without per-dataset requests
+            sub_edges = [e for e in erd_json["edges"] if e["type"] == "subscription"]
+            assert [(e["source"], e["target"]) for e in sub_edges] == [("orders", "customers")]
+            assert sub_edges[0]["use_case"] == "Order processing"
+            assert len(respx.calls) == 1
         finally:
             await aggregator.close()
 
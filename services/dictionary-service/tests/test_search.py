@@ -172,3 +172,46 @@ class TestSearchService:
             assert all(f["data_type"] == "uuid" for f in uuid_fields)
         finally:
             await aggregator.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_tolerates_typos(self, sample_contracts_response):
+        """Test that a misspelled query still ranks the intended fields first."""
+        respx.get(f"{settings.contract_service_url}/api/v1/contracts").mock(
+            return_value=httpx.Response(200, json=sample_contracts_response)
+        )
+
+        aggregator = DictionaryAggregator()
+        try:
+            search_service = SearchService(aggregator)
+            results = await search_service.search("custmer_id", limit=2)
+
+            assert results["total"] > 2
+            assert [r["data"]["name"] for r in results["results"]] == [
+                "customer_id",
+                "customer_id",
+            ]
+            relevance = [r["relevance"] for r in results["results"]]
+            assert relevance == sorted(relevance, reverse=True)
+        finally:
+            await aggregator.close()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_search_descriptions_partial_word(self, sample_contracts_response):
+        """Test that a partial word finds descriptions containing the whole word."""
+        respx.get(f"{settings.contract_service_url}/api/v1/contracts").mock(
+            return_value=httpx.Response(200, json=sample_contracts_response)
+        )
+
+        aggregator = DictionaryAggregator()
+        try:
+            search_service = SearchService(aggregator)
+            results = await search_service.search("ident", scope=SearchScope.DESCRIPTIONS)
+
+            assert sorted(r["data"]["description"] for r in results["results"]) == [
+                "Unique customer identifier",
+                "Unique order identifier",
+            ]
+        finally:
+            await aggregator.close()
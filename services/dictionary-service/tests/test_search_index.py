@@ -0,0 +1,114 @@
+"""Tests for the dictionary search index."""
+
+import pytest
+
+from dictionary_service.services.search_index import (
+    PrefixIndex,
+    RankedIndex,
+    SearchIndex,
+    SubstringIndex,
+    tokenize,
+)
+
+WORDS = ["customer_id", "customer_email", "email", "order_id", "total", "created_at", ""]
+
+
+class TestSubstringIndex:
+    @pytest.mark.parametrize("query", ["", "e", "id", "ema", "email", "customer_", "tomer_e", "zz"])
+    def test_matches_linear_scan(self, query):
+        """Test that every lookup agrees with scanning the texts."""
+        index = SubstringIndex(enumerate(WORDS))
+
+        assert sorted(index.containing(query)) == [
+            i for i, w in enumerate(WORDS) if w and query in w
+        ]
+        assert sorted(index.prefixed(query)) == [
+            i for i, w in enumerate(WORDS) if w and w.startswith(query)
+        ]
+        assert index.exact(query) == [i for i, w in enumerate(WORDS) if w and w == query]
+
+    def test_shared_texts(self):
+        """Test that documents with the same text are all returned."""
+        index = SubstringIndex([(0, "customer_id"), (1, "order_id"), (2, "customer_id")])
+
+        assert index.exact("customer_id") == [0, 2]
+        assert sorted(index.containing("tomer")) == [0, 2]
+
+
+def test_prefix_index_limit_and_order():
+    """Test that completions are sorted, case-insensitive and limited."""
+    index = PrefixIndex(["customers", "Customer_ID", "orders", "customer_email", "customers"])
+
+    assert index.complete("cust", 10) == ["Customer_ID", "customer_email", "customers"]
+    assert index.complete("cust", 2) == ["Customer_ID", "customer_email"]
+    assert index.complete("x", 10) == []
+
+
+class TestSearchIndex:
+    def test_filters(self, sample_dictionary):
+        """Test that filters intersect the field groups."""
+        index = SearchIndex(sample_dictionary)
+
+        assert index.field_filter() is None
+        pii_strings = index.field_filter(data_type="string", is_pii=True)
+        assert sorted(index.fields[i]["name"] for i in pii_strings) == [
+            "customer_email",
+            "email",
+            "name",
+        ]
+        assert index.field_filter(data_type="boolean") == frozenset()
+        assert [index.datasets[i]["name"] for i in index.dataset_filter(team="crm")] == [
+            "customers"
+        ]
+
+    def test_tags_indexed(self, sample_dictionary):
+        """Test that datasets are ranked by any of their tags."""
+        index = SearchIndex(sample_dictionary)
+        scores: dict[int, float] = {}
+        index.dataset_text["tags"].score(["master"], scores)
+
+        assert [index.datasets[i]["name"] for i in scores] == ["customers"]
+
+
+class TestRankedIndex:
+    def test_rare_terms_rank_higher(self):
+        """Test that BM25 weighs a rare term above a common one."""
+        index = RankedIndex(
+            (i, tokenize(name))
+            for i, name in enumerate(["order_id", "customer_id", "refund_id", "refund_reason"])
+        )
+        scores: dict[int, float] = {}
+        index.score(tokenize("customer_id"), scores)
+
+        assert max(scores, key=scores.get) == 1
+        assert 3 not in scores
+        assert scores[0] == scores[2] < scores[1]
+
+    def test_typos_match_similar_terms(self):
+        """Test that misspelled and plural terms still match."""
+        index = RankedIndex([(0, ["customer", "id"]), (1, ["customers"]), (2, ["order", "id"])])
+
+        assert [term for term, _ in index.similar_terms("custmer")] == ["customer"]
+        assert [term for term, _ in index.similar_terms("customer")] == ["customer", "customers"]
+        assert index.similar_terms("zzz") == []
+
+        scores: dict[int, float] = {}
+        index.score(["custmer", "id"], scores)
+        assert sorted(scores, key=scores.get, reverse=True) == [0, 2]
+
+    def test_partial_words_match_longer_terms(self):
+        """Test that a partial word finds the words it starts."""
+        index = RankedIndex([(0, ["customer", "email"]), (1, ["order", "total"])])
+
+        assert [term for term, _ in index.similar_terms("cust")] == ["customer"]
+        assert index.similar_terms("cu") == []
+
+        scores: dict[int, float] = {}
+        index.score(["cust"], scores)
+        assert list(scores) == [0]
+
+
+def test_tokenize_identifiers():
+    """Test that identifiers are split into lowercase words."""
+    assert tokenize("customer_id") == ["customer", "id"]
+    assert tokenize("createdAt HTTPServer v2") == ["created", "at", "http", "server", "v", "2"]
@@ -0,0 +1,86 @@
+"""Tests for the dictionary snapshot cache."""
+
+import asyncio
+
+import pytest
+
+from dictionary_service.services.snapshot import DictionarySnapshot, SnapshotCache
+
+
+class CountingLoader:
+    """Loader returning numbered snapshots, optionally blocking until released."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = False
+
+    async def __call__(self) -> DictionarySnapshot:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("contract service unavailable")
+        return DictionarySnapshot({"version": self.calls})
+
+
+class TestSnapshotCache:
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_served_from_memory(self):
+        """Test that a snapshot within the TTL is not rebuilt."""
+        loader = CountingLoader()
+        cache = SnapshotCache(loader, ttl_seconds=60, max_stale_seconds=60)
+
+        first = await cache.get()
+        second = await cache.get()
+
+        assert first is second
+        assert loader.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_build(self):
+        """Test that concurrent cold requests wait on a single rebuild."""
+        loader = CountingLoader()
+        loader.release.clear()
+        cache = SnapshotCache(loader, ttl_seconds=60, max_stale_seconds=60)
+
+        waiters = [asyncio.create_task(cache.get()) for _ in range(10)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        snapshots = await asyncio.gather(*waiters)
+
+        assert loader.calls == 1
+        assert all(s is snapshots[0] for s in snapshots)
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_refreshing(self):
+        """Test stale-while-revalidate, including a failing refresh."""
+        loader = CountingLoader()
+        cache = SnapshotCache(loader, ttl_seconds=0, max_stale_seconds=60)
+        first = await cache.get()
+
+        loader.release.clear()
+        assert await cache.get() is first
+        assert await cache.get() is first
+        loader.release.set()
+        await asyncio.sleep(0)
+        assert loader.calls == 2
+        assert (await cache.get()).dictionary == {"version": 2}
+
+        # A failed refresh keeps the stale snapshot
+        loader.fail = True
+        await asyncio.sleep(0)
+        assert (await cache.get()).dictionary == {"version": 2}
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_rebuilt_inline(self):
+        """Test that a snapshot past the stale window is not served."""
+        loader = CountingLoader()
+        cache = SnapshotCache(loader, ttl_seconds=0, max_stale_seconds=0)
+
+        await cache.get()
+        assert (await cache.get()).dictionary == {"version": 2}
+
+        loader.fail = True
+        with pytest.raises(RuntimeError):
+            await cache.get()